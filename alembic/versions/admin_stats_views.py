@@ -0,0 +1,73 @@
+"""admin_stats_views - materialized views behind /stats/admin/stats
+
+Revision ID: admin_stats_views
+Revises: stat_counters
+Create Date: 2026-10-17
+
+CAMBIOS:
+1. admin_user_stats, admin_contact_stats, admin_survey_stats - vistas
+   materializadas de una fila con los agregados del panel de admin y la hora
+   del último refresh (refreshed_at)
+2. Índice único sobre id en cada vista, necesario para
+   REFRESH MATERIALIZED VIEW CONCURRENTLY (las lecturas no se bloquean)
+"""
+from typing import Sequence, Union
+from alembic import op
+
+revision: str = 'admin_stats_views'
+down_revision: Union[str, Sequence[str], None] = 'stat_counters'
+branch_labels = None
+depends_on = None
+
+VIEWS = {
+    'admin_user_stats': """
+        SELECT
+            1 AS id,
+            count(*) AS total_users,
+            count(*) FILTER (WHERE email IS NOT NULL) AS users_with_email,
+            count(*) FILTER (WHERE is_active) AS active_users,
+            count(*) FILTER (WHERE accepts_marketing) AS marketing_subscribers,
+            now() AS refreshed_at
+        FROM users
+    """,
+    'admin_contact_stats': """
+        SELECT
+            1 AS id,
+            count(*) AS total_messages,
+            count(*) FILTER (WHERE NOT is_read) AS unread_messages,
+            count(*) FILTER (WHERE "timestamp" >= now() - interval '7 days') AS messages_last_7_days,
+            now() AS refreshed_at
+        FROM contacts
+    """,
+    'admin_survey_stats': """
+        SELECT
+            1 AS id,
+            count(*) AS total_responses,
+            round(avg(trust_traditional), 2) AS trust_traditional,
+            round(avg(blockchain_familiarity), 2) AS blockchain_familiarity,
+            round(avg(retirement_concern), 2) AS retirement_concern,
+            round(avg(has_retirement_plan), 2) AS has_retirement_plan,
+            round(avg(values_in_retirement), 2) AS values_in_retirement,
+            round(avg(interested_in_blockchain), 2) AS interested_in_blockchain,
+            count(*) FILTER (WHERE interested_in_blockchain >= 1) AS high_interest,
+            count(*) FILTER (WHERE interested_in_blockchain = 0) AS moderate_interest,
+            count(*) FILTER (WHERE interested_in_blockchain < 0) AS low_interest,
+            (
+                SELECT coalesce(jsonb_object_agg(age, responses), '{}'::jsonb)
+                FROM (SELECT age, count(*) AS responses FROM surveys GROUP BY age) ages
+            ) AS age_distribution,
+            now() AS refreshed_at
+        FROM surveys
+    """,
+}
+
+
+def upgrade() -> None:
+    for name, query in VIEWS.items():
+        op.execute(f"CREATE MATERIALIZED VIEW {name} AS {query}")
+        op.execute(f"CREATE UNIQUE INDEX uq_{name}_id ON {name} (id)")
+
+
+def downgrade() -> None:
+    for name in reversed(list(VIEWS)):
+        op.execute(f"DROP MATERIALIZED VIEW IF EXISTS {name}")
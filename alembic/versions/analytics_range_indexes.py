@@ -0,0 +1,32 @@
+"""analytics_range_indexes - block-time indexes for daily analytics totals
+
+Revision ID: analytics_range_indexes
+Revises: blockchain_events_partitioning
+Create Date: 2026-10-17
+
+CAMBIOS:
+1. fund_transactions - idx_fund_transactions_block_time (block_timestamp,
+   transaction_type): los totales diarios de depósitos, retiros y fees del
+   snapshot se leen con un range scan sobre el día
+2. votes - idx_vote_block_time (block_timestamp): votos emitidos en el día
+"""
+from typing import Sequence, Union
+from alembic import op
+
+revision: str = 'analytics_range_indexes'
+down_revision: Union[str, Sequence[str], None] = 'blockchain_events_partitioning'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'idx_fund_transactions_block_time', 'fund_transactions',
+        ['block_timestamp', 'transaction_type'], unique=False
+    )
+    op.create_index('idx_vote_block_time', 'votes', ['block_timestamp'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('idx_vote_block_time', table_name='votes')
+    op.drop_index('idx_fund_transactions_block_time', table_name='fund_transactions')
@@ -0,0 +1,44 @@
+"""backfill_shards - checkpoints for parallel historical sync
+
+Revision ID: backfill_shards
+Revises: fix_schema_sync
+Create Date: 2026-10-17
+
+CAMBIOS:
+1. backfill_shards - un registro por shard [from_block, to_block] con el
+   último bloque ingerido (checkpoint_block) para reanudar re-indexados
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = 'backfill_shards'
+down_revision: Union[str, Sequence[str], None] = 'fix_schema_sync'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'backfill_shards',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('from_block', sa.Integer(), nullable=False),
+        sa.Column('to_block', sa.Integer(), nullable=False),
+        sa.Column('checkpoint_block', sa.Integer(), nullable=True),
+        sa.Column('status', sa.String(20), server_default='pending', nullable=False),
+        sa.Column('events_inserted', sa.Integer(), server_default='0', nullable=False),
+        sa.Column('attempts', sa.Integer(), server_default='0', nullable=False),
+        sa.Column('last_error', sa.Text(), nullable=True),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('from_block', 'to_block', name='uq_backfill_shard_range'),
+    )
+    op.create_index(op.f('ix_backfill_shards_id'), 'backfill_shards', ['id'], unique=False)
+    op.create_index(op.f('ix_backfill_shards_status'), 'backfill_shards', ['status'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_backfill_shards_status'), table_name='backfill_shards')
+    op.drop_index(op.f('ix_backfill_shards_id'), table_name='backfill_shards')
+    op.drop_table('backfill_shards')
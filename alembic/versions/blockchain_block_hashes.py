@@ -0,0 +1,34 @@
+"""blockchain_block_hashes - hash chain of synced windows for reorg detection
+
+Revision ID: blockchain_block_hashes
+Revises: blockchain_sync_state
+Create Date: 2026-10-17
+
+CAMBIOS:
+1. blockchain_block_hashes - hash y parent_hash del último bloque de cada
+   ventana sincronizada; se compara con la cadena para detectar reorgs y
+   encontrar el bloque común donde revertir eventos huérfanos
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = 'blockchain_block_hashes'
+down_revision: Union[str, Sequence[str], None] = 'blockchain_sync_state'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'blockchain_block_hashes',
+        sa.Column('block_number', sa.Integer(), nullable=False),
+        sa.Column('block_hash', sa.String(66), nullable=False),
+        sa.Column('parent_hash', sa.String(66), nullable=True),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+        sa.PrimaryKeyConstraint('block_number'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('blockchain_block_hashes')
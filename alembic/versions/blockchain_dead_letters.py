@@ -0,0 +1,58 @@
+"""blockchain_dead_letters - retry backoff and dead-letter queue for events
+
+Revision ID: blockchain_dead_letters
+Revises: blockchain_block_hashes
+Create Date: 2026-10-17
+
+CAMBIOS:
+1. blockchain_events - attempts, next_attempt_at, last_error: contador de
+   intentos fallidos y reintento con backoff exponencial
+2. blockchain_dead_letters - eventos que superan el máximo de intentos salen
+   de la cola de procesamiento; se pueden revisar y reencolar desde la API
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+revision: str = 'blockchain_dead_letters'
+down_revision: Union[str, Sequence[str], None] = 'blockchain_block_hashes'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column('blockchain_events', sa.Column('attempts', sa.Integer(), server_default='0', nullable=False))
+    op.add_column('blockchain_events', sa.Column('next_attempt_at', sa.DateTime(timezone=True), nullable=True))
+    op.add_column('blockchain_events', sa.Column('last_error', sa.Text(), nullable=True))
+
+    op.create_table(
+        'blockchain_dead_letters',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('event_id', sa.Integer(), nullable=False),
+        sa.Column('event_type', sa.String(100), nullable=False),
+        sa.Column('contract_address', sa.String(42), nullable=False),
+        sa.Column('event_data', postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+        sa.Column('transaction_hash', sa.String(66), nullable=False),
+        sa.Column('block_number', sa.Integer(), nullable=False),
+        sa.Column('block_timestamp', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('log_index', sa.Integer(), nullable=False),
+        sa.Column('attempts', sa.Integer(), nullable=False),
+        sa.Column('last_error', sa.Text(), nullable=True),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('event_id'),
+    )
+    op.create_index(op.f('ix_blockchain_dead_letters_id'), 'blockchain_dead_letters', ['id'], unique=False)
+    op.create_index(op.f('ix_blockchain_dead_letters_event_type'), 'blockchain_dead_letters', ['event_type'], unique=False)
+    op.create_index(op.f('ix_blockchain_dead_letters_block_number'), 'blockchain_dead_letters', ['block_number'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_blockchain_dead_letters_block_number'), table_name='blockchain_dead_letters')
+    op.drop_index(op.f('ix_blockchain_dead_letters_event_type'), table_name='blockchain_dead_letters')
+    op.drop_index(op.f('ix_blockchain_dead_letters_id'), table_name='blockchain_dead_letters')
+    op.drop_table('blockchain_dead_letters')
+    op.drop_column('blockchain_events', 'last_error')
+    op.drop_column('blockchain_events', 'next_attempt_at')
+    op.drop_column('blockchain_events', 'attempts')
@@ -0,0 +1,46 @@
+"""blockchain_event_keys - (transaction_hash, log_index) unique across partitions
+
+Revision ID: blockchain_event_keys
+Revises: blockchain_events_dead_lettered
+Create Date: 2026-10-17
+
+CAMBIOS:
+1. blockchain_event_keys - tabla sin particionar con PK (transaction_hash,
+   log_index); uq_tx_log incluye block_number por el particionado, así que un
+   log reincluido a otra altura tras un reorg se insertaba dos veces. Cada
+   evento reclama su clave antes de insertarse y la libera al borrarse
+2. Se rellena con los eventos existentes (la altura más reciente si un log ya
+   estaba duplicado); las particiones archivadas no se recorren
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = 'blockchain_event_keys'
+down_revision: Union[str, Sequence[str], None] = 'blockchain_events_dead_lettered'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'blockchain_event_keys',
+        sa.Column('transaction_hash', sa.String(length=66), nullable=False),
+        sa.Column('log_index', sa.Integer(), nullable=False),
+        sa.Column('block_number', sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint('transaction_hash', 'log_index')
+    )
+    op.create_index(
+        op.f('ix_blockchain_event_keys_block_number'), 'blockchain_event_keys', ['block_number'], unique=False
+    )
+    op.execute("""
+        INSERT INTO blockchain_event_keys (transaction_hash, log_index, block_number)
+        SELECT DISTINCT ON (transaction_hash, log_index) transaction_hash, log_index, block_number
+        FROM blockchain_events
+        ORDER BY transaction_hash, log_index, block_number DESC
+    """)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_blockchain_event_keys_block_number'), table_name='blockchain_event_keys')
+    op.drop_table('blockchain_event_keys')
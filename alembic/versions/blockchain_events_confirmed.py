@@ -0,0 +1,42 @@
+"""blockchain_events_confirmed - streamed head logs wait for confirmation
+
+Revision ID: blockchain_events_confirmed
+Revises: admin_stats_views
+Create Date: 2026-10-17
+
+CAMBIOS:
+1. blockchain_events.confirmed - los logs recibidos por WebSocket se guardan
+   sin confirmar y no se procesan hasta que la ventana confirmada del poller
+   los vuelve a leer; las filas existentes quedan confirmadas
+2. ix_blockchain_events_pending pasa a cubrir solo eventos confirmados
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = 'blockchain_events_confirmed'
+down_revision: Union[str, Sequence[str], None] = 'admin_stats_views'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        'blockchain_events',
+        sa.Column('confirmed', sa.Boolean(), server_default=sa.text('true'), nullable=False)
+    )
+    op.drop_index('ix_blockchain_events_pending', table_name='blockchain_events')
+    op.create_index(
+        'ix_blockchain_events_pending', 'blockchain_events', ['block_number', 'log_index'],
+        postgresql_where=sa.text('processed = false AND confirmed')
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_blockchain_events_pending', table_name='blockchain_events')
+    op.execute("DELETE FROM blockchain_events WHERE NOT confirmed")
+    op.drop_column('blockchain_events', 'confirmed')
+    op.create_index(
+        'ix_blockchain_events_pending', 'blockchain_events', ['block_number', 'log_index'],
+        postgresql_where=sa.text('processed = false')
+    )
@@ -0,0 +1,42 @@
+"""blockchain_events_dead_lettered - dead-lettered events stay as tombstones
+
+Revision ID: blockchain_events_dead_lettered
+Revises: fund_transactions_log_index
+Create Date: 2026-10-17
+
+CAMBIOS:
+1. blockchain_events.dead_lettered - un evento que agota sus reintentos se
+   copia a blockchain_dead_letters pero su fila se conserva marcada, así un
+   nuevo escaneo del bloque no lo vuelve a insertar como evento nuevo
+2. ix_blockchain_events_pending excluye los eventos en dead letter
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = 'blockchain_events_dead_lettered'
+down_revision: Union[str, Sequence[str], None] = 'fund_transactions_log_index'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        'blockchain_events',
+        sa.Column('dead_lettered', sa.Boolean(), server_default=sa.text('false'), nullable=False)
+    )
+    op.drop_index('ix_blockchain_events_pending', table_name='blockchain_events')
+    op.create_index(
+        'ix_blockchain_events_pending', 'blockchain_events', ['block_number', 'log_index'],
+        postgresql_where=sa.text('processed = false AND confirmed AND NOT dead_lettered')
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_blockchain_events_pending', table_name='blockchain_events')
+    op.execute("DELETE FROM blockchain_events WHERE dead_lettered")
+    op.drop_column('blockchain_events', 'dead_lettered')
+    op.create_index(
+        'ix_blockchain_events_pending', 'blockchain_events', ['block_number', 'log_index'],
+        postgresql_where=sa.text('processed = false AND confirmed')
+    )
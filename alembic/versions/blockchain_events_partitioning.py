@@ -0,0 +1,127 @@
+"""blockchain_events_partitioning - range partitions by block_number
+
+Revision ID: blockchain_events_partitioning
+Revises: blockchain_dead_letters
+Create Date: 2026-10-17
+
+CAMBIOS:
+1. blockchain_events pasa a ser una tabla particionada por RANGE (block_number),
+   una partición cada BLOCKCHAIN_EVENTS_PARTITION_BLOCKS bloques; se crean las
+   particiones que cubren los datos existentes y el resto bajo demanda
+2. PK (id, block_number) y uq_tx_log (transaction_hash, log_index, block_number):
+   la clave de partición debe formar parte de toda restricción única
+3. Índices compuestos (event_type, block_number) y (contract_address, block_number)
+   para la API, e índice parcial de eventos pendientes para el procesador;
+   se eliminan los índices simples de event_type, contract_address, id y processed
+4. Esquema blockchain_archive para las particiones frías desacopladas
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+from app.core.config import settings
+
+revision: str = 'blockchain_events_partitioning'
+down_revision: Union[str, Sequence[str], None] = 'blockchain_dead_letters'
+branch_labels = None
+depends_on = None
+
+COLUMNS = """
+    id, event_type, contract_address, event_data, transaction_hash,
+    block_number, block_timestamp, log_index, processed, processed_at,
+    attempts, next_attempt_at, last_error, created_at
+"""
+
+
+def upgrade() -> None:
+    op.execute("ALTER TABLE blockchain_events RENAME TO blockchain_events_legacy")
+    op.execute("ALTER SEQUENCE blockchain_events_id_seq OWNED BY NONE")
+    for name in ('uq_tx_log', 'blockchain_events_pkey'):
+        op.execute(f"ALTER TABLE blockchain_events_legacy RENAME CONSTRAINT {name} TO {name}_legacy")
+    for name in ('block_number', 'contract_address', 'event_type', 'id', 'processed'):
+        op.execute(f"DROP INDEX IF EXISTS ix_blockchain_events_{name}")
+
+    op.execute("""
+        CREATE TABLE blockchain_events (
+            id INTEGER NOT NULL DEFAULT nextval('blockchain_events_id_seq'),
+            event_type VARCHAR(100) NOT NULL,
+            contract_address VARCHAR(42) NOT NULL,
+            event_data JSONB NOT NULL,
+            transaction_hash VARCHAR(66) NOT NULL,
+            block_number INTEGER NOT NULL,
+            block_timestamp TIMESTAMP WITH TIME ZONE NOT NULL,
+            log_index INTEGER NOT NULL,
+            processed BOOLEAN,
+            processed_at TIMESTAMP WITH TIME ZONE,
+            attempts INTEGER NOT NULL DEFAULT 0,
+            next_attempt_at TIMESTAMP WITH TIME ZONE,
+            last_error TEXT,
+            created_at TIMESTAMP WITH TIME ZONE DEFAULT now(),
+            CONSTRAINT blockchain_events_pkey PRIMARY KEY (id, block_number),
+            CONSTRAINT uq_tx_log UNIQUE (transaction_hash, log_index, block_number)
+        ) PARTITION BY RANGE (block_number)
+    """)
+    op.execute("ALTER SEQUENCE blockchain_events_id_seq OWNED BY blockchain_events.id")
+
+    op.create_index('ix_blockchain_events_block_number', 'blockchain_events', ['block_number'])
+    op.create_index('ix_blockchain_events_type_block', 'blockchain_events', ['event_type', 'block_number'])
+    op.create_index('ix_blockchain_events_contract_block', 'blockchain_events', ['contract_address', 'block_number'])
+    op.create_index(
+        'ix_blockchain_events_pending', 'blockchain_events', ['block_number', 'log_index'],
+        postgresql_where=sa.text('processed = false')
+    )
+
+    # Partitions from block 0 up to one past the newest stored event.
+    size = settings.BLOCKCHAIN_EVENTS_PARTITION_BLOCKS
+    max_block = op.get_bind().execute(
+        sa.text("SELECT COALESCE(MAX(block_number), 0) FROM blockchain_events_legacy")
+    ).scalar()
+    for start in range(0, max_block + size + 1, size):
+        op.execute(
+            f"CREATE TABLE blockchain_events_p{start} PARTITION OF blockchain_events "
+            f"FOR VALUES FROM ({start}) TO ({start + size})"
+        )
+
+    op.execute(f"INSERT INTO blockchain_events ({COLUMNS}) SELECT {COLUMNS} FROM blockchain_events_legacy")
+    op.execute("DROP TABLE blockchain_events_legacy")
+    op.execute("CREATE SCHEMA IF NOT EXISTS blockchain_archive")
+
+
+def downgrade() -> None:
+    # Archived partitions (blockchain_archive schema) are left untouched.
+    op.execute("ALTER TABLE blockchain_events RENAME TO blockchain_events_partitioned")
+    op.execute("ALTER SEQUENCE blockchain_events_id_seq OWNED BY NONE")
+    for name in ('uq_tx_log', 'blockchain_events_pkey'):
+        op.execute(f"ALTER TABLE blockchain_events_partitioned RENAME CONSTRAINT {name} TO {name}_partitioned")
+    for name in ('block_number', 'type_block', 'contract_block', 'pending'):
+        op.execute(f"DROP INDEX IF EXISTS ix_blockchain_events_{name}")
+
+    op.execute("""
+        CREATE TABLE blockchain_events (
+            id INTEGER NOT NULL DEFAULT nextval('blockchain_events_id_seq'),
+            event_type VARCHAR(100) NOT NULL,
+            contract_address VARCHAR(42) NOT NULL,
+            event_data JSONB NOT NULL,
+            transaction_hash VARCHAR(66) NOT NULL,
+            block_number INTEGER NOT NULL,
+            block_timestamp TIMESTAMP WITH TIME ZONE NOT NULL,
+            log_index INTEGER NOT NULL,
+            processed BOOLEAN,
+            processed_at TIMESTAMP WITH TIME ZONE,
+            attempts INTEGER NOT NULL DEFAULT 0,
+            next_attempt_at TIMESTAMP WITH TIME ZONE,
+            last_error TEXT,
+            created_at TIMESTAMP WITH TIME ZONE DEFAULT now(),
+            CONSTRAINT blockchain_events_pkey PRIMARY KEY (id),
+            CONSTRAINT uq_tx_log UNIQUE (transaction_hash, log_index)
+        )
+    """)
+    op.execute("ALTER SEQUENCE blockchain_events_id_seq OWNED BY blockchain_events.id")
+    op.execute(f"INSERT INTO blockchain_events ({COLUMNS}) SELECT {COLUMNS} FROM blockchain_events_partitioned")
+    op.execute("DROP TABLE blockchain_events_partitioned CASCADE")
+
+    op.create_index(op.f('ix_blockchain_events_block_number'), 'blockchain_events', ['block_number'], unique=False)
+    op.create_index(op.f('ix_blockchain_events_contract_address'), 'blockchain_events', ['contract_address'], unique=False)
+    op.create_index(op.f('ix_blockchain_events_event_type'), 'blockchain_events', ['event_type'], unique=False)
+    op.create_index(op.f('ix_blockchain_events_id'), 'blockchain_events', ['id'], unique=False)
+    op.create_index(op.f('ix_blockchain_events_processed'), 'blockchain_events', ['processed'], unique=False)
@@ -0,0 +1,46 @@
+"""blockchain_sync_state - persistent listener cursor per contract
+
+Revision ID: blockchain_sync_state
+Revises: backfill_shards
+Create Date: 2026-10-17
+
+CAMBIOS:
+1. blockchain_sync_state - último bloque escaneado (y su hash) por contrato,
+   actualizado en la misma transacción que cada lote de eventos
+2. Se inicializa con MAX(block_number) de blockchain_events para no re-escanear
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = 'blockchain_sync_state'
+down_revision: Union[str, Sequence[str], None] = 'backfill_shards'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'blockchain_sync_state',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('contract_address', sa.String(42), nullable=False),
+        sa.Column('last_block', sa.Integer(), server_default='0', nullable=False),
+        sa.Column('last_block_hash', sa.String(66), nullable=True),
+        sa.Column('events_ingested', sa.Integer(), server_default='0', nullable=False),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('contract_address'),
+    )
+    op.create_index(op.f('ix_blockchain_sync_state_id'), 'blockchain_sync_state', ['id'], unique=False)
+
+    op.execute("""
+        INSERT INTO blockchain_sync_state (contract_address, last_block, events_ingested)
+        SELECT contract_address, MAX(block_number), COUNT(*)
+        FROM blockchain_events
+        GROUP BY contract_address
+    """)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_blockchain_sync_state_id'), table_name='blockchain_sync_state')
+    op.drop_table('blockchain_sync_state')
@@ -0,0 +1,47 @@
+"""fund_transactions_log_index - idempotent deposit projection
+
+Revision ID: fund_transactions_log_index
+Revises: blockchain_events_confirmed
+Create Date: 2026-10-17
+
+CAMBIOS:
+1. fund_transactions.log_index - índice del log del que se proyectó la fila
+   (NULL en las filas creadas por la API)
+2. uq_fund_transactions_log (transaction_hash, log_index, transaction_type):
+   un evento Deposited reprocesado no vuelve a sumar al saldo del fondo
+3. Elimina uq_tx_fund (transaction_hash, fund_address): un Deposited proyecta
+   dos filas (monthly_deposit y fee_payment) con el mismo hash y fondo;
+   uq_fund_transactions_log la reemplaza
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = 'fund_transactions_log_index'
+down_revision: Union[str, Sequence[str], None] = 'blockchain_events_confirmed'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column('fund_transactions', sa.Column('log_index', sa.Integer(), nullable=True))
+    op.create_index(
+        'uq_fund_transactions_log', 'fund_transactions',
+        ['transaction_hash', 'log_index', 'transaction_type'], unique=True
+    )
+    op.drop_constraint('uq_tx_fund', 'fund_transactions', type_='unique')
+
+
+def downgrade() -> None:
+    # Las filas proyectadas (misma tx y fondo) no caben en uq_tx_fund;
+    # se conserva la primera de cada par.
+    op.execute("""
+        DELETE FROM fund_transactions a
+        USING fund_transactions b
+        WHERE a.transaction_hash = b.transaction_hash
+          AND a.fund_address = b.fund_address
+          AND a.id > b.id
+    """)
+    op.create_unique_constraint('uq_tx_fund', 'fund_transactions', ['transaction_hash', 'fund_address'])
+    op.drop_index('uq_fund_transactions_log', table_name='fund_transactions')
+    op.drop_column('fund_transactions', 'log_index')
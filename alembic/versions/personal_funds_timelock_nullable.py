@@ -0,0 +1,35 @@
+"""personal_funds_timelock_nullable - funds projected from FundCreated
+
+Revision ID: personal_funds_timelock_nullable
+Revises: token_activities_log_index
+Create Date: 2026-10-17
+
+CAMBIOS:
+1. personal_funds.timelock_end admite NULL, como declara el modelo: el evento
+   FundCreated no trae el timelock, así que el fondo proyectado lo conoce más
+   tarde y mientras tanto no está listo para el retiro
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = 'personal_funds_timelock_nullable'
+down_revision: Union[str, Sequence[str], None] = 'token_activities_log_index'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.alter_column(
+        'personal_funds', 'timelock_end',
+        existing_type=sa.DateTime(timezone=True), nullable=True
+    )
+
+
+def downgrade() -> None:
+    # Sin timelock conocido se usa la fecha de creación del fondo.
+    op.execute("UPDATE personal_funds SET timelock_end = created_at WHERE timelock_end IS NULL")
+    op.alter_column(
+        'personal_funds', 'timelock_end',
+        existing_type=sa.DateTime(timezone=True), nullable=False
+    )
@@ -0,0 +1,35 @@
+"""stat_counters - running totals for stats endpoints
+
+Revision ID: stat_counters
+Revises: analytics_range_indexes
+Create Date: 2026-10-17
+
+CAMBIOS:
+1. stat_counters - contadores (namespace, name) que los servicios actualizan
+   en la misma transacción que las filas que cuentan; los endpoints de stats
+   leen estas filas en vez de recorrer las tablas. Cada namespace se siembra
+   en su primera lectura y reconcile_counters corrige desvíos cada hora
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = 'stat_counters'
+down_revision: Union[str, Sequence[str], None] = 'analytics_range_indexes'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'stat_counters',
+        sa.Column('namespace', sa.String(50), nullable=False),
+        sa.Column('name', sa.String(100), nullable=False),
+        sa.Column('value', sa.DECIMAL(38, 6), nullable=False),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.PrimaryKeyConstraint('namespace', 'name'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('stat_counters')
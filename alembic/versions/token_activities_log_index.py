@@ -0,0 +1,34 @@
+"""token_activities_log_index - idempotent token activity projection
+
+Revision ID: token_activities_log_index
+Revises: blockchain_event_keys
+Create Date: 2026-10-17
+
+CAMBIOS:
+1. token_activities.log_index - índice del log del que se proyectó la fila
+   (NULL en las filas creadas por la API)
+2. uq_token_activities_log (transaction_hash, log_index): un evento de token
+   reprocesado no se registra dos veces, y dos logs de la misma transacción
+   (p. ej. Transfer y TokensBurned) se registran ambos
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = 'token_activities_log_index'
+down_revision: Union[str, Sequence[str], None] = 'blockchain_event_keys'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column('token_activities', sa.Column('log_index', sa.Integer(), nullable=True))
+    op.create_index(
+        'uq_token_activities_log', 'token_activities',
+        ['transaction_hash', 'log_index'], unique=True
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('uq_token_activities_log', table_name='token_activities')
+    op.drop_column('token_activities', 'log_index')
@@ -1,11 +1,12 @@
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi import Request, HTTPException, status, Depends
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from typing import Generator, Optional, Dict, Any
+from typing import AsyncGenerator, Generator, Optional, Dict, Any
 import logging
 
 from app.core.config import settings
-from app.core.database import db_manager
+from app.core.database import db_manager, db_registry
 from app.core.security import security_manager, security_scheme
 from app.models.user import User
 from app.services.user_service import user_service
@@ -23,14 +24,32 @@ def get_db() -> Generator[Session, None, None]:
     finally:
         db.close()
 
+def get_readonly_db() -> Generator[Session, None, None]:
+    db = db_registry.get("readonly").get_session()
+    try:
+        yield db
+    finally:
+        db.close()
+
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    db = db_manager.get_async_session()
+    try:
+        yield db
+    except Exception as e:
+        logger.error(f"Async database session error: {e}")
+        await db.rollback()
+        raise
+    finally:
+        await db.close()
+
 def get_current_admin(
     credentials: HTTPAuthorizationCredentials = Depends(security_scheme)
 ) -> Dict[str, Any]:
     return security_manager.verify_admin_token(credentials)
 
-def get_current_user(
+async def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security_scheme),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ) -> User:
     payload = security_manager.verify_user_token(credentials)
     user_id = payload.get("user_id")
@@ -40,7 +59,7 @@ def get_current_user(
             detail="Invalid token payload"
         )
     
-    user = user_service.get(db, user_id)
+    user = await user_service.get_async(db, user_id)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
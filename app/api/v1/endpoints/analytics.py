@@ -4,6 +4,7 @@ from typing import List, Optional
 from datetime import date
 import logging
 
+from app.core.cache import cached
 from app.api.deps import get_db, get_current_admin
 from app.schemas.analytics import (
     DailySnapshot,
@@ -100,6 +101,7 @@ async def health_check(db: Session = Depends(get_db)):
     summary="Get system metrics overview (Admin)",
     dependencies=[Depends(get_current_admin)]
 )
+@cached("analytics", ttl=300)
 async def get_metrics_overview(db: Session = Depends(get_db)):
     return analytics_service.get_system_metrics(db)
 
@@ -1,12 +1,13 @@
 from fastapi import APIRouter, HTTPException, status, Depends
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from pydantic import BaseModel, Field
 from datetime import timedelta
 import logging
 
 from app.core.config import settings
 from app.core.jwt import jwt_manager
-from app.api.deps import get_db
+from app.api.deps import get_db, get_async_db
 from app.services.user_service import user_service
 
 logger = logging.getLogger(__name__)
@@ -107,7 +108,7 @@ async def wallet_login(
 )
 async def refresh_access_token(
     refresh_data: RefreshTokenRequest,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
 
     try:
@@ -122,7 +123,7 @@ async def refresh_access_token(
                 detail="Invalid refresh token"
             )
 
-        user = user_service.get(db, user_id)
+        user = await user_service.get_async(db, user_id)
         if not user or not user.is_active:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
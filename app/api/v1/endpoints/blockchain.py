@@ -1,15 +1,22 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, Query, HTTPException, status
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List, Optional
 import logging
 
-from app.api.deps import get_db, get_current_admin
+from app.core.config import settings
+from app.core.pagination import Page
+from app.api.deps import get_db, get_async_db, get_current_admin
 from app.schemas.blockchain import (
     BlockchainEventCreate,
     BlockchainEventResponse,
+    DeadLetterResponse,
+    DeadLetterReplay,
     EventFilter
 )
 from app.services.blockchain_service import blockchain_service
+from app.blockchain.web3_client import web3_client
+from app.tasks.blockchain_tasks import backfill_blocks
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
@@ -35,12 +42,12 @@ async def record_event(
 
 @router.get(
     "/events",
-    response_model=List[BlockchainEventResponse],
+    response_model=Page[BlockchainEventResponse],
     summary="Get blockchain events"
 )
 async def get_events(
-    skip: int = 0,
-    limit: int = 100,
+    cursor: Optional[str] = None,
+    limit: int = Query(settings.DEFAULT_PAGE_SIZE, ge=1, le=settings.MAX_PAGE_SIZE),
     event_type: Optional[str] = None,
     contract_address: Optional[str] = None,
     processed: Optional[bool] = None,
@@ -48,7 +55,7 @@ async def get_events(
 ):
     return blockchain_service.get_events(
         db=db,
-        skip=skip,
+        cursor=cursor,
         limit=limit,
         event_type=event_type,
         contract_address=contract_address,
@@ -62,9 +69,9 @@ async def get_events(
 )
 async def get_event(
     event_id: int,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
-    event = blockchain_service.get_event(db, event_id)
+    event = await blockchain_service.get_async(db, event_id)
     if not event:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -112,6 +119,37 @@ async def get_unprocessed_events(
 ):
     return blockchain_service.get_unprocessed(db, limit)
 
+@router.get(
+    "/dead-letters",
+    response_model=Page[DeadLetterResponse],
+    summary="List dead-lettered events (Admin)",
+    dependencies=[Depends(get_current_admin)]
+)
+async def get_dead_letters(
+    event_type: Optional[str] = None,
+    cursor: Optional[str] = None,
+    limit: int = Query(settings.DEFAULT_PAGE_SIZE, ge=1, le=settings.MAX_PAGE_SIZE),
+    db: Session = Depends(get_db)
+):
+    return blockchain_service.get_dead_letters(db, event_type, cursor, limit)
+
+@router.post(
+    "/dead-letters/replay",
+    summary="Requeue dead-lettered events (Admin)",
+    dependencies=[Depends(get_current_admin)]
+)
+async def replay_dead_letters(
+    replay: DeadLetterReplay,
+    db: Session = Depends(get_db)
+):
+    replayed = blockchain_service.replay_dead_letters(db, replay.ids)
+    if not replayed:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Dead letters not found"
+        )
+    return {"success": True, "replayed": replayed}
+
 @router.post(
     "/sync",
     summary="Sync blockchain data (Admin)",
@@ -123,12 +161,21 @@ async def sync_blockchain(
     db: Session = Depends(get_db)
 ):
     try:
-        result = blockchain_service.sync_events(
-            db=db,
-            from_block=from_block,
-            to_block=to_block
-        )
-        return result
+        if to_block is None:
+            to_block = web3_client.get_latest_block() - settings.BLOCKCHAIN_CONFIRMATIONS
+        if from_block is None:
+            from_block = blockchain_service.get_sync_status(db)["last_synced_block"] + 1
+        if to_block < from_block:
+            return {"success": True, "message": "Already up to date", "to_block": to_block}
+
+        task = backfill_blocks.delay(from_block, to_block)
+        return {
+            "success": True,
+            "message": "Backfill queued",
+            "task_id": task.id,
+            "from_block": from_block,
+            "to_block": to_block
+        }
         
     except Exception as e:
         logger.error(f"Blockchain sync error: {e}", exc_info=True)
@@ -137,6 +184,43 @@ async def sync_blockchain(
             detail="Blockchain sync failed"
         )
 
+@router.post(
+    "/sync/rollback",
+    summary="Force a reorg rollback after reconciling projected rows (Admin)",
+    dependencies=[Depends(get_current_admin)]
+)
+async def force_rollback(
+    fork_block: int = Query(..., ge=0),
+    db: Session = Depends(get_db)
+):
+    result = blockchain_service.rollback_to_block(db, fork_block, force=True)
+    return {"success": True, **result}
+
+@router.get(
+    "/sync/shards",
+    summary="List backfill shards (Admin)",
+    dependencies=[Depends(get_current_admin)]
+)
+async def get_backfill_shards(
+    shard_status: Optional[str] = None,
+    limit: int = 100,
+    db: Session = Depends(get_db)
+):
+    shards = blockchain_service.get_backfill_shards(db, shard_status, limit)
+    return [
+        {
+            "id": s.id,
+            "from_block": s.from_block,
+            "to_block": s.to_block,
+            "checkpoint_block": s.checkpoint_block,
+            "status": s.status,
+            "events_inserted": s.events_inserted,
+            "attempts": s.attempts,
+            "last_error": s.last_error,
+        }
+        for s in shards
+    ]
+
 @router.get(
     "/sync/status",
     summary="Get sync status"
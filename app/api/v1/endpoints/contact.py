@@ -1,8 +1,10 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Request, BackgroundTasks
+from fastapi import APIRouter, Depends, Query, HTTPException, status, Request, BackgroundTasks
 from sqlalchemy.orm import Session
-from typing import List
+from typing import Optional
 import logging
 
+from app.core.config import settings
+from app.core.pagination import Page
 from app.api.deps import get_db, get_current_admin, get_client_info
 from app.schemas.contact import (
     ContactCreate,
@@ -63,17 +65,17 @@ async def submit_contact(
 
 @router.get(
     "/messages",
-    response_model=List[ContactAdmin],
+    response_model=Page[ContactAdmin],
     summary="Get all contact messages (Admin)",
     dependencies=[Depends(get_current_admin)]
 )
 async def get_contact_messages(
-    skip: int = 0,
-    limit: int = 100,
+    cursor: Optional[str] = None,
+    limit: int = Query(settings.DEFAULT_PAGE_SIZE, ge=1, le=settings.MAX_PAGE_SIZE),
     unread_only: bool = False,
     db: Session = Depends(get_db)
 ):
-    return contact_service.get_all(db, skip, limit, unread_only)
+    return contact_service.get_all(db, cursor, limit, unread_only)
 
 
 @router.get(
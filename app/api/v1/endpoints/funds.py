@@ -1,8 +1,10 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Request, BackgroundTasks
+from fastapi import APIRouter, Depends, Query, HTTPException, status, Request, BackgroundTasks
 from sqlalchemy.orm import Session
 from typing import List, Optional
 import logging
 
+from app.core.config import settings
+from app.core.pagination import Page
 from app.api.deps import get_db, get_current_admin, get_client_info
 from app.schemas.fund import (
     PersonalFundCreate,
@@ -255,19 +257,19 @@ async def get_auto_withdrawal_info(
 
 @router.get(
     "/",
-    response_model=List[PersonalFundResponse],
+    response_model=Page[PersonalFundResponse],
     summary="Get all funds (Admin)",
     dependencies=[Depends(get_current_admin)]
 )
 async def get_all_funds(
-    skip: int = 0,
-    limit: int = 100,
+    cursor: Optional[str] = None,
+    limit: int = Query(settings.DEFAULT_PAGE_SIZE, ge=1, le=settings.MAX_PAGE_SIZE),
     retirement_status: Optional[str] = None,
     db: Session = Depends(get_db)
 ):
     return fund_service.get_all_funds(
         db=db,
-        skip=skip,
+        cursor=cursor,
         limit=limit,
         retirement_status=retirement_status
     )
@@ -1,8 +1,11 @@
-from fastapi import APIRouter, Depends, HTTPException, status, BackgroundTasks
+from fastapi import APIRouter, Depends, Query, HTTPException, status, BackgroundTasks
 from sqlalchemy.orm import Session
 from typing import List, Optional
 import logging
 
+from app.core.config import settings
+from app.core.pagination import Page
+from app.core.cache import cached
 from app.api.deps import get_db, get_current_admin
 from app.schemas.governance import (
     ProposalCreate,
@@ -138,19 +141,19 @@ async def vote_on_proposal(
 
 @router.get(
     "/proposals/{proposal_id}/votes",
-    response_model=List[VoteResponse],
+    response_model=Page[VoteResponse],
     summary="Get votes for proposal"
 )
 async def get_proposal_votes(
     proposal_id: int,
-    skip: int = 0,
-    limit: int = 100,
+    cursor: Optional[str] = None,
+    limit: int = Query(settings.DEFAULT_PAGE_SIZE, ge=1, le=settings.MAX_PAGE_SIZE),
     db: Session = Depends(get_db)
 ):
     return governance_service.get_proposal_votes(
         db=db,
         proposal_id=proposal_id,
-        skip=skip,
+        cursor=cursor,
         limit=limit
     )
 
@@ -224,6 +227,7 @@ async def cancel_proposal(
     response_model=ProposalStats,
     summary="Get governance statistics"
 )
+@cached("governance", ttl=60)
 async def get_governance_stats(db: Session = Depends(get_db)):
     return governance_service.get_stats(db)
 
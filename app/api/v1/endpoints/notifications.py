@@ -1,8 +1,10 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, Query, HTTPException, status
 from sqlalchemy.orm import Session
-from typing import List
+from typing import Optional
 import logging
 
+from app.core.config import settings
+from app.core.pagination import Page
 from app.api.deps import get_db
 from app.schemas.notification import (
     NotificationCreate,
@@ -16,20 +18,20 @@ logger = logging.getLogger(__name__)
 
 @router.get(
     "/user/{wallet_address}",
-    response_model=List[NotificationResponse],
+    response_model=Page[NotificationResponse],
     summary="Get user notifications"
 )
 async def get_user_notifications(
     wallet_address: str,
-    skip: int = 0,
-    limit: int = 50,
+    cursor: Optional[str] = None,
+    limit: int = Query(settings.DEFAULT_PAGE_SIZE, ge=1, le=settings.MAX_PAGE_SIZE),
     unread_only: bool = False,
     db: Session = Depends(get_db)
 ):
     return notification_service.get_user_notifications(
         db=db,
         wallet_address=wallet_address,
-        skip=skip,
+        cursor=cursor,
         limit=limit,
         unread_only=unread_only
     )
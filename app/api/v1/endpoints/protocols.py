@@ -3,6 +3,7 @@ from sqlalchemy.orm import Session
 from typing import List, Optional
 import logging
 
+from app.core.cache import cached
 from app.api.deps import get_db, get_current_admin
 from app.schemas.protocol import (
     DeFiProtocolCreate,
@@ -162,6 +163,7 @@ async def toggle_protocol_status(
     response_model=List[ProtocolWithAPY],
     summary="Get protocols sorted by APY"
 )
+@cached("protocols")
 async def get_best_apy_protocols(
     risk_level: Optional[int] = None,
     limit: int = 10,
@@ -194,6 +196,7 @@ async def get_protocols_by_risk(
     response_model=ProtocolStats,
     summary="Get protocol statistics"
 )
+@cached("protocols")
 async def get_protocol_stats(db: Session = Depends(get_db)):
     return protocol_service.get_stats(db)
 
@@ -1,10 +1,8 @@
 from fastapi import APIRouter, Depends
 from sqlalchemy.orm import Session
 from typing import Dict, Any
-from app.api.deps import get_db, get_current_admin
-from app.services.contact_service import contact_service
-from app.services.user_service import user_service
-from app.services.survey_service import survey_service
+from app.api.deps import get_db, get_readonly_db, get_current_admin
+from app.services.admin_stats_service import admin_stats_service
 
 router = APIRouter()
 
@@ -13,9 +11,16 @@ router = APIRouter()
     response_model=Dict[str, Any],
     dependencies=[Depends(get_current_admin)]
 )
-async def get_admin_stats(db: Session = Depends(get_db)):
-    return {
-        "users": user_service.get_stats(db),
-        "contacts": contact_service.get_stats(db),
-        "surveys": survey_service.get_stats(db),
-    }
\ No newline at end of file
+async def get_admin_stats(db: Session = Depends(get_readonly_db)):
+    return admin_stats_service.get_stats(db)
+
+@router.post(
+    "/admin/stats/refresh",
+    response_model=Dict[str, Any],
+    summary="Refresh admin stats now (Admin)",
+    dependencies=[Depends(get_current_admin)]
+)
+async def refresh_admin_stats(db: Session = Depends(get_db)):
+    admin_stats_service.refresh(db)
+    # Read back from the primary: the replica may not have the refresh yet.
+    return admin_stats_service.get_stats(db)
\ No newline at end of file
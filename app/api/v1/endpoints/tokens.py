@@ -1,8 +1,11 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, Query, HTTPException, status
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
 import logging
 
+from app.core.config import settings
+from app.core.pagination import Page
+from app.core.cache import cached
 from app.api.deps import get_db, get_current_admin
 from app.schemas.token import (
     TokenHolderResponse,
@@ -35,19 +38,19 @@ async def get_token_holder(
 
 @router.get(
     "/holder/{wallet_address}/activities",
-    response_model=List[TokenActivityResponse],
+    response_model=Page[TokenActivityResponse],
     summary="Get token holder activities"
 )
 async def get_holder_activities(
     wallet_address: str,
-    skip: int = 0,
-    limit: int = 50,
+    cursor: Optional[str] = None,
+    limit: int = Query(settings.DEFAULT_PAGE_SIZE, ge=1, le=settings.MAX_PAGE_SIZE),
     db: Session = Depends(get_db)
 ):
     return token_service.get_holder_activities(
         db=db,
         wallet_address=wallet_address,
-        skip=skip,
+        cursor=cursor,
         limit=limit
     )
 
@@ -79,6 +82,7 @@ async def record_activity(
     response_model=TokenStats,
     summary="Get token statistics"
 )
+@cached("tokens", ttl=60)
 async def get_token_stats(db: Session = Depends(get_db)):
     return token_service.get_stats(db)
 
@@ -116,6 +120,7 @@ async def get_inactive_holders(
     "/burn/upcoming",
     summary="Get upcoming burn info"
 )
+@cached("tokens", ttl=300, l1_ttl=settings.CACHE_L1_TTL)
 async def get_burn_info(db: Session = Depends(get_db)):
     return token_service.get_burn_info(db)
 
@@ -1,8 +1,10 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Request
+from fastapi import APIRouter, Depends, Query, HTTPException, status, Request
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
 import logging
 
+from app.core.config import settings
+from app.core.pagination import Page
 from app.api.deps import get_db, get_current_admin, get_client_info
 from app.schemas.user import (
     EmailAssociation,
@@ -103,16 +105,16 @@ async def user_login(
 
 @router.get(
     "/",
-    response_model=List[UserAdmin],
+    response_model=Page[UserAdmin],
     summary="Get all users (Admin)",
     dependencies=[Depends(get_current_admin)]
 )
 async def get_all_users(
-    skip: int = 0,
-    limit: int = 100,
+    cursor: Optional[str] = None,
+    limit: int = Query(settings.DEFAULT_PAGE_SIZE, ge=1, le=settings.MAX_PAGE_SIZE),
     db: Session = Depends(get_db)
 ):
-    return user_service.get_all_users(db, skip, limit)
+    return user_service.get_all_users(db, cursor, limit)
 
 @router.get(
     "/mailing-list",
@@ -133,17 +135,17 @@ async def get_mailing_list(
 
 @router.get(
     "/search",
-    response_model=List[UserAdmin],
+    response_model=Page[UserAdmin],
     summary="Search users (Admin)",
     dependencies=[Depends(get_current_admin)]
 )
 async def search_users(
     q: str,
-    skip: int = 0,
-    limit: int = 50,
+    cursor: Optional[str] = None,
+    limit: int = Query(settings.DEFAULT_PAGE_SIZE, ge=1, le=settings.MAX_PAGE_SIZE),
     db: Session = Depends(get_db)
 ):
-    return user_service.search_users(db, q, skip, limit)
+    return user_service.search_users(db, q, cursor, limit)
 
 @router.patch(
     "/{user_id}",
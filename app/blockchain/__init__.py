@@ -1,5 +1,7 @@
 from .web3_client import Web3Client
 from .event_listener import EventListener
+from .event_ingestor import EventIngestor
+from .reorg import ReorgDetector
 from .contract_manager import ContractManager
 
-__all__ = ["Web3Client", "EventListener", "ContractManager"]
+__all__ = ["Web3Client", "EventListener", "EventIngestor", "ReorgDetector", "ContractManager"]
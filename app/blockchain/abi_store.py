@@ -0,0 +1,133 @@
+from eth_utils import function_abi_to_4byte_selector
+from typing import Any, Dict, List, Optional, Tuple
+from pathlib import Path
+import hashlib
+import json
+import logging
+
+from .event_decoder import EventDecoder
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+ABI_ITEM_TYPES = {"function", "event", "constructor", "fallback", "receive", "error"}
+CACHE_VERSION = 1
+
+class ABIValidationError(ValueError):
+    pass
+
+def _resolve(path: Path) -> Path:
+    return path if path.is_absolute() else PROJECT_ROOT / path
+
+def validate_abi(contract_name: str, abi: Any) -> None:
+    if not isinstance(abi, list):
+        raise ABIValidationError(f"{contract_name}: ABI must be a list")
+    for item in abi:
+        if not isinstance(item, dict) or item.get("type") not in ABI_ITEM_TYPES:
+            raise ABIValidationError(f"{contract_name}: invalid ABI entry {item!r:.80}")
+        if item["type"] in ("function", "event", "error") and not item.get("name"):
+            raise ABIValidationError(f"{contract_name}: {item['type']} without a name")
+        for param in item.get("inputs", []):
+            if "type" not in param:
+                raise ABIValidationError(f"{contract_name}: {item.get('name')} has an input without a type")
+
+class ABIStore:
+    """
+    Contract ABIs read from artifact files, plus their derived selectors.
+
+    Artifacts live in CONTRACT_ABI_DIR/<network>/<contract>.json, falling back
+    to CONTRACT_ABI_DIR/common/<contract>.json; either a bare ABI list or a
+    Hardhat/Foundry artifact with an "abi" key. Event decoders and function
+    selectors are compiled once and cached in ABI_CACHE_DIR keyed by the
+    artifact's sha256, so an unchanged artifact is never recompiled.
+    """
+
+    def __init__(
+        self,
+        network: Optional[str] = None,
+        abi_dir: Optional[Path] = None,
+        cache_dir: Optional[Path] = None
+    ):
+        self.network = network or settings.BLOCKCHAIN_NETWORK or "arbitrum-sepolia"
+        self.abi_dir = _resolve(abi_dir or settings.CONTRACT_ABI_DIR)
+        self.cache_dir = _resolve(cache_dir or settings.ABI_CACHE_DIR)
+
+    def _artifact_paths(self) -> Dict[str, Path]:
+        paths: Dict[str, Path] = {}
+        for folder in (self.abi_dir / "common", self.abi_dir / self.network):
+            if folder.is_dir():
+                for path in sorted(folder.glob("*.json")):
+                    paths[path.stem] = path
+        return paths
+
+    def load(self) -> Tuple[Dict[str, List], Dict[str, str]]:
+        """Read and validate every artifact; returns (abis, sha256 per contract)."""
+        abis: Dict[str, List] = {}
+        digests: Dict[str, str] = {}
+        for contract_name, path in self._artifact_paths().items():
+            try:
+                raw = path.read_bytes()
+                artifact = json.loads(raw)
+                abi = artifact["abi"] if isinstance(artifact, dict) else artifact
+                validate_abi(contract_name, abi)
+            except (OSError, ValueError, KeyError) as e:
+                logger.error(f"❌ Skipping ABI artifact {path}: {e}")
+                continue
+            abis[contract_name] = abi
+            digests[contract_name] = hashlib.sha256(raw).hexdigest()
+        return abis, digests
+
+    @staticmethod
+    def compile(abi: List[Dict[str, Any]]) -> Dict[str, Any]:
+        events = [
+            EventDecoder(item) for item in abi
+            if item["type"] == "event" and not item.get("anonymous")
+        ]
+        functions = {
+            "0x" + function_abi_to_4byte_selector(item).hex(): item["name"]
+            for item in abi if item["type"] == "function"
+        }
+        return {
+            "events": [decoder.to_spec() for decoder in events],
+            "functions": functions,
+        }
+
+    def _cache_path(self) -> Path:
+        return self.cache_dir / f"{self.network}.json"
+
+    def _read_cache(self) -> Dict[str, Any]:
+        try:
+            cache = json.loads(self._cache_path().read_text())
+        except (OSError, ValueError):
+            return {}
+        if cache.get("version") != CACHE_VERSION:
+            return {}
+        return cache.get("contracts", {})
+
+    def _write_cache(self, contracts: Dict[str, Any]) -> None:
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            tmp = self._cache_path().with_suffix(".tmp")
+            tmp.write_text(json.dumps({"version": CACHE_VERSION, "contracts": contracts}))
+            tmp.replace(self._cache_path())
+        except OSError as e:
+            logger.warning(f"Could not write ABI cache: {e}")
+
+    def compiled(self, digests: Dict[str, str], abis: Dict[str, List]) -> Dict[str, Dict[str, Any]]:
+        """Derived structures per contract, from disk cache when the artifact is unchanged."""
+        cached = self._read_cache()
+        result: Dict[str, Dict[str, Any]] = {}
+        recompiled = []
+        for contract_name, digest in digests.items():
+            entry = cached.get(contract_name)
+            if not entry or entry.get("sha256") != digest:
+                entry = {"sha256": digest, **self.compile(abis[contract_name])}
+                recompiled.append(contract_name)
+            result[contract_name] = entry
+        if recompiled or set(cached) != set(result):
+            self._write_cache(result)
+            logger.info(f"🗂️ ABI cache refreshed for: {', '.join(recompiled) or 'removed artifacts'}")
+        return result
+
+abi_store = ABIStore()
@@ -0,0 +1,203 @@
+from sqlalchemy.orm import Session
+from sqlalchemy import and_, or_
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.sql import func
+from datetime import timedelta
+from typing import Dict, List, Optional, Tuple, Any
+import asyncio
+import logging
+import time
+
+from .block_range import AdaptiveBlockRange
+from .event_ingestor import EventIngestor
+from app.core.config import settings
+from app.db.session import WorkerSessionLocal
+from app.models.blockchain import BackfillShard
+from app.services.blockchain_service import blockchain_service
+
+logger = logging.getLogger(__name__)
+
+class BackfillEngine:
+    """
+    Parallel historical sync over [from_block, to_block].
+
+    Shards are aligned to multiples of the shard size, so every run over an
+    overlapping range maps to the same shard rows: a moving head only extends
+    the checkpoint of the tail shard, and a failed run resumes from the
+    checkpoints it left. A run takes a shard with a compare-and-set on its
+    status, so overlapping runs never ingest the same shard; a running shard
+    whose checkpoint has not moved for the lease is considered abandoned.
+    A range reaching below the oldest attached (not archived) partition is
+    rejected with ArchivedRangeError before any shard is planned.
+    """
+
+    def __init__(
+        self,
+        shard_size: Optional[int] = None,
+        concurrency: Optional[int] = None
+    ):
+        self.shard_size = shard_size or settings.BLOCKCHAIN_BACKFILL_SHARD_SIZE
+        self.concurrency = concurrency or settings.BLOCKCHAIN_BACKFILL_CONCURRENCY
+        self.ingestor = EventIngestor(session_factory=WorkerSessionLocal)
+
+    def plan_shards(self, from_block: int, to_block: int) -> List[Tuple[int, int]]:
+        size = self.shard_size
+        first = from_block // size * size
+        return [(start, start + size - 1) for start in range(first, to_block + 1, size)]
+
+    def _load_or_create_shards(self, from_block: int, to_block: int) -> List[int]:
+        db = WorkerSessionLocal()
+        try:
+            blockchain_service.ensure_event_partitions(
+                db, to_block, settings.BLOCKCHAIN_EVENTS_PARTITION_BLOCKS, from_block
+            )
+            return self._ensure_shards(db, from_block, to_block)
+        finally:
+            db.close()
+
+    def _ensure_shards(self, db: Session, from_block: int, to_block: int) -> List[int]:
+        shards = self.plan_shards(from_block, to_block)
+        db.execute(
+            pg_insert(BackfillShard)
+            .values([
+                {"from_block": start, "to_block": end, "status": "pending",
+                 "events_inserted": 0, "attempts": 0}
+                for start, end in shards
+            ])
+            .on_conflict_do_nothing(constraint="uq_backfill_shard_range")
+        )
+        rows = db.query(BackfillShard.id).filter(
+            BackfillShard.from_block >= shards[0][0],
+            BackfillShard.to_block <= shards[-1][1],
+            BackfillShard.from_block % self.shard_size == 0,
+            BackfillShard.to_block - BackfillShard.from_block == self.shard_size - 1,
+            BackfillShard.status != "completed",
+            or_(
+                BackfillShard.checkpoint_block.is_(None),
+                BackfillShard.checkpoint_block < to_block
+            )
+        ).order_by(BackfillShard.from_block).all()
+        db.commit()
+        return [row.id for row in rows]
+
+    def _claim_shard(self, shard_id: int) -> Optional[BackfillShard]:
+        """Atomically take a shard; None if another run holds a live claim."""
+        db = WorkerSessionLocal()
+        try:
+            lease_expired = BackfillShard.updated_at < func.now() - timedelta(
+                seconds=settings.BLOCKCHAIN_BACKFILL_SHARD_LEASE
+            )
+            claimed = db.query(BackfillShard).filter(
+                BackfillShard.id == shard_id,
+                or_(
+                    BackfillShard.status.in_(("pending", "failed")),
+                    and_(BackfillShard.status == "running", lease_expired)
+                )
+            ).update(
+                {
+                    "status": "running",
+                    "attempts": BackfillShard.attempts + 1,
+                    "last_error": None,
+                    "updated_at": func.now(),
+                },
+                synchronize_session=False
+            )
+            db.commit()
+            if not claimed:
+                return None
+            return db.query(BackfillShard).filter(BackfillShard.id == shard_id).one()
+        finally:
+            db.close()
+
+    def _update_shard(self, shard_id: int, **fields: Any) -> None:
+        db = WorkerSessionLocal()
+        try:
+            db.query(BackfillShard).filter(BackfillShard.id == shard_id).update(
+                {**fields, "updated_at": func.now()}, synchronize_session=False
+            )
+            db.commit()
+        finally:
+            db.close()
+
+    async def _run_shard(
+        self,
+        shard_id: int,
+        to_block: int,
+        semaphore: asyncio.Semaphore
+    ) -> Dict[str, Any]:
+        async with semaphore:
+            shard = await asyncio.to_thread(self._claim_shard, shard_id)
+            if shard is None:
+                logger.info(f"⏭️ Backfill shard {shard_id} is held by another run")
+                return {"shard_id": shard_id, "status": "busy", "inserted": 0}
+            cursor = (shard.checkpoint_block if shard.checkpoint_block is not None else shard.from_block - 1) + 1
+            inserted = shard.events_inserted
+            # The tail shard is only scanned up to this run's head.
+            stop_at = min(shard.to_block, to_block)
+            block_range = AdaptiveBlockRange()
+
+            try:
+                while cursor <= stop_at:
+                    window_end = block_range.next_window(cursor, stop_at)
+                    started = time.monotonic()
+                    try:
+                        decoded = await asyncio.to_thread(
+                            self.ingestor.fetch_window, cursor, window_end, to_block
+                        )
+                    except Exception as e:
+                        if block_range.record_failure(e):
+                            continue
+                        raise
+                    block_range.record_success(len(decoded), time.monotonic() - started)
+                    if decoded:
+                        result = await asyncio.to_thread(self.ingestor.ingest, decoded)
+                        inserted += result["inserted"]
+                    await asyncio.to_thread(
+                        self._update_shard, shard_id,
+                        checkpoint_block=window_end, events_inserted=inserted
+                    )
+                    cursor = window_end + 1
+            except Exception as e:
+                logger.error(f"❌ Backfill shard {shard.from_block}-{shard.to_block} failed: {e}", exc_info=True)
+                await asyncio.to_thread(
+                    self._update_shard, shard_id, status="failed", last_error=str(e)[:1000]
+                )
+                return {"shard_id": shard_id, "status": "failed", "inserted": inserted}
+
+            if stop_at < shard.to_block:
+                # Released with its checkpoint; the next run carries on from there.
+                await asyncio.to_thread(self._update_shard, shard_id, status="pending")
+                return {"shard_id": shard_id, "status": "completed", "inserted": inserted}
+
+            await asyncio.to_thread(self._update_shard, shard_id, status="completed")
+            logger.info(f"✅ Backfill shard {shard.from_block}-{shard.to_block} done ({inserted} events)")
+            return {"shard_id": shard_id, "status": "completed", "inserted": inserted}
+
+    async def run(self, from_block: int, to_block: int) -> Dict[str, Any]:
+        if to_block < from_block:
+            return {"status": "empty", "shards": 0}
+
+        shard_ids = await asyncio.to_thread(self._load_or_create_shards, from_block, to_block)
+
+        logger.info(
+            f"🔄 Backfilling blocks {from_block}-{to_block}: "
+            f"{len(shard_ids)} pending shards, concurrency {self.concurrency}"
+        )
+        semaphore = asyncio.Semaphore(self.concurrency)
+        results = await asyncio.gather(
+            *(self._run_shard(sid, to_block, semaphore) for sid in shard_ids)
+        )
+
+        failed = [r for r in results if r["status"] == "failed"]
+        busy = [r for r in results if r["status"] == "busy"]
+        return {
+            "status": "partial" if failed or busy else "completed",
+            "from_block": from_block,
+            "to_block": to_block,
+            "shards": len(shard_ids),
+            "failed_shards": len(failed),
+            "busy_shards": len(busy),
+            "events_inserted": sum(r["inserted"] for r in results),
+        }
+
+backfill_engine = BackfillEngine()
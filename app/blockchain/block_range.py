@@ -0,0 +1,88 @@
+from typing import Optional
+import asyncio
+import logging
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Substrings RPC providers use when a getLogs window is too large or too slow.
+RANGE_ERROR_MARKERS = (
+    "too many",
+    "more than",
+    "limit exceeded",
+    "response size",
+    "range is too large",
+    "range too large",
+    "block range",
+    "exceed maximum",
+    "timeout",
+    "timed out",
+)
+
+class AdaptiveBlockRange:
+    """
+    Sizes eth_getLogs windows from the feedback of previous requests.
+
+    The window doubles while responses come back small and fast, halves when a
+    response is heavy or the RPC rejects the range, and never exceeds
+    BLOCKCHAIN_BATCH_SIZE.
+    """
+
+    def __init__(
+        self,
+        initial_size: int = 100,
+        min_size: int = 1,
+        max_size: Optional[int] = None,
+        target_logs: int = 2000,
+        target_seconds: float = 5.0,
+        catch_up_interval: float = 0.5,
+    ):
+        self.max_size = max_size or settings.BLOCKCHAIN_BATCH_SIZE
+        self.min_size = min(min_size, self.max_size)
+        self.size = max(self.min_size, min(initial_size, self.max_size))
+        self.target_logs = target_logs
+        self.target_seconds = target_seconds
+        self.catch_up_interval = catch_up_interval
+
+    def next_window(self, from_block: int, head_block: int) -> int:
+        return min(from_block + self.size - 1, head_block)
+
+    def record_success(self, log_count: int, elapsed: float) -> None:
+        if log_count > self.target_logs or elapsed > self.target_seconds:
+            self._shrink()
+        elif log_count < self.target_logs / 2 and elapsed < self.target_seconds / 2:
+            self._grow()
+
+    def record_failure(self, error: Exception) -> bool:
+        """Shrink on range/timeout errors; returns False for errors it can't fix."""
+        if not self.is_range_error(error):
+            return False
+        if self.size == self.min_size:
+            return False
+        self._shrink()
+        return True
+
+    def poll_delay(self, blocks_behind: int, poll_interval: float) -> float:
+        if blocks_behind > self.size:
+            return self.catch_up_interval
+        return poll_interval
+
+    @staticmethod
+    def is_range_error(error: Exception) -> bool:
+        if isinstance(error, (TimeoutError, asyncio.TimeoutError)):
+            return True
+        message = str(error).lower()
+        return any(marker in message for marker in RANGE_ERROR_MARKERS)
+
+    def _grow(self) -> None:
+        new_size = min(self.size * 2, self.max_size)
+        if new_size != self.size:
+            logger.debug(f"📈 Block range grown {self.size} -> {new_size}")
+            self.size = new_size
+
+    def _shrink(self) -> None:
+        new_size = max(self.size // 2, self.min_size)
+        if new_size != self.size:
+            logger.info(f"📉 Block range shrunk {self.size} -> {new_size}")
+            self.size = new_size
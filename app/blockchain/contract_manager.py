@@ -1,118 +1,58 @@
 from web3 import Web3
 from web3.contract import Contract
-from typing import Optional, Dict, Any, List
+from hexbytes import HexBytes
+from typing import Optional, Dict, Any, Iterable, List, Set, Tuple
 import json
 from pathlib import Path
 import logging
+import threading
 
 from .web3_client import web3_client
+from .event_decoder import EventDecoder
+from .abi_store import abi_store
 
 logger = logging.getLogger(__name__)
 
+# Personal funds are per-user clones deployed by the factory; they have no
+# address in contracts.json and are watched once their FundCreated is seen.
+FUND_CLONE_ABI = "fund"
+
 class ContractManager:
     def __init__(self):
         self.contracts: Dict[str, Contract] = {}
         self.abis: Dict[str, List] = {}
+        self.decoders: Dict[str, Dict[bytes, EventDecoder]] = {}
+        self.function_selectors: Dict[str, Dict[str, str]] = {}
+        self._abi_digests: Dict[str, str] = {}
+        self._log_routes: Optional[Dict[Tuple[str, bytes], Tuple[str, str]]] = None
+        self._clones: Dict[str, Set[str]] = {}
+        self._clones_lock = threading.Lock()
         self._load_abis()
+        self._build_topic_index()
     
     def _load_abis(self):
-        self.abis["token"] = [
-            {
-                "anonymous": False,
-                "inputs": [
-                    {"indexed": True, "name": "sender", "type": "address"},
-                    {"indexed": True, "name": "receiver", "type": "address"},
-                    {"indexed": False, "name": "value", "type": "uint256"}
-                ],
-                "name": "Transfer",
-                "type": "event"
-            },
-            {
-                "anonymous": False,
-                "inputs": [
-                    {"indexed": True, "name": "account", "type": "address"},
-                    {"indexed": False, "name": "amount", "type": "uint256"},
-                    {"indexed": False, "name": "totalBurns", "type": "uint256"},
-                    {"indexed": False, "name": "timestamp", "type": "uint256"}
-                ],
-                "name": "TokensBurned",
-                "type": "event"
-            },
-            {
-                "anonymous": False,
-                "inputs": [
-                    {"indexed": True, "name": "account", "type": "address"},
-                    {"indexed": False, "name": "amount", "type": "uint256"},
-                    {"indexed": False, "name": "totalRenews", "type": "uint256"},
-                    {"indexed": False, "name": "timestamp", "type": "uint256"}
-                ],
-                "name": "TokensRenewed",
-                "type": "event"
-            }
-        ]
-
-        self.abis["factory"] = [
-            {
-                "anonymous": False,
-                "inputs": [
-                    {"indexed": True, "name": "fundAddress", "type": "address"},
-                    {"indexed": True, "name": "owner", "type": "address"},
-                    {"indexed": False, "name": "initialDeposit", "type": "uint256"},
-                    {"indexed": False, "name": "timestamp", "type": "uint256"}
-                ],
-                "name": "FundCreated",
-                "type": "event"
-            }
-        ]
-
-        self.abis["governance"] = [
-            {
-                "anonymous": False,
-                "inputs": [
-                    {"indexed": True, "name": "proposalId", "type": "uint256"},
-                    {"indexed": True, "name": "proposer", "type": "address"},
-                    {"indexed": False, "name": "title", "type": "string"},
-                    {"indexed": False, "name": "proposalType", "type": "uint8"}
-                ],
-                "name": "ProposalCreated",
-                "type": "event"
-            },
-            {
-                "anonymous": False,
-                "inputs": [
-                    {"indexed": True, "name": "proposalId", "type": "uint256"},
-                    {"indexed": True, "name": "voter", "type": "address"},
-                    {"indexed": False, "name": "support", "type": "bool"},
-                    {"indexed": False, "name": "votingPower", "type": "uint256"}
-                ],
-                "name": "VoteCast",
-                "type": "event"
-            }
+        self.abis, self._abi_digests = abi_store.load()
+        logger.info(f"📚 Contract ABIs loaded: {', '.join(sorted(self.abis)) or 'none'}")
+        
+        configured = (web3_client.network_config or {}).get("contracts", {})
+        missing = [
+            name for name in configured
+            if name not in self.abis and web3_client.get_contract_address(name)
         ]
-
-        self.abis["fund"] = [
-            {
-                "anonymous": False,
-                "inputs": [
-                    {"indexed": True, "name": "owner", "type": "address"},
-                    {"indexed": False, "name": "grossAmount", "type": "uint256"},
-                    {"indexed": False, "name": "feeAmount", "type": "uint256"},
-                    {"indexed": False, "name": "netToFund", "type": "uint256"}
-                ],
-                "name": "Deposited",
-                "type": "event"
-            },
-            {
-                "anonymous": False,
-                "inputs": [
-                    {"indexed": True, "name": "owner", "type": "address"},
-                    {"indexed": False, "name": "totalBalance", "type": "uint256"}
-                ],
-                "name": "RetirementStarted",
-                "type": "event"
+        if missing:
+            logger.warning(f"⚠️ No ABI artifact for {', '.join(missing)}; their events won't be indexed")
+    
+    def _build_topic_index(self):
+        """topic0 -> EventDecoder and selector -> function name, per contract (disk-cached)."""
+        compiled = abi_store.compiled(self._abi_digests, self.abis)
+        for contract_name, entry in compiled.items():
+            self.decoders[contract_name] = {
+                decoder.topic: decoder
+                for decoder in (EventDecoder.from_spec(spec) for spec in entry["events"])
             }
-        ]
-        logger.info("📚 Contract ABIs loaded")
+            self.function_selectors[contract_name] = entry["functions"]
+        total = sum(len(index) for index in self.decoders.values())
+        logger.info(f"🧭 Topic index built: {total} events")
     
     def get_contract(self, contract_name: str) -> Optional[Contract]:
         if contract_name in self.contracts:
@@ -141,26 +81,114 @@ class ContractManager:
             logger.error(f"Error loading contract {contract_name}: {e}")
             return None
     
+    def watch_clones(self, contract_name: str, addresses: Iterable[str]) -> List[str]:
+        """
+        Add clone contracts (same ABI, many addresses) to the log filter and
+        dispatch table. Returns the addresses that were not watched yet.
+        """
+        if contract_name not in self.decoders:
+            return []
+        with self._clones_lock:
+            watched = self._clones.setdefault(contract_name, set())
+            added = [a for a in dict.fromkeys(addresses) if a and a.lower() not in watched]
+            if added:
+                watched.update(a.lower() for a in added)
+                self._log_routes = None
+        return added
+    
+    def get_clone_filter_params(self, contract_name: str, addresses: List[str]) -> Dict[str, Any]:
+        topics = sorted(self.decoders.get(contract_name, {}))
+        return {
+            "address": [Web3.to_checksum_address(a) for a in addresses],
+            "topics": [["0x" + topic.hex() for topic in topics]],
+        }
+    
+    def get_log_routes(self) -> Dict[Tuple[str, bytes], Tuple[str, str]]:
+        """
+        Dispatch table (contract address, topic0) -> (contract name, event name)
+        for every watched contract that has both an address and an ABI, plus
+        every watched clone.
+        """
+        routes = self._log_routes
+        if routes:
+            return routes
+        
+        # Built under the clone lock, so a clone added meanwhile cannot be
+        # lost to a table that was being built without it.
+        with self._clones_lock:
+            routes = {}
+            for contract_name, index in self.decoders.items():
+                address = web3_client.get_contract_address(contract_name)
+                if not address:
+                    continue
+                for topic, decoder in index.items():
+                    routes[(address.lower(), topic)] = (contract_name, decoder.name)
+            for contract_name, addresses in self._clones.items():
+                for address in addresses:
+                    for topic, decoder in self.decoders[contract_name].items():
+                        routes[(address, topic)] = (contract_name, decoder.name)
+            if routes:
+                self._log_routes = routes
+        if routes:
+            logger.debug(f"🧭 Log dispatch table built: {len(routes)} routes")
+        return routes
+    
+    def get_log_filter_params(self, include_clones: bool = True) -> Dict[str, Any]:
+        routes = self.get_log_routes()
+        addresses = sorted({address for address, _ in routes})
+        if not include_clones:
+            with self._clones_lock:
+                clones = set().union(*self._clones.values())
+            addresses = [a for a in addresses if a not in clones]
+        topics = sorted({topic for _, topic in routes})
+        return {
+            "address": [Web3.to_checksum_address(a) for a in addresses],
+            "topics": [["0x" + topic.hex() for topic in topics]],
+        }
+    
+    def _decode(self, log: Dict, routes: Dict[Tuple[str, bytes], Tuple[str, str]]) -> Optional[Dict]:
+        topics = log.get("topics") or []
+        if not topics:
+            return None
+        topic0 = bytes(HexBytes(topics[0]))
+        route = routes.get((log["address"].lower(), topic0))
+        if not route:
+            return None
+        contract_name, event_name = route
+        try:
+            return self.decoders[contract_name][topic0].decode(log)
+        except Exception as e:
+            logger.error(f"Error decoding {event_name} log: {e}")
+            return None
+    
+    def decode_log(self, log: Dict) -> Optional[Dict]:
+        return self._decode(log, self.get_log_routes())
+    
+    def decode_logs(self, logs: List[Dict]) -> List[Dict]:
+        """Batch decode; logs that aren't ours or don't decode are dropped."""
+        routes = self.get_log_routes()
+        decoded = []
+        for log in logs:
+            event = self._decode(log, routes)
+            if event is not None:
+                decoded.append(event)
+        return decoded
+    
     def parse_event_log(self, contract_name: str, log: Dict) -> Optional[Dict]:
-        contract = self.get_contract(contract_name)
-        if not contract:
+        topics = log.get("topics") or []
+        decoder = self.decoders.get(contract_name, {}).get(bytes(HexBytes(topics[0]))) if topics else None
+        if not decoder:
             return None
         
         try:
-            for event_abi in contract.events:
-                try:
-                    event = contract.events[event_abi]
-                    parsed = event.process_log(log)
-                    return {
-                        "event_name": parsed["event"],
-                        "args": dict(parsed["args"]),
-                        "transaction_hash": parsed["transactionHash"].hex(),
-                        "block_number": parsed["blockNumber"],
-                        "log_index": parsed["logIndex"]
-                    }
-                except:
-                    continue
-            return None
+            parsed = decoder.decode(log)
+            return {
+                "event_name": parsed["event"],
+                "args": dict(parsed["args"]),
+                "transaction_hash": parsed["transactionHash"].to_0x_hex(),
+                "block_number": parsed["blockNumber"],
+                "log_index": parsed["logIndex"]
+            }
             
         except Exception as e:
             logger.error(f"Error parsing event log: {e}")
@@ -0,0 +1,91 @@
+from eth_abi import decode as abi_decode
+from eth_utils import event_abi_to_log_topic, to_checksum_address
+from eth_utils.abi import collapse_if_tuple
+from hexbytes import HexBytes
+from web3.datastructures import AttributeDict
+from typing import Any, Dict, List, Tuple
+
+# Indexed values of these types are stored as keccak hashes, not ABI-encoded.
+HASHED_TOPIC_TYPES = ("string", "bytes")
+
+class EventDecoder:
+    """
+    Decoder for one event ABI, compiled once at ABI load.
+
+    Produces the same shape as ContractEvent.process_log (event, args,
+    transactionHash, ...) but goes straight from topics/data to values with
+    eth_abi, without looking the event up or re-parsing the ABI per log.
+    """
+
+    def __init__(self, event_abi: Dict[str, Any]):
+        self.name: str = event_abi["name"]
+        self.topic: bytes = event_abi_to_log_topic(event_abi)
+        inputs = event_abi.get("inputs", [])
+        self.arg_names: List[str] = [i["name"] for i in inputs]
+        self.indexed: List[Tuple[str, str]] = [
+            (i["name"], collapse_if_tuple(i)) for i in inputs if i.get("indexed")
+        ]
+        data_inputs = [i for i in inputs if not i.get("indexed")]
+        self.data_names: List[str] = [i["name"] for i in data_inputs]
+        self.data_types: List[str] = [collapse_if_tuple(i) for i in data_inputs]
+
+    def to_spec(self) -> Dict[str, Any]:
+        """Plain-JSON form of the compiled decoder, for the on-disk ABI cache."""
+        return {
+            "name": self.name,
+            "topic": "0x" + self.topic.hex(),
+            "arg_names": self.arg_names,
+            "indexed": [list(pair) for pair in self.indexed],
+            "data_names": self.data_names,
+            "data_types": self.data_types,
+        }
+
+    @classmethod
+    def from_spec(cls, spec: Dict[str, Any]) -> "EventDecoder":
+        decoder = cls.__new__(cls)
+        decoder.name = spec["name"]
+        decoder.topic = bytes(HexBytes(spec["topic"]))
+        decoder.arg_names = spec["arg_names"]
+        decoder.indexed = [tuple(pair) for pair in spec["indexed"]]
+        decoder.data_names = spec["data_names"]
+        decoder.data_types = spec["data_types"]
+        return decoder
+
+    @staticmethod
+    def _normalize(abi_type: str, value: Any) -> Any:
+        if abi_type == "address":
+            return to_checksum_address(value)
+        if abi_type == "address[]" or (abi_type.startswith("address[") and abi_type.endswith("]")):
+            return [to_checksum_address(v) for v in value]
+        return value
+
+    def _decode_topic(self, abi_type: str, topic: bytes) -> Any:
+        if abi_type in HASHED_TOPIC_TYPES or abi_type.endswith("]") or abi_type.startswith("("):
+            return HexBytes(topic)
+        return self._normalize(abi_type, abi_decode([abi_type], topic)[0])
+
+    def decode(self, log: Dict[str, Any]) -> AttributeDict:
+        topics = [HexBytes(t) for t in log["topics"]]
+        if len(topics) - 1 != len(self.indexed):
+            raise ValueError(
+                f"{self.name}: expected {len(self.indexed)} indexed topics, got {len(topics) - 1}"
+            )
+
+        args: Dict[str, Any] = {
+            name: self._decode_topic(abi_type, topic)
+            for (name, abi_type), topic in zip(self.indexed, topics[1:])
+        }
+        values = abi_decode(self.data_types, HexBytes(log["data"]))
+        for name, abi_type, value in zip(self.data_names, self.data_types, values):
+            args[name] = self._normalize(abi_type, value)
+
+        return AttributeDict({
+            "args": AttributeDict({name: args[name] for name in self.arg_names}),
+            "event": self.name,
+            "logIndex": log["logIndex"],
+            "transactionIndex": log["transactionIndex"],
+            "transactionHash": HexBytes(log["transactionHash"]),
+            "address": to_checksum_address(log["address"]),
+            "blockHash": HexBytes(log["blockHash"]),
+            "blockNumber": log["blockNumber"],
+        })
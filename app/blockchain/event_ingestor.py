@@ -0,0 +1,230 @@
+from sqlalchemy.orm import Session
+from typing import Callable, Dict, List, Optional, Any
+from datetime import datetime
+import logging
+
+from .web3_client import web3_client
+from .contract_manager import contract_manager, FUND_CLONE_ABI
+from app.core.config import settings
+from app.db.session import ListenerSessionLocal
+from app.services.blockchain_service import blockchain_service
+from app.schemas.blockchain import BlockchainEventCreate
+
+logger = logging.getLogger(__name__)
+
+class EventBuildError(Exception):
+    """A decoded log could not be turned into an event; the window must be retried."""
+
+class EventIngestor:
+    """
+    Batched write stage for decoded contract logs.
+
+    Collects every decoded log of a block range and stores them with one
+    multi-row INSERT ... ON CONFLICT DO NOTHING per chunk, in one session.
+    The blockchain_events partition for a window is created before its first
+    insert; the covered range is cached so the catalog is rarely queried. A
+    window below the oldest attached partition (archived) is rejected.
+    A window is all-or-nothing: if any decoded log cannot be built, nothing
+    is stored and the sync cursor stays put, so the whole window is retried.
+    """
+
+    def __init__(
+        self,
+        chunk_size: int = 500,
+        session_factory: Callable[[], Session] = ListenerSessionLocal
+    ):
+        self.chunk_size = chunk_size
+        self.session_factory = session_factory
+        self._partitioned_from: Optional[int] = None
+        self._partitioned_to = -1
+
+    def fetch_window(
+        self,
+        from_block: int,
+        to_block: int,
+        clones_until: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        One eth_getLogs over every watched address and topic0, routed by
+        ContractManager. Personal fund clones known to the database are part of
+        the filter; a fund created inside this window was not, so its logs are
+        fetched separately from its creation block up to clones_until (the end
+        of the whole sync run; to_block by default).
+        """
+        known = self._known_clones()
+        contract_manager.watch_clones(FUND_CLONE_ABI, known)
+        params = contract_manager.get_log_filter_params()
+        if not params["address"]:
+            logger.warning("No watched contracts available, skipping window")
+            return []
+
+        logs = web3_client.get_logs(
+            from_block,
+            to_block,
+            params["address"],
+            params["topics"],
+        )
+        decoded = contract_manager.decode_logs(logs)
+
+        known_lower = {address.lower() for address in known}
+        created: Dict[str, int] = {}
+        for event in decoded:
+            address = event['args'].get('fundAddress') if event['event'] == 'FundCreated' else None
+            if address and address.lower() not in known_lower:
+                created.setdefault(address, event['blockNumber'])
+        if created:
+            contract_manager.watch_clones(FUND_CLONE_ABI, created)
+            decoded.extend(self._fetch_clone_logs(created, clones_until or to_block))
+        return decoded
+
+    def _known_clones(self) -> List[str]:
+        db = self.session_factory()
+        try:
+            return blockchain_service.get_fund_clone_addresses(db)
+        finally:
+            db.close()
+
+    def _fetch_clone_logs(self, created: Dict[str, int], until: int) -> List[Dict[str, Any]]:
+        """Catch-up logs of newly discovered clones, in shard-sized ranges."""
+        params = contract_manager.get_clone_filter_params(FUND_CLONE_ABI, list(created))
+        step = settings.BLOCKCHAIN_BACKFILL_SHARD_SIZE
+        logs: List[Dict] = []
+        start = min(created.values())
+        while start <= until:
+            end = min(start + step - 1, until)
+            logs.extend(web3_client.get_logs(start, end, params["address"], params["topics"]))
+            start = end + 1
+        logger.info(f"🧬 Watching {len(created)} new fund clones ({len(logs)} catch-up logs)")
+        return contract_manager.decode_logs(logs)
+
+    def build_event(self, event_data: Dict[str, Any]) -> BlockchainEventCreate:
+        block = web3_client.get_block(event_data['blockNumber'])
+        if not block:
+            raise EventBuildError(f"Block {event_data['blockNumber']} unavailable")
+
+        return BlockchainEventCreate(
+            event_type=event_data['event'],
+            contract_address=event_data['address'],
+            event_data=dict(event_data['args']),
+            transaction_hash=event_data['transactionHash'].to_0x_hex(),
+            block_number=event_data['blockNumber'],
+            block_timestamp=datetime.fromtimestamp(block['timestamp']),
+            log_index=event_data['logIndex']
+        )
+
+    def ingest(
+        self,
+        decoded_events: List[Dict[str, Any]],
+        synced_to: Optional[int] = None,
+        confirmed: bool = True
+    ) -> Dict[str, int]:
+        """
+        Store a window of decoded logs. With synced_to, the per-contract sync
+        cursor is advanced to that block in the same transaction, so the cursor
+        and the events either both land or neither does, and streamed logs up
+        to that block that no confirmed window re-read are dropped as orphans.
+        Unconfirmed logs (confirmed=False, from the head stream) are stored but
+        not processed until a confirmed window replaces them.
+        """
+        if decoded_events:
+            web3_client.prefetch_blocks(e['blockNumber'] for e in decoded_events)
+        events: List[BlockchainEventCreate] = []
+        failures: List[str] = []
+        for event_data in decoded_events:
+            try:
+                events.append(self.build_event(event_data))
+            except Exception as e:
+                failures.append(f"{event_data.get('transactionHash')}:{event_data.get('logIndex')} ({e})")
+        if failures:
+            # Raise before touching the database: storing the rest and moving
+            # the cursor would drop these logs for good.
+            raise EventBuildError(
+                f"{len(failures)} of {len(decoded_events)} logs could not be built: "
+                + "; ".join(failures[:5])
+            )
+
+        result = {
+            "received": len(decoded_events),
+            "inserted": 0,
+            "skipped": 0,
+        }
+        if not events and synced_to is None:
+            return result
+
+        db = self.session_factory()
+        try:
+            by_contract: Dict[str, int] = {}
+            if events:
+                self._ensure_partitions(
+                    db,
+                    min(e.block_number for e in events),
+                    max(e.block_number for e in events)
+                )
+                bulk = blockchain_service.record_events_bulk(
+                    db, events, self.chunk_size, commit=False, confirmed=confirmed
+                )
+                result["inserted"] = bulk["inserted"]
+                result["skipped"] = bulk["skipped"]
+                by_contract = bulk["by_contract"]
+            if synced_to is not None:
+                blockchain_service.purge_unconfirmed(db, synced_to)
+                self._advance_cursor(db, synced_to, by_contract)
+            db.commit()
+        except Exception:
+            db.rollback()
+            # Partitions may have been archived since they were cached.
+            self._partitioned_from, self._partitioned_to = None, -1
+            raise
+        finally:
+            db.close()
+        return result
+
+    def _ensure_partitions(self, db: Session, from_block: int, to_block: int) -> None:
+        if (
+            self._partitioned_from is not None
+            and self._partitioned_from <= from_block
+            and to_block <= self._partitioned_to
+        ):
+            return
+        size = settings.BLOCKCHAIN_EVENTS_PARTITION_BLOCKS
+        # One partition of headroom, so the DDL rarely lands on the hot path.
+        up_to = max(to_block, self._partitioned_to) + size
+        blockchain_service.ensure_event_partitions(db, up_to, size, from_block)
+        if self._partitioned_from is None or from_block < self._partitioned_from:
+            self._partitioned_from = from_block
+        self._partitioned_to = (up_to // size + 1) * size - 1
+
+    def retract(self, raw_logs: List[Dict[str, Any]]) -> int:
+        """Delete events whose logs the node reported as removed (reorged out)."""
+        keys = [(log['transactionHash'].to_0x_hex(), log['logIndex']) for log in raw_logs]
+        if not keys:
+            return 0
+        db = self.session_factory()
+        try:
+            return blockchain_service.delete_events_by_keys(db, keys)
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+
+    def _advance_cursor(self, db: Session, block_number: int, by_contract: Dict[str, int]) -> None:
+        block = web3_client.get_block(block_number)
+        block_hash = block['hash'].to_0x_hex() if block else None
+        if block_hash:
+            blockchain_service.record_block_hash(
+                db,
+                block_number,
+                block_hash,
+                block['parentHash'].to_0x_hex(),
+                settings.BLOCKCHAIN_REORG_MAX_DEPTH
+            )
+        blockchain_service.advance_sync_state(
+            db,
+            contract_manager.get_log_filter_params(include_clones=False)["address"],
+            block_number,
+            block_hash,
+            by_contract
+        )
+
+event_ingestor = EventIngestor()
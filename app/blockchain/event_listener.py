@@ -1,13 +1,16 @@
 from typing import Optional, Callable, Dict, Any, List
-from datetime import datetime
 import asyncio
 import logging
+import time
 
 from .web3_client import web3_client
-from .contract_manager import contract_manager
-from app.db.session import SessionLocal
+from .block_range import AdaptiveBlockRange
+from .event_ingestor import event_ingestor
+from .reorg import reorg_detector
+from .log_stream import log_stream
+from app.core.config import settings
+from app.db.session import ListenerSessionLocal
 from app.services.blockchain_service import blockchain_service
-from app.schemas.blockchain import BlockchainEventCreate
 
 logger = logging.getLogger(__name__)
 
@@ -16,7 +19,9 @@ class EventListener:
         self.is_running = False
         self.last_processed_block = 0
         self.poll_interval = 12 
-        self.batch_size = 100 
+        self.confirmations = settings.BLOCKCHAIN_CONFIRMATIONS
+        self.block_range = AdaptiveBlockRange()
+        self._stream_task: Optional[asyncio.Task] = None
     
     async def start(self):
         if self.is_running:
@@ -25,16 +30,21 @@ class EventListener:
         
         self.is_running = True
         logger.info("🎧 Starting blockchain event listener")
-        db = SessionLocal()
+        db = ListenerSessionLocal()
         try:
             status = blockchain_service.get_sync_status(db)
             self.last_processed_block = status.get("last_synced_block", 0)
         finally:
             db.close()
+        if log_stream.enabled:
+            self._stream_task = asyncio.create_task(log_stream.run())
+            logger.info("⚡ WebSocket log stream enabled, polling kept as gap-filler")
         while self.is_running:
             try:
-                await self._process_new_blocks()
-                await asyncio.sleep(self.poll_interval)
+                blocks_behind = await self._process_new_blocks()
+                await asyncio.sleep(
+                    self.block_range.poll_delay(blocks_behind, self.poll_interval)
+                )
             except Exception as e:
                 logger.error(f"Error in event listener: {e}", exc_info=True)
                 await asyncio.sleep(self.poll_interval * 2)
@@ -42,112 +52,58 @@ class EventListener:
     async def stop(self):
         logger.info("🛑 Stopping event listener")
         self.is_running = False
+        if self._stream_task:
+            await log_stream.stop()
+            self._stream_task.cancel()
+            try:
+                await self._stream_task
+            except asyncio.CancelledError:
+                pass
+            self._stream_task = None
     
-    async def _process_new_blocks(self):
+    async def _process_new_blocks(self) -> int:
+        """Process one window and return how many blocks remain behind head."""
         if not web3_client.is_connected():
             logger.warning("Web3 not connected, skipping")
-            return
+            return 0
+        
+        if self.last_processed_block:
+            fork_block = await asyncio.to_thread(reorg_detector.check)
+            if fork_block is not None:
+                self.last_processed_block = fork_block
         
-        current_block = web3_client.get_latest_block()
+        current_block = await web3_client.get_latest_block_async() - self.confirmations
         if current_block <= self.last_processed_block:
-            return
+            return 0
 
         from_block = self.last_processed_block + 1
-        to_block = min(from_block + self.batch_size, current_block)
+        to_block = self.block_range.next_window(from_block, current_block)
         logger.info(f"📦 Processing blocks {from_block} to {to_block}")
-        await self._process_token_events(from_block, to_block)
-        await self._process_factory_events(from_block, to_block)
-        await self._process_governance_events(from_block, to_block)
-        await self._process_fund_events(from_block, to_block)
-        
-        self.last_processed_block = to_block
-        logger.info(f"✅ Processed up to block {to_block}")
-    async def _process_token_events(self, from_block: int, to_block: int):
-        contract = contract_manager.get_contract("token")
-        if not contract:
-            return
-        
+        started = time.monotonic()
         try:
-            transfer_filter = contract.events.Transfer.create_filter(
-                from_block=from_block,
-                to_block=to_block
-            )
-            for event in transfer_filter.get_all_entries():
-                await self._save_event("Transfer", "token", event)
-            if hasattr(contract.events, 'TokensBurned'):
-                burn_filter = contract.events.TokensBurned.create_filter(
-                    from_block=from_block,
-                    to_block=to_block
-                )
-                for event in burn_filter.get_all_entries():
-                    await self._save_event("TokensBurned", "token", event)
-            if hasattr(contract.events, 'TokensRenewed'):
-                renew_filter = contract.events.TokensRenewed.create_filter(
-                    from_block=from_block,
-                    to_block=to_block
-                )
-                for event in renew_filter.get_all_entries():
-                    await self._save_event("TokensRenewed", "token", event)
+            decoded = await self._fetch_window_events(from_block, to_block)
         except Exception as e:
-            logger.error(f"Error processing token events: {e}", exc_info=True)
-    
-    async def _process_factory_events(self, from_block: int, to_block: int):
-        contract = contract_manager.get_contract("factory")
-        if not contract:
-            return
+            if self.block_range.record_failure(e):
+                logger.warning(
+                    f"⚠️ Window {from_block}-{to_block} rejected ({e}), "
+                    f"retrying with {self.block_range.size} blocks"
+                )
+                return current_block - self.last_processed_block
+            raise
+        self.block_range.record_success(len(decoded), time.monotonic() - started)
         
-        try:
-            fund_filter = contract.events.FundCreated.create_filter(
-                from_block=from_block,
-                to_block=to_block
+        result = await asyncio.to_thread(event_ingestor.ingest, decoded, to_block)
+        if decoded:
+            logger.info(
+                f"📝 Blocks {from_block}-{to_block}: {result['inserted']} inserted, "
+                f"{result['skipped']} already stored"
             )
-            for event in fund_filter.get_all_entries():
-                await self._save_event("FundCreated", "factory", event)
-        except Exception as e:
-            logger.error(f"Error processing factory events: {e}", exc_info=True)
-    
-    async def _process_governance_events(self, from_block: int, to_block: int):
-        contract = contract_manager.get_contract("governance")
-        if not contract:
-            return
         
-        try:
-            proposal_filter = contract.events.ProposalCreated.create_filter(
-                from_block=from_block,
-                to_block=to_block
-            )
-            
-            for event in proposal_filter.get_all_entries():
-                await self._save_event("ProposalCreated", "governance", event)
-            vote_filter = contract.events.VoteCast.create_filter(
-                from_block=from_block,
-                to_block=to_block
-            )
-            for event in vote_filter.get_all_entries():
-                await self._save_event("VoteCast", "governance", event)
-                
-        except Exception as e:
-            logger.error(f"Error processing governance events: {e}", exc_info=True)
-    async def _process_fund_events(self, from_block: int, to_block: int):
-        pass
-    async def _save_event(self, event_name: str, contract_type: str, event_data: Dict):
-        db = SessionLocal()
-        try:
-            block = web3_client.get_block(event_data['blockNumber'])
-            event_create = BlockchainEventCreate(
-                event_type=event_name,
-                contract_address=event_data['address'],
-                event_data=dict(event_data['args']),
-                transaction_hash=event_data['transactionHash'].hex(),
-                block_number=event_data['blockNumber'],
-                block_timestamp=datetime.fromtimestamp(block['timestamp']),
-                log_index=event_data['logIndex']
-            )
-            blockchain_service.record_event(db, event_create)
-            logger.info(f"📝 Saved event: {event_name} from {contract_type}")
-        except Exception as e:
-            logger.error(f"Error saving event: {e}", exc_info=True)
-        finally:
-            db.close()
+        self.last_processed_block = to_block
+        logger.info(f"✅ Processed up to block {to_block}")
+        return current_block - to_block
+    
+    async def _fetch_window_events(self, from_block: int, to_block: int) -> List[Dict]:
+        return await asyncio.to_thread(event_ingestor.fetch_window, from_block, to_block)
 
 event_listener = EventListener()
\ No newline at end of file
@@ -0,0 +1,125 @@
+from sqlalchemy.orm import Session
+from typing import Callable, Dict, List, Any, Optional, Tuple
+import logging
+
+from app.core.config import settings
+from app.core.cache import response_cache
+from app.models.blockchain import BlockchainEvent
+from app.services.blockchain_service import blockchain_service
+
+logger = logging.getLogger(__name__)
+
+Deferred = List[Tuple[BlockchainEvent, str]]
+BatchHandler = Callable[[Session, List[BlockchainEvent]], Optional[Deferred]]
+
+class EventProcessor:
+    """
+    Applies stored blockchain events in batches.
+
+    Handlers are registered per event type and receive every claimed event of
+    that type at once. A batch is claimed with FOR UPDATE SKIP LOCKED, so any
+    number of workers can drain the backlog in parallel, and is flagged
+    processed with one UPDATE in the same transaction. A failing group is
+    rolled back (savepoint) and retried one event at a time, so a single bad
+    event cannot hold back the rest of its type. Events that still fail back
+    off exponentially and are dead-lettered after BLOCKCHAIN_EVENT_MAX_ATTEMPTS.
+    A handler returns the events it could not apply yet (e.g. a vote whose
+    proposal is not projected), with the reason; they take the same backoff
+    path instead of being flagged processed.
+    """
+
+    def __init__(self):
+        self.handlers: Dict[str, BatchHandler] = {}
+        self.cache_namespaces: Dict[str, Tuple[str, ...]] = {}
+
+    def register(
+        self,
+        event_type: str,
+        invalidates: Tuple[str, ...] = ()
+    ) -> Callable[[BatchHandler], BatchHandler]:
+        """invalidates: response cache namespaces to drop once the batch commits."""
+        def decorator(handler: BatchHandler) -> BatchHandler:
+            self.handlers[event_type] = handler
+            self.cache_namespaces[event_type] = invalidates
+            return handler
+        return decorator
+
+    def process_batch(self, db: Session, limit: int = 500) -> Dict[str, Any]:
+        events = blockchain_service.claim_unprocessed(db, limit)
+        if not events:
+            db.commit()
+            return {"claimed": 0, "processed": 0, "failed": 0, "deferred": 0, "dead_lettered": 0}
+
+        # Group by type, keeping groups in chain order of their first event.
+        groups: Dict[str, List[BlockchainEvent]] = {}
+        for event in events:
+            groups.setdefault(event.event_type, []).append(event)
+
+        done: List[int] = []
+        namespaces = set()
+        failures: Deferred = []
+        deferred: Deferred = []
+        for event_type, group in groups.items():
+            handler = self.handlers.get(event_type)
+            if handler:
+                error, pending = self._run(db, handler, group)
+                if error:
+                    logger.warning(f"Batch of {len(group)} {event_type} events failed ({error}), retrying one by one")
+                    pending = []
+                    succeeded = []
+                    for event in group:
+                        error, event_pending = self._run(db, handler, [event])
+                        if error:
+                            failures.append((event, error))
+                        else:
+                            pending.extend(event_pending)
+                            succeeded.append(event)
+                    group = succeeded
+                if pending:
+                    waiting = {event.id for event, _ in pending}
+                    group = [event for event in group if event.id not in waiting]
+                    deferred.extend(pending)
+                if group:
+                    namespaces.update(self.cache_namespaces.get(event_type, ()))
+            done.extend(event.id for event in group)
+
+        dead_lettered = sum(
+            blockchain_service.record_failure(
+                db, event, error,
+                settings.BLOCKCHAIN_EVENT_MAX_ATTEMPTS,
+                settings.BLOCKCHAIN_EVENT_RETRY_BASE_DELAY,
+                settings.BLOCKCHAIN_EVENT_RETRY_MAX_DELAY
+            )
+            for event, error in failures + deferred
+        )
+        blockchain_service.mark_processed_bulk(db, done)
+        db.commit()
+        if namespaces:
+            response_cache.invalidate(*namespaces)
+        return {
+            "claimed": len(events),
+            "processed": len(done),
+            "failed": len(failures),
+            "deferred": len(deferred),
+            "dead_lettered": dead_lettered
+        }
+
+    @staticmethod
+    def _run(
+        db: Session,
+        handler: BatchHandler,
+        events: List[BlockchainEvent]
+    ) -> Tuple[Optional[str], Deferred]:
+        """Run a handler in a savepoint; returns (error message, deferred events)."""
+        savepoint = db.begin_nested()
+        try:
+            pending = handler(db, events) or []
+            savepoint.commit()
+            return None, pending
+        except Exception as e:
+            savepoint.rollback()
+            if len(events) == 1:
+                logger.error(f"Error processing event {events[0].id} ({events[0].event_type}): {e}", exc_info=True)
+            return f"{type(e).__name__}: {e}", []
+
+event_processor = EventProcessor()
@@ -0,0 +1,136 @@
+from web3 import AsyncWeb3, WebSocketProvider
+from typing import Dict, List, Optional, Any
+import asyncio
+import logging
+import time
+
+from .web3_client import web3_client
+from .contract_manager import contract_manager
+from .event_ingestor import event_ingestor
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+class LogStream:
+    """
+    eth_subscribe("logs") feed for the watched contracts.
+
+    Streamed logs go through the same decode + EventIngestor.ingest path as
+    polled windows, in small micro-batches, but are stored unconfirmed: they
+    are visible right away and never processed until the polling loop re-reads
+    their block BLOCKCHAIN_CONFIRMATIONS deep, behind the reorg hash check.
+    The stream never moves the sync cursor; the polled window replaces each
+    streamed copy, and the ones it no longer returns are purged as orphans.
+    Logs the node re-sends with removed=true are retracted straight away.
+    """
+
+    def __init__(
+        self,
+        flush_interval: float = 0.25,
+        max_batch: int = 200,
+        max_backoff: float = 60.0
+    ):
+        self.flush_interval = flush_interval
+        self.max_batch = max_batch
+        self.max_backoff = max_backoff
+        self.is_running = False
+        self.connected = False
+        self.logs_received = 0
+        self.last_log_at: Optional[float] = None
+
+    @property
+    def url(self) -> Optional[str]:
+        if settings.BLOCKCHAIN_WS_URL:
+            return settings.BLOCKCHAIN_WS_URL
+        return (web3_client.network_config or {}).get("ws")
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.url)
+
+    async def run(self) -> None:
+        self.is_running = True
+        backoff = 1.0
+        while self.is_running:
+            try:
+                await self._consume()
+                backoff = 1.0
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"⚠️ Log stream disconnected ({e}), reconnecting in {backoff:.0f}s")
+            self.connected = False
+            if self.is_running:
+                await asyncio.sleep(backoff)
+                backoff = min(backoff * 2, self.max_backoff)
+
+    async def stop(self) -> None:
+        self.is_running = False
+
+    async def _consume(self) -> None:
+        params = contract_manager.get_log_filter_params()
+        if not params["address"]:
+            logger.warning("No watched contracts available, log stream idle")
+            await asyncio.sleep(self.max_backoff)
+            return
+
+        async with AsyncWeb3(WebSocketProvider(self.url)) as w3:
+            await w3.eth.subscribe("logs", params)
+            self.connected = True
+            logger.info(f"📡 Log stream subscribed to {len(params['address'])} contracts")
+
+            queue: asyncio.Queue = asyncio.Queue()
+            flusher = asyncio.create_task(self._flush_loop(queue))
+            try:
+                async for payload in w3.socket.process_subscriptions():
+                    if not self.is_running:
+                        break
+                    self.logs_received += 1
+                    self.last_log_at = time.time()
+                    queue.put_nowait(payload["result"])
+            finally:
+                flusher.cancel()
+                try:
+                    await flusher
+                except asyncio.CancelledError:
+                    pass
+                await self._flush(self._drain(queue))
+
+    def _drain(self, queue: asyncio.Queue) -> List[Dict[str, Any]]:
+        logs = []
+        while not queue.empty() and len(logs) < self.max_batch:
+            logs.append(queue.get_nowait())
+        return logs
+
+    async def _flush_loop(self, queue: asyncio.Queue) -> None:
+        while True:
+            logs = [await queue.get()]
+            await asyncio.sleep(self.flush_interval)
+            logs.extend(self._drain(queue))
+            await self._flush(logs)
+
+    async def _flush(self, logs: List[Dict[str, Any]]) -> None:
+        if not logs:
+            return
+        removed = [log for log in logs if log.get("removed")]
+        live = [log for log in logs if not log.get("removed")]
+        try:
+            if live:
+                decoded = contract_manager.decode_logs(live)
+                result = await asyncio.to_thread(event_ingestor.ingest, decoded, None, False)
+                logger.info(f"⚡ Streamed {result['inserted']} events ({result['skipped']} already stored)")
+            if removed:
+                await asyncio.to_thread(event_ingestor.retract, removed)
+        except Exception as e:
+            # The poller will pick these blocks up once they are confirmed.
+            logger.error(f"Error ingesting streamed logs: {e}", exc_info=True)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "enabled": self.enabled,
+            "connected": self.connected,
+            "logs_received": self.logs_received,
+            "last_log_at": self.last_log_at,
+        }
+
+log_stream = LogStream()
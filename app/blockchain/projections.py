@@ -0,0 +1,370 @@
+"""
+Projections: batch handlers that turn stored chain events into rows of the
+domain tables. They run inside EventProcessor's transaction, so a projection
+and its events' processed flag commit together; every write is an upsert on a
+natural key (fund address, chain proposal id, proposal+voter, tx hash and log
+index) or an absolute value recomputed from the chain, so replaying an event
+is harmless.
+Balance increments are only applied when the event's fund_transactions rows,
+keyed by (tx hash, log index, type), are inserted for the first time.
+Events that need a row that is not there yet (the owner's User, the fund, the
+proposal) are returned to EventProcessor as deferred, so they back off and
+retry instead of being flagged processed. Token events for wallets with no
+holder row are not deferred: most transfers involve wallets we never track.
+"""
+
+from sqlalchemy.orm import Session
+from sqlalchemy import func, case, literal_column
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from datetime import timedelta
+from decimal import Decimal
+from typing import Dict, Iterable, List
+import logging
+
+from .event_processor import event_processor, Deferred
+from app.core.config import settings
+from app.core.enums import FundTransactionType
+from app.models.blockchain import BlockchainEvent
+from app.models.user import User
+from app.models.personal_fund import PersonalFund, FundTransaction
+from app.models.governance import Proposal, Vote
+from app.models.token import TokenHolder, TokenActivity
+from app.services.counter_service import counter_service
+
+logger = logging.getLogger(__name__)
+
+ZERO_ADDRESS = "0x0000000000000000000000000000000000000000"
+USDC_UNIT = Decimal(10) ** 6
+TOKEN_UNIT = Decimal(10) ** 18
+
+def _units(value, unit: Decimal) -> Decimal:
+    return Decimal(int(value or 0)) / unit
+
+def _users_by_wallet(db: Session, wallets: Iterable[str]) -> Dict[str, User]:
+    lowered = {w.lower() for w in wallets if w}
+    if not lowered:
+        return {}
+    users = db.query(User).filter(func.lower(User.wallet_address).in_(lowered)).all()
+    return {u.wallet_address.lower(): u for u in users}
+
+def _holders_by_wallet(db: Session, wallets: Iterable[str]) -> Dict[str, TokenHolder]:
+    lowered = {w.lower() for w in wallets if w}
+    if not lowered:
+        return {}
+    holders = db.query(TokenHolder).filter(func.lower(TokenHolder.wallet_address).in_(lowered)).all()
+    return {h.wallet_address.lower(): h for h in holders}
+
+def _inserted(db: Session, stmt) -> bool:
+    """Run an upsert; True when it inserted a row (xmax is 0 only for fresh tuples)."""
+    return bool(db.execute(stmt.returning(literal_column("xmax = 0"))).scalar())
+
+def _funds_by_address(db: Session, addresses: Iterable[str]) -> Dict[str, PersonalFund]:
+    lowered = {a.lower() for a in addresses if a}
+    if not lowered:
+        return {}
+    funds = db.query(PersonalFund).filter(func.lower(PersonalFund.fund_address).in_(lowered)).all()
+    return {f.fund_address.lower(): f for f in funds}
+
+# ---------------------------------------------------------------------------
+# Funds
+# ---------------------------------------------------------------------------
+
+@event_processor.register("FundCreated", invalidates=("analytics",))
+def project_fund_created(db: Session, events: List[BlockchainEvent]) -> Deferred:
+    deferred: Deferred = []
+    users = _users_by_wallet(db, (e.event_data.get("owner") for e in events))
+    owned = {
+        fund.user_id: fund.fund_address.lower()
+        for fund in db.query(PersonalFund).filter(
+            PersonalFund.user_id.in_([u.id for u in users.values()])
+        ).all()
+    } if users else {}
+    for event in events:
+        data = event.event_data
+        user = users.get((data.get("owner") or "").lower())
+        if not user:
+            deferred.append((event, f"owner {data.get('owner')} has no user yet"))
+            continue
+        if owned.get(user.id, data["fundAddress"].lower()) != data["fundAddress"].lower():
+            deferred.append((event, f"user {user.id} already owns fund {owned[user.id]}"))
+            continue
+        owned[user.id] = data["fundAddress"].lower()
+        initial = _units(data.get("initialDeposit"), USDC_UNIT)
+        stmt = pg_insert(PersonalFund).values(
+            user_id=user.id,
+            fund_address=data["fundAddress"],
+            owner_address=data["owner"],
+            name=f"Retirement fund {data['fundAddress'][:10]}",
+            total_balance=initial,
+            available_balance=initial,
+            total_deposited=initial,
+            creation_tx_hash=event.transaction_hash,
+            creation_block_number=event.block_number,
+            created_at=event.block_timestamp,
+        )
+        if _inserted(db, stmt.on_conflict_do_update(
+            index_elements=[PersonalFund.fund_address],
+            set_={
+                "owner_address": stmt.excluded.owner_address,
+                "creation_tx_hash": stmt.excluded.creation_tx_hash,
+                "creation_block_number": stmt.excluded.creation_block_number,
+            }
+        )):
+            counter_service.add(db, "funds", {"total": 1, "active": 1})
+    return deferred
+
+@event_processor.register("Deposited", invalidates=("analytics",))
+def project_deposited(db: Session, events: List[BlockchainEvent]) -> Deferred:
+    deferred: Deferred = []
+    funds = _funds_by_address(db, (e.contract_address for e in events))
+    for event in events:
+        fund = funds.get(event.contract_address.lower())
+        if not fund:
+            deferred.append((event, f"fund {event.contract_address} not projected yet"))
+            continue
+        data = event.event_data
+        gross = _units(data.get("grossAmount"), USDC_UNIT)
+        fee = _units(data.get("feeAmount"), USDC_UNIT)
+        net = _units(data.get("netToFund"), USDC_UNIT)
+        balance_after = fund.total_balance + net
+        rows = [
+            {
+                "fund_id": fund.id,
+                "fund_address": fund.fund_address,
+                "transaction_type": kind.value,
+                "amount": amount,
+                "balance_after": balance_after,
+                "from_address": data.get("owner"),
+                "transaction_hash": event.transaction_hash,
+                "log_index": event.log_index,
+                "block_number": event.block_number,
+                "block_timestamp": event.block_timestamp,
+                "created_at": event.block_timestamp,
+            }
+            for kind, amount in (
+                (FundTransactionType.MONTHLY_DEPOSIT, gross),
+                (FundTransactionType.FEE_PAYMENT, fee),
+            )
+        ]
+        recorded = db.execute(
+            pg_insert(FundTransaction).values(rows)
+            .on_conflict_do_nothing(index_elements=[
+                FundTransaction.transaction_hash,
+                FundTransaction.log_index,
+                FundTransaction.transaction_type,
+            ])
+            .returning(FundTransaction.transaction_type)
+        ).scalars().all()
+        if FundTransactionType.MONTHLY_DEPOSIT.value in recorded:
+            fund.total_deposited += gross
+            fund.total_balance = balance_after
+            fund.available_balance += net
+            fund.last_deposit_at = event.block_timestamp
+        if FundTransactionType.FEE_PAYMENT.value in recorded:
+            fund.total_fees_paid += fee
+    return deferred
+
+@event_processor.register("RetirementStarted", invalidates=("analytics",))
+def project_retirement_started(db: Session, events: List[BlockchainEvent]) -> Deferred:
+    deferred: Deferred = []
+    funds = _funds_by_address(db, (e.contract_address for e in events))
+    for event in events:
+        fund = funds.get(event.contract_address.lower())
+        if not fund:
+            deferred.append((event, f"fund {event.contract_address} not projected yet"))
+            continue
+        if not fund.retirement_started:
+            counter_service.add(db, "funds", {"in_retirement": 1})
+        fund.retirement_started = True
+        fund.retirement_date = event.block_timestamp
+        fund.total_balance = _units(event.event_data.get("totalBalance"), USDC_UNIT)
+    return deferred
+
+# ---------------------------------------------------------------------------
+# Governance
+# ---------------------------------------------------------------------------
+
+@event_processor.register("ProposalCreated", invalidates=("governance", "analytics"))
+def project_proposal_created(db: Session, events: List[BlockchainEvent]):
+    users = _users_by_wallet(db, (e.event_data.get("proposer") for e in events))
+    voting_period = timedelta(seconds=settings.GOVERNANCE_VOTING_PERIOD)
+    execution_delay = timedelta(seconds=settings.GOVERNANCE_EXECUTION_DELAY)
+    for event in events:
+        data = event.event_data
+        user = users.get((data.get("proposer") or "").lower())
+        title = (data.get("title") or "")[:128]
+        end_time = event.block_timestamp + voting_period
+        stmt = pg_insert(Proposal).values(
+            proposal_id=int(data["proposalId"]),
+            proposer_id=user.id if user else None,
+            proposer_address=data["proposer"],
+            title=title,
+            description=title,
+            proposal_type=int(data.get("proposalType") or 0),
+            start_time=event.block_timestamp,
+            end_time=end_time,
+            execution_time=end_time + execution_delay,
+            transaction_hash=event.transaction_hash,
+            block_number=event.block_number,
+        )
+        if _inserted(db, stmt.on_conflict_do_update(
+            index_elements=[Proposal.proposal_id],
+            set_={
+                "proposer_address": stmt.excluded.proposer_address,
+                "transaction_hash": stmt.excluded.transaction_hash,
+                "block_number": stmt.excluded.block_number,
+            }
+        )):
+            counter_service.add(db, "governance", {"proposals": 1, "open_proposals": 1})
+
+@event_processor.register("VoteCast", invalidates=("governance", "analytics"))
+def project_vote_cast(db: Session, events: List[BlockchainEvent]) -> Deferred:
+    deferred: Deferred = []
+    chain_ids = {int(e.event_data["proposalId"]) for e in events}
+    proposals = {
+        p.proposal_id: p
+        for p in db.query(Proposal).filter(Proposal.proposal_id.in_(chain_ids)).all()
+    }
+    users = _users_by_wallet(db, (e.event_data.get("voter") for e in events))
+    touched = set()
+    for event in events:
+        data = event.event_data
+        proposal = proposals.get(int(data["proposalId"]))
+        user = users.get((data.get("voter") or "").lower())
+        if not proposal:
+            deferred.append((event, f"proposal #{data['proposalId']} not projected yet"))
+            continue
+        if not user:
+            deferred.append((event, f"voter {data.get('voter')} has no user yet"))
+            continue
+        stmt = pg_insert(Vote).values(
+            proposal_id=proposal.id,
+            voter_id=user.id,
+            voter_address=data["voter"],
+            support=bool(data["support"]),
+            voting_power=_units(data.get("votingPower"), TOKEN_UNIT),
+            transaction_hash=event.transaction_hash,
+            block_number=event.block_number,
+            block_timestamp=event.block_timestamp,
+        )
+        if _inserted(db, stmt.on_conflict_do_update(
+            constraint="uq_proposal_voter",
+            set_={
+                "support": stmt.excluded.support,
+                "voting_power": stmt.excluded.voting_power,
+                "transaction_hash": stmt.excluded.transaction_hash,
+                "block_number": stmt.excluded.block_number,
+                "block_timestamp": stmt.excluded.block_timestamp,
+            }
+        )):
+            counter_service.add(db, "governance", {"votes": 1})
+        touched.add(proposal.id)
+    _recount_votes(db, touched)
+    return deferred
+
+def _recount_votes(db: Session, proposal_ids: Iterable[int]) -> None:
+    """Tallies are recomputed from the votes table, never incremented."""
+    proposal_ids = list(proposal_ids)
+    if not proposal_ids:
+        return
+    tallies = db.query(
+        Vote.proposal_id,
+        func.coalesce(func.sum(case((Vote.support == True, Vote.voting_power), else_=0)), 0),
+        func.coalesce(func.sum(case((Vote.support == False, Vote.voting_power), else_=0)), 0),
+    ).filter(Vote.proposal_id.in_(proposal_ids)).group_by(Vote.proposal_id).all()
+    for proposal_id, votes_for, votes_against in tallies:
+        db.query(Proposal).filter(Proposal.id == proposal_id).update(
+            {"votes_for": votes_for, "votes_against": votes_against},
+            synchronize_session=False
+        )
+
+# ---------------------------------------------------------------------------
+# Token
+# ---------------------------------------------------------------------------
+
+def _record_activities(
+    db: Session,
+    events: List[BlockchainEvent],
+    wallet_field: str,
+    activity_type,
+    amount_field: str,
+    describe
+) -> Dict[str, TokenHolder]:
+    holders = _holders_by_wallet(db, (e.event_data.get(wallet_field) for e in events))
+    rows = []
+    for event in events:
+        data = event.event_data
+        holder = holders.get((data.get(wallet_field) or "").lower())
+        if not holder:
+            continue
+        rows.append({
+            "holder_id": holder.id,
+            "user_id": holder.user_id,
+            "wallet_address": holder.wallet_address,
+            "activity_type": activity_type(data) if callable(activity_type) else activity_type,
+            "description": describe(data),
+            "amount": _units(data.get(amount_field), TOKEN_UNIT),
+            "transaction_hash": event.transaction_hash,
+            "log_index": event.log_index,
+            "block_number": event.block_number,
+            "created_at": event.block_timestamp,
+        })
+    if rows:
+        db.execute(
+            pg_insert(TokenActivity).values(rows)
+            .on_conflict_do_nothing(index_elements=[
+                TokenActivity.transaction_hash,
+                TokenActivity.log_index,
+            ])
+        )
+    return holders
+
+@event_processor.register("Transfer", invalidates=("tokens", "analytics"))
+def project_token_transfer(db: Session, events: List[BlockchainEvent]):
+    # A mint to a registered user without a holder row creates that row first.
+    minted = [e for e in events if e.event_data.get("sender") == ZERO_ADDRESS]
+    if minted:
+        users = _users_by_wallet(db, (e.event_data.get("receiver") for e in minted))
+        for event in minted:
+            user = users.get(event.event_data["receiver"].lower())
+            if user and _inserted(db, pg_insert(TokenHolder).values(
+                user_id=user.id,
+                wallet_address=user.wallet_address,
+                holder_since=event.block_timestamp,
+            ).on_conflict_do_nothing(index_elements=[TokenHolder.wallet_address])):
+                counter_service.add(db, "tokens", {"holders": 1, "active_holders": 1})
+
+    _record_activities(
+        db, events, "receiver",
+        lambda data: "mint" if data.get("sender") == ZERO_ADDRESS else "transfer",
+        "value",
+        lambda data: f"Transfer from {data.get('sender')}",
+    )
+
+@event_processor.register("TokensBurned", invalidates=("tokens", "analytics"))
+def project_tokens_burned(db: Session, events: List[BlockchainEvent]):
+    holders = _record_activities(
+        db, events, "account", "burn", "amount",
+        lambda data: "Monthly inactivity burn",
+    )
+    for event in events:
+        holder = holders.get(event.event_data["account"].lower())
+        if holder:
+            holder.burned_this_month = True
+            holder.total_burns = int(event.event_data.get("totalBurns") or holder.total_burns)
+            holder.last_activity_timestamp = event.block_timestamp
+            holder.last_activity_type = "burn"
+
+@event_processor.register("TokensRenewed", invalidates=("tokens", "analytics"))
+def project_tokens_renewed(db: Session, events: List[BlockchainEvent]):
+    holders = _record_activities(
+        db, events, "account", "renew", "amount",
+        lambda data: "Token renewed after burn",
+    )
+    for event in events:
+        holder = holders.get(event.event_data["account"].lower())
+        if holder:
+            holder.renewed_this_month = True
+            holder.total_renews = int(event.event_data.get("totalRenews") or holder.total_renews)
+            holder.last_activity_timestamp = event.block_timestamp
+            holder.last_activity_type = "renew"
@@ -0,0 +1,83 @@
+from sqlalchemy.orm import Session
+from typing import Callable, Dict, Optional, Any
+import logging
+
+from .web3_client import web3_client
+from app.db.session import ListenerSessionLocal
+from app.models.blockchain import BlockchainBlockHash
+from app.services.blockchain_service import blockchain_service
+
+logger = logging.getLogger(__name__)
+
+class ReorgDetector:
+    """
+    Compares the stored hash chain of synced windows against the node.
+
+    When the newest stored hash no longer matches, walks back to the most
+    recent window that still matches (the fork point) and rolls back every
+    event ingested above it. If some of those events were already projected,
+    the rollback raises ReorgConflictError and sync stays halted at the fork.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session] = ListenerSessionLocal,
+        history_limit: int = 1000
+    ):
+        self.session_factory = session_factory
+        self.history_limit = history_limit
+
+    def _chain_hash(self, block_number: int) -> Optional[str]:
+        block = web3_client.get_block(block_number, use_cache=False)
+        return block['hash'].to_0x_hex() if block else None
+
+    def _matches(self, entry: BlockchainBlockHash) -> Optional[bool]:
+        """True/False when the node answered, None when it couldn't."""
+        chain_hash = self._chain_hash(entry.block_number)
+        if chain_hash is None:
+            return None
+        return chain_hash == entry.block_hash
+
+    def find_fork_point(self) -> Optional[int]:
+        db = self.session_factory()
+        try:
+            stored = blockchain_service.get_block_hashes(db, self.history_limit)
+        finally:
+            db.close()
+        if not stored or self._matches(stored[0]) is not False:
+            return None
+
+        logger.warning(f"🔀 Reorg detected at block {stored[0].block_number}")
+        chain = web3_client.get_blocks((e.block_number for e in stored[1:]), use_cache=False)
+        for entry in stored[1:]:
+            block = chain.get(entry.block_number)
+            if block is None:
+                logger.warning("Node unavailable while locating fork point, retrying later")
+                return None
+            if block['hash'].to_0x_hex() == entry.block_hash:
+                return entry.block_number
+
+        fork_block = max(stored[-1].block_number - 1, 0)
+        logger.error(f"❌ Reorg deeper than stored history, rewinding to block {fork_block}")
+        return fork_block
+
+    def rollback(self, fork_block: int, force: bool = False) -> Dict[str, Any]:
+        web3_client.invalidate_blocks(fork_block + 1)
+        db = self.session_factory()
+        try:
+            return blockchain_service.rollback_to_block(db, fork_block, force)
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+
+    def check(self) -> Optional[int]:
+        """Roll back if the chain reorganized; returns the fork block or None."""
+        fork_block = self.find_fork_point()
+        if fork_block is None:
+            return None
+        self.rollback(fork_block)
+        return fork_block
+
+reorg_detector = ReorgDetector()
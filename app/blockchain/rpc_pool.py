@@ -0,0 +1,223 @@
+from web3 import Web3, AsyncWeb3, AsyncHTTPProvider
+from requests.adapters import HTTPAdapter
+from typing import Any, Awaitable, Callable, Dict, List, Optional, TypeVar
+import aiohttp
+import asyncio
+import logging
+import requests
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Substrings providers use when they throttle a client.
+THROTTLE_MARKERS = (
+    "429",
+    "rate limit",
+    "rate-limit",
+    "too many requests",
+    "capacity exceeded",
+    "compute units",
+)
+
+# Errors that say the node itself is unhealthy (as opposed to a bad request).
+TRANSPORT_ERRORS = (
+    requests.ConnectionError,
+    requests.Timeout,
+    aiohttp.ClientError,
+    asyncio.TimeoutError,
+    TimeoutError,
+    ConnectionError,
+)
+
+class RPCEndpoint:
+    """One RPC URL with its providers and live latency / error-rate scores."""
+
+    def __init__(self, url: str, priority: int, timeout: int, pool_size: int):
+        self.url = url
+        self.priority = priority
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        # The pool does its own failover, so the providers' built-in retries are off.
+        self.w3 = Web3(Web3.HTTPProvider(
+            url,
+            request_kwargs={"timeout": timeout},
+            session=session,
+            exception_retry_configuration=None
+        ))
+        self.async_w3 = AsyncWeb3(AsyncHTTPProvider(url, exception_retry_configuration=None))
+        self.latency: Optional[float] = None
+        self.error_rate = 0.0
+        self.requests = 0
+        self.failures = 0
+        self.consecutive_failures = 0
+        self.cooldown_until = 0.0
+        self.last_error: Optional[str] = None
+
+    @property
+    def available(self) -> bool:
+        return time.monotonic() >= self.cooldown_until
+
+    def score(self, default_latency: float) -> float:
+        """Lower is better: expected latency inflated by the recent error rate."""
+        latency = self.latency if self.latency is not None else default_latency
+        return latency * (1 + 10 * self.error_rate)
+
+    def record_success(self, elapsed: float, alpha: float) -> None:
+        self.requests += 1
+        self.consecutive_failures = 0
+        self.latency = elapsed if self.latency is None else alpha * elapsed + (1 - alpha) * self.latency
+        self.error_rate = (1 - alpha) * self.error_rate
+
+    def record_failure(self, error: Exception, alpha: float, cooldown: float) -> None:
+        self.requests += 1
+        self.failures += 1
+        self.consecutive_failures += 1
+        self.error_rate = alpha + (1 - alpha) * self.error_rate
+        self.last_error = str(error)[:200]
+        if is_throttle_error(error) or self.consecutive_failures >= 3:
+            backoff = cooldown * 2 ** min(self.consecutive_failures - 1, 5)
+            self.cooldown_until = time.monotonic() + backoff
+            logger.warning(f"⏸️ RPC {self.url} taken out for {backoff:.0f}s: {self.last_error}")
+
+    def stats(self, default_latency: float) -> Dict[str, Any]:
+        return {
+            "url": self.url,
+            "available": self.available,
+            "latency_ms": round(self.latency * 1000, 1) if self.latency is not None else None,
+            "error_rate": round(self.error_rate, 4),
+            "score": round(self.score(default_latency), 4),
+            "requests": self.requests,
+            "failures": self.failures,
+            "cooldown_seconds": max(0, round(self.cooldown_until - time.monotonic(), 1)),
+            "last_error": self.last_error,
+        }
+
+def is_throttle_error(error: Exception) -> bool:
+    response = getattr(error, "response", None)
+    if getattr(response, "status_code", None) == 429 or getattr(error, "status", None) == 429:
+        return True
+    message = str(error).lower()
+    return any(marker in message for marker in THROTTLE_MARKERS)
+
+def is_node_error(error: Exception) -> bool:
+    """Errors worth failing over for; anything else is the caller's problem."""
+    if isinstance(error, TRANSPORT_ERRORS) or is_throttle_error(error):
+        return True
+    status_code = getattr(getattr(error, "response", None), "status_code", None)
+    return status_code is not None and status_code >= 500
+
+class RPCPool:
+    """
+    Ordered RPC endpoints routed by live score.
+
+    Each call goes to the best available endpoint (lowest latency x error
+    rate, list order breaks ties). Transport errors and throttling move the
+    call to the next endpoint and put the failing node on a cooldown; request
+    errors (bad params, range limits) are raised as-is.
+    """
+
+    def __init__(
+        self,
+        urls: List[str],
+        timeout: int = 30,
+        pool_size: int = 20,
+        cooldown: float = 30.0,
+        alpha: float = 0.2,
+        default_latency: float = 0.5,
+    ):
+        self.endpoints = [
+            RPCEndpoint(url, priority, timeout, pool_size)
+            for priority, url in enumerate(dict.fromkeys(urls))
+        ]
+        self.cooldown = cooldown
+        self.alpha = alpha
+        self.default_latency = default_latency
+        self._lock = threading.Lock()
+
+    def ranked(self) -> List[RPCEndpoint]:
+        with self._lock:
+            available = [e for e in self.endpoints if e.available]
+            if not available:
+                # Everyone is cooling down: try whoever comes back first.
+                return sorted(self.endpoints, key=lambda e: e.cooldown_until)
+            return sorted(available, key=lambda e: (e.score(self.default_latency), e.priority))
+
+    def primary(self) -> Optional[RPCEndpoint]:
+        ranked = self.ranked()
+        return ranked[0] if ranked else None
+
+    def _success(self, endpoint: RPCEndpoint, started: float) -> None:
+        with self._lock:
+            endpoint.record_success(time.monotonic() - started, self.alpha)
+
+    def _failure(self, endpoint: RPCEndpoint, error: Exception) -> None:
+        with self._lock:
+            endpoint.record_failure(error, self.alpha, self.cooldown)
+
+    def call(self, fn: Callable[[Web3], T]) -> T:
+        last_error: Optional[Exception] = None
+        for endpoint in self.ranked():
+            started = time.monotonic()
+            try:
+                result = fn(endpoint.w3)
+            except Exception as e:
+                if not is_node_error(e):
+                    raise
+                self._failure(endpoint, e)
+                last_error = e
+                continue
+            self._success(endpoint, started)
+            return result
+        raise last_error or ConnectionError("No RPC endpoints configured")
+
+    async def call_async(self, fn: Callable[[AsyncWeb3], Awaitable[T]]) -> T:
+        last_error: Optional[Exception] = None
+        for endpoint in self.ranked():
+            started = time.monotonic()
+            try:
+                result = await fn(endpoint.async_w3)
+            except Exception as e:
+                if not is_node_error(e):
+                    raise
+                self._failure(endpoint, e)
+                last_error = e
+                continue
+            self._success(endpoint, started)
+            return result
+        raise last_error or ConnectionError("No RPC endpoints configured")
+
+    async def probe_all(self) -> bool:
+        """Health-check every endpoint (also scores them); True if any is up."""
+        async def probe(endpoint: RPCEndpoint) -> bool:
+            started = time.monotonic()
+            try:
+                await endpoint.async_w3.eth.block_number
+            except Exception as e:
+                self._failure(endpoint, e)
+                return False
+            self._success(endpoint, started)
+            return True
+
+        results = await asyncio.gather(*(probe(e) for e in self.endpoints))
+        return any(results)
+
+    async def cache_async_sessions(self, make_session: Callable[[], aiohttp.ClientSession]) -> List[aiohttp.ClientSession]:
+        sessions = []
+        for endpoint in self.endpoints:
+            session = make_session()
+            await endpoint.async_w3.provider.cache_async_session(session)
+            sessions.append(session)
+        return sessions
+
+    def stats(self) -> Dict[str, Any]:
+        primary = self.primary()
+        with self._lock:
+            return {
+                "primary": primary.url if primary else None,
+                "endpoints": [e.stats(self.default_latency) for e in self.endpoints],
+            }
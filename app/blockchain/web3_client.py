@@ -1,12 +1,29 @@
-from web3 import Web3
-from typing import Optional, Dict, Any
+from web3 import Web3, AsyncWeb3
+from web3._utils.method_formatters import PYTHONIC_RESULT_FORMATTERS
+from collections import OrderedDict
+from typing import Optional, Dict, Any, Iterable, List, Tuple
+import aiohttp
+import asyncio
 import json
 import logging
+import threading
+import time
 from pathlib import Path
 from app.core.config import settings
+from .rpc_pool import RPCPool
 
 logger = logging.getLogger(__name__)
 
+class RPCItemError(Exception):
+    """One failed call inside a JSON-RPC batch."""
+
+    def __init__(self, method: str, params: List[Any], message: Optional[str], code: Optional[int] = None):
+        super().__init__(f"{method}{tuple(params)}: {message}")
+        self.method = method
+        self.params = params
+        self.message = message
+        self.code = code
+
 class Web3Client:
     _instance: Optional['Web3Client'] = None
     
@@ -20,8 +37,17 @@ class Web3Client:
         if self._initialized:
             return
         
-        self.w3: Optional[Web3] = None
+        self.rpc_pool: Optional[RPCPool] = None
+        self._async_sessions: List[aiohttp.ClientSession] = []
+        self._connected = False
+        self._connection_checked_at = 0.0
+        self._monitor_task: Optional[asyncio.Task] = None
         self.network_config: Optional[Dict[str, Any]] = None
+        self.block_cache_size = settings.WEB3_BLOCK_CACHE_SIZE
+        self._block_cache: "OrderedDict[int, Dict]" = OrderedDict()
+        self._block_cache_lock = threading.Lock()
+        self.block_cache_hits = 0
+        self.block_cache_misses = 0
         self._initialized = True
         self._load_network_config()
         self._connect()
@@ -44,24 +70,123 @@ class Web3Client:
         except Exception as e:
             logger.error(f"Error loading network config: {e}", exc_info=True)
     
+    def _rpc_urls(self) -> List[str]:
+        urls = list(settings.web3_provider_urls)
+        rpc = self.network_config.get("rpc") if self.network_config else None
+        if isinstance(rpc, str):
+            urls.append(rpc)
+        elif isinstance(rpc, list):
+            urls.extend(rpc)
+        return urls
+    
     def _connect(self):
-        if not self.network_config:
+        urls = self._rpc_urls()
+        if not urls:
             logger.error("No network configuration available")
             return
         try:
-            rpc_url = self.network_config["rpc"]
-            self.w3 = Web3(Web3.HTTPProvider(rpc_url))
-
-            if self.w3.is_connected():
-                logger.info(f"✅ Connected to {self.network_config['name']}")
-                logger.info(f"📡 Latest block: {self.w3.eth.block_number}")
+            self.rpc_pool = RPCPool(
+                urls,
+                timeout=settings.WEB3_PROVIDER_TIMEOUT,
+                pool_size=settings.WEB3_HTTP_POOL_SIZE,
+                cooldown=settings.WEB3_RPC_COOLDOWN
+            )
+            logger.info(f"🔌 RPC pool: {len(self.rpc_pool.endpoints)} endpoints")
+            
+            self._set_connected(self._probe())
+            network = self.network_config['name'] if self.network_config else settings.BLOCKCHAIN_NETWORK
+            if self._connected:
+                logger.info(f"✅ Connected to {network} via {self.rpc_pool.primary().url}")
+                logger.info(f"📡 Latest block: {self.get_latest_block()}")
             else:
-                logger.error(f"❌ Failed to connect to {self.network_config['name']}")
+                logger.error(f"❌ Failed to connect to {network}")
         except Exception as e:
             logger.error(f"Error connecting to blockchain: {e}", exc_info=True)
     
+    @property
+    def w3(self) -> Optional[Web3]:
+        """Web3 bound to the currently best-scored endpoint."""
+        endpoint = self.rpc_pool.primary() if self.rpc_pool else None
+        return endpoint.w3 if endpoint else None
+    
+    @property
+    def async_w3(self) -> Optional[AsyncWeb3]:
+        endpoint = self.rpc_pool.primary() if self.rpc_pool else None
+        return endpoint.async_w3 if endpoint else None
+    
+    def _probe(self) -> bool:
+        try:
+            self.rpc_pool.call(lambda w3: w3.eth.block_number)
+            return True
+        except Exception:
+            return False
+    
+    def _set_connected(self, connected: bool) -> None:
+        if connected != self._connected and self._connection_checked_at:
+            if connected:
+                logger.info("✅ Blockchain connection restored")
+            else:
+                logger.warning("⚠️ Blockchain connection lost")
+        self._connected = connected
+        self._connection_checked_at = time.monotonic()
+    
     def is_connected(self) -> bool:
-        return self.w3 is not None and self.w3.is_connected()
+        """
+        Cached connection state. While the background monitor runs (API
+        process) this never touches the network; elsewhere (Celery, scripts)
+        the state is re-probed at most once per WEB3_CONNECTION_CHECK_INTERVAL.
+        """
+        if self.rpc_pool is None:
+            return False
+        monitored = self._monitor_task is not None and not self._monitor_task.done()
+        stale = time.monotonic() - self._connection_checked_at > settings.WEB3_CONNECTION_CHECK_INTERVAL
+        if stale and not monitored:
+            self._set_connected(self._probe())
+        return self._connected
+    
+    async def start_async(self) -> None:
+        """Open pooled aiohttp sessions and start the connection monitor."""
+        if self.rpc_pool is None or self._monitor_task is not None:
+            return
+        self._async_sessions = await self.rpc_pool.cache_async_sessions(
+            lambda: aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=settings.WEB3_HTTP_POOL_SIZE,
+                    keepalive_timeout=60
+                ),
+                timeout=aiohttp.ClientTimeout(total=settings.WEB3_PROVIDER_TIMEOUT)
+            )
+        )
+        await self.refresh_connection()
+        self._monitor_task = asyncio.create_task(self._monitor_connection())
+    
+    async def refresh_connection(self) -> bool:
+        """Probe every endpoint, which also refreshes their health scores."""
+        if self.rpc_pool is None:
+            return False
+        connected = await self.rpc_pool.probe_all()
+        self._set_connected(connected)
+        return connected
+    
+    async def _monitor_connection(self) -> None:
+        while True:
+            await asyncio.sleep(settings.WEB3_CONNECTION_CHECK_INTERVAL)
+            await self.refresh_connection()
+    
+    async def close_async(self) -> None:
+        if self._monitor_task:
+            self._monitor_task.cancel()
+            try:
+                await self._monitor_task
+            except asyncio.CancelledError:
+                pass
+            self._monitor_task = None
+        for session in self._async_sessions:
+            await session.close()
+        self._async_sessions = []
+    
+    def rpc_stats(self) -> Dict[str, Any]:
+        return self.rpc_pool.stats() if self.rpc_pool else {"primary": None, "endpoints": []}
     
     def get_contract_address(self, contract_name: str) -> Optional[str]:
         if not self.network_config:
@@ -76,22 +201,184 @@ class Web3Client:
     def get_latest_block(self) -> int:
         if not self.is_connected():
             return 0
-        return self.w3.eth.block_number
+        return self.rpc_pool.call(lambda w3: w3.eth.block_number)
+    
+    async def get_latest_block_async(self) -> int:
+        if not self.is_connected():
+            return 0
+        return await self.rpc_pool.call_async(lambda w3: w3.eth.block_number)
+    
+    def _cache_get_block(self, block_number: int) -> Optional[Dict]:
+        with self._block_cache_lock:
+            block = self._block_cache.get(block_number)
+            if block is None:
+                self.block_cache_misses += 1
+                return None
+            self._block_cache.move_to_end(block_number)
+            self.block_cache_hits += 1
+            return block
     
-    def get_block(self, block_number: int) -> Optional[Dict]:
+    def _cache_put_block(self, block_number: int, block: Dict) -> None:
+        with self._block_cache_lock:
+            self._block_cache[block_number] = block
+            self._block_cache.move_to_end(block_number)
+            while len(self._block_cache) > self.block_cache_size:
+                self._block_cache.popitem(last=False)
+    
+    def invalidate_blocks(self, from_block: int) -> int:
+        """Drop cached headers at or above from_block (they may belong to an orphaned fork)."""
+        with self._block_cache_lock:
+            stale = [n for n in self._block_cache if n >= from_block]
+            for number in stale:
+                del self._block_cache[number]
+        return len(stale)
+    
+    def get_block(self, block_number: int, use_cache: bool = True) -> Optional[Dict]:
+        cacheable = isinstance(block_number, int)
+        if cacheable and use_cache:
+            cached = self._cache_get_block(block_number)
+            if cached is not None:
+                return cached
         if not self.is_connected():
             return None
         try:
-            return dict(self.w3.eth.get_block(block_number))
+            block = dict(self.rpc_pool.call(lambda w3: w3.eth.get_block(block_number)))
         except Exception as e:
             logger.error(f"Error getting block {block_number}: {e}")
             return None
+        if cacheable:
+            self._cache_put_block(block_number, block)
+        return block
+    
+    async def get_block_async(self, block_number: int, use_cache: bool = True) -> Optional[Dict]:
+        cacheable = isinstance(block_number, int)
+        if cacheable and use_cache:
+            cached = self._cache_get_block(block_number)
+            if cached is not None:
+                return cached
+        if not self.is_connected():
+            return None
+        try:
+            block = dict(await self.rpc_pool.call_async(lambda w3: w3.eth.get_block(block_number)))
+        except Exception as e:
+            logger.error(f"Error getting block {block_number}: {e}")
+            return None
+        if cacheable:
+            self._cache_put_block(block_number, block)
+        return block
+    
+    def batch_request(
+        self,
+        calls: List[Tuple[str, List[Any]]],
+        chunk_size: int = 100
+    ) -> List[Any]:
+        """
+        Send (method, params) calls as JSON-RPC batches, one HTTP POST per
+        chunk. Results come back in call order, formatted like the regular
+        w3.eth methods; an item that failed or returned null is an
+        RPCItemError in its slot instead of failing the whole batch.
+        """
+        if not calls:
+            return []
+        if not self.is_connected():
+            return [RPCItemError(method, params, "not connected") for method, params in calls]
+        
+        results: List[Any] = []
+        for start in range(0, len(calls), chunk_size):
+            chunk = calls[start:start + chunk_size]
+            try:
+                responses = self.rpc_pool.call(lambda w3: w3.provider.make_batch_request(chunk))
+            except Exception as e:
+                logger.warning(f"JSON-RPC batch of {len(chunk)} failed: {e}")
+                results.extend(RPCItemError(method, params, str(e)) for method, params in chunk)
+                continue
+            if not isinstance(responses, list):
+                error = (responses or {}).get("error") or {}
+                results.extend(
+                    RPCItemError(method, params, error.get("message", "batch rejected"), error.get("code"))
+                    for method, params in chunk
+                )
+                continue
+            for (method, params), response in zip(chunk, responses):
+                error = response.get("error")
+                if error:
+                    results.append(RPCItemError(method, params, error.get("message"), error.get("code")))
+                elif response.get("result") is None:
+                    results.append(RPCItemError(method, params, "not found"))
+                else:
+                    formatter = PYTHONIC_RESULT_FORMATTERS.get(method)
+                    result = response["result"]
+                    results.append(formatter(result) if formatter else result)
+        return results
+    
+    def get_blocks(self, block_numbers: Iterable[int], use_cache: bool = True) -> Dict[int, Optional[Dict]]:
+        """Headers for many blocks; cache misses are fetched in JSON-RPC batches."""
+        numbers = sorted(set(block_numbers))
+        blocks: Dict[int, Optional[Dict]] = {}
+        missing = []
+        for number in numbers:
+            cached = self._cache_get_block(number) if use_cache else None
+            if cached is not None:
+                blocks[number] = cached
+            else:
+                missing.append(number)
+        
+        results = self.batch_request([("eth_getBlockByNumber", [hex(n), False]) for n in missing])
+        for number, result in zip(missing, results):
+            if isinstance(result, RPCItemError):
+                logger.debug(f"Block {number} unavailable: {result}")
+                blocks[number] = None
+                continue
+            block = dict(result)
+            self._cache_put_block(number, block)
+            blocks[number] = block
+        return blocks
+    
+    def prefetch_blocks(self, block_numbers: Iterable[int], chunk_size: int = 100) -> int:
+        """Load missing block headers into the cache in JSON-RPC batches."""
+        with self._block_cache_lock:
+            missing = sorted({n for n in block_numbers if n not in self._block_cache})
+        if not missing:
+            return 0
+        blocks = self.get_blocks(missing, use_cache=False)
+        fetched = sum(1 for block in blocks.values() if block)
+        logger.debug(f"📦 Prefetched {fetched} block headers")
+        return fetched
+    
+    def block_cache_stats(self) -> Dict[str, Any]:
+        with self._block_cache_lock:
+            lookups = self.block_cache_hits + self.block_cache_misses
+            return {
+                "size": len(self._block_cache),
+                "max_size": self.block_cache_size,
+                "hits": self.block_cache_hits,
+                "misses": self.block_cache_misses,
+                "hit_ratio": round(self.block_cache_hits / lookups, 4) if lookups else 0.0,
+            }
+    
+    def get_logs(
+        self,
+        from_block: int,
+        to_block: int,
+        address: List[str],
+        topics: List[Any]
+    ) -> List[Dict]:
+        # An empty result would read as "no events" and let callers mark the
+        # window as synced, so a missing connection must be an error here.
+        if not self.is_connected():
+            raise ConnectionError(f"Web3 not connected, cannot fetch logs {from_block}-{to_block}")
+        return list(self.rpc_pool.call(lambda w3: w3.eth.get_logs({
+            "fromBlock": from_block,
+            "toBlock": to_block,
+            "address": address,
+            "topics": topics,
+        })))
     
     def get_transaction(self, tx_hash: str) -> Optional[Dict]:
         if not self.is_connected():
             return None
         try:
-            return dict(self.w3.eth.get_transaction(tx_hash))
+            return dict(self.rpc_pool.call(lambda w3: w3.eth.get_transaction(tx_hash)))
         except Exception as e:
             logger.error(f"Error getting transaction {tx_hash}: {e}")
             return None
@@ -100,9 +387,17 @@ class Web3Client:
         if not self.is_connected():
             return None
         try:
-            return dict(self.w3.eth.get_transaction_receipt(tx_hash))
+            return dict(self.rpc_pool.call(lambda w3: w3.eth.get_transaction_receipt(tx_hash)))
         except Exception as e:
             logger.error(f"Error getting receipt {tx_hash}: {e}")
             return None
+    
+    def get_transactions(self, tx_hashes: List[str]) -> List[Optional[Dict]]:
+        results = self.batch_request([("eth_getTransactionByHash", [h]) for h in tx_hashes])
+        return [None if isinstance(r, RPCItemError) else dict(r) for r in results]
+    
+    def get_transaction_receipts(self, tx_hashes: List[str]) -> List[Optional[Dict]]:
+        results = self.batch_request([("eth_getTransactionReceipt", [h]) for h in tx_hashes])
+        return [None if isinstance(r, RPCItemError) else dict(r) for r in results]
 
 web3_client = Web3Client()
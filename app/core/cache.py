@@ -0,0 +1,365 @@
+from fastapi.encoders import jsonable_encoder
+from redis import Redis as SyncRedis
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+from collections import OrderedDict
+from enum import Enum
+from functools import wraps
+from typing import Any, Awaitable, Callable, Dict, Optional, Set, Tuple
+import asyncio
+import hashlib
+import inspect
+import json
+import logging
+import threading
+import time
+import uuid
+
+from app.core.config import settings
+from app.core.rate_limiter import rate_limiter
+
+logger = logging.getLogger(__name__)
+
+_KEY_TYPES = (str, int, float, bool, type(None), Enum)
+_MISSING = object()
+
+class LocalCache:
+    """Per-process TTL + LRU map, the L1 tier in front of Redis."""
+
+    def __init__(self, max_items: int):
+        self.max_items = max_items
+        self._data: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: str) -> Any:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None or entry[0] <= time.monotonic():
+                if entry is not None:
+                    del self._data[key]
+                self.misses += 1
+                return _MISSING
+            self._data.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def set(self, key: str, value: Any, ttl: float) -> None:
+        with self._lock:
+            self._data[key] = (time.monotonic() + ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_items:
+                self._data.popitem(last=False)
+
+    def drop_prefix(self, prefix: str) -> int:
+        with self._lock:
+            stale = [key for key in self._data if key.startswith(prefix)]
+            for key in stale:
+                del self._data[key]
+            return len(stale)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        total = self.hits + self.misses
+        return {
+            "size": len(self._data),
+            "max_items": self.max_items,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / total, 4) if total else None,
+        }
+
+class ResponseCache:
+    """
+    Two-tier read-through cache for hot, JSON-serialisable reads.
+
+    L1 is a small TTL/LRU map in each worker process, used by keys cached
+    with an l1_ttl; L2 is Redis, through the connection opened by
+    RedisRateLimiter. Entries are grouped in namespaces ("tokens",
+    "governance", ...); write services invalidate a namespace after commit,
+    which deletes its Redis keys and is broadcast over pub/sub so every
+    worker drops its L1 copies too.
+
+    A miss is computed once: concurrent callers in this process await the
+    same task, and callers in other processes wait on a short Redis lock
+    for the winner's value instead of hitting the database too. Redis errors
+    never fail a request; the value is then just computed.
+    """
+
+    def __init__(
+        self,
+        prefix: str = "cache",
+        lock_timeout: float = 5.0,
+        poll_interval: float = 0.05
+    ):
+        self.prefix = prefix
+        self.channel = f"{prefix}:invalidate"
+        self.lock_timeout = lock_timeout
+        self.poll_interval = poll_interval
+        self.local = LocalCache(settings.CACHE_L1_MAX_ITEMS)
+        self.hits = 0
+        self.misses = 0
+        self._inflight: Dict[str, asyncio.Task] = {}
+        self._pending: Set[asyncio.Task] = set()
+        self._listener: Optional[asyncio.Task] = None
+        self._sync_client: Optional[SyncRedis] = None
+
+    @property
+    def client(self) -> Optional[Redis]:
+        return rate_limiter.redis_client if settings.CACHE_ENABLED else None
+
+    def _index_key(self, namespace: str) -> str:
+        return f"{self.prefix}:{namespace}:keys"
+
+    def build_key(self, namespace: str, name: str, params: Dict[str, Any]) -> str:
+        raw = json.dumps(params, sort_keys=True, default=str)
+        digest = hashlib.sha1(raw.encode()).hexdigest()[:16]
+        return f"{self.prefix}:{namespace}:{name}:{digest}"
+
+    async def get_or_set(
+        self,
+        namespace: str,
+        key: str,
+        loader: Callable[[], Awaitable[Any]],
+        ttl: Optional[int] = None,
+        l1_ttl: Optional[float] = None,
+        shared: bool = True
+    ) -> Any:
+        if not settings.CACHE_ENABLED:
+            return await loader()
+        ttl = ttl or settings.CACHE_TTL
+
+        if l1_ttl:
+            value = self.local.get(key)
+            if value is not _MISSING:
+                return value
+
+        client = self.client if shared else None
+        if client is None:
+            value = await self._single_flight(key, loader)
+        else:
+            value = await self._get_shared(client, namespace, key, loader, ttl)
+
+        if l1_ttl:
+            self.local.set(key, jsonable_encoder(value), min(l1_ttl, ttl))
+        return value
+
+    async def _single_flight(self, key: str, loader: Callable[[], Awaitable[Any]]) -> Any:
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(loader())
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        return await asyncio.shield(task)
+
+    async def _get_shared(
+        self,
+        client: Redis,
+        namespace: str,
+        key: str,
+        loader: Callable[[], Awaitable[Any]],
+        ttl: int
+    ) -> Any:
+        try:
+            cached = await client.get(key)
+        except RedisError as e:
+            logger.warning(f"Cache read failed for {key}: {e}")
+            return await self._single_flight(key, loader)
+        if cached is not None:
+            self.hits += 1
+            return json.loads(cached)
+
+        self.misses += 1
+        return await self._single_flight(
+            key, lambda: self._fill(client, namespace, key, loader, ttl)
+        )
+
+    async def _fill(
+        self,
+        client: Redis,
+        namespace: str,
+        key: str,
+        loader: Callable[[], Awaitable[Any]],
+        ttl: int
+    ) -> Any:
+        lock_key = f"{key}:lock"
+        token = uuid.uuid4().hex
+        try:
+            locked = await client.set(lock_key, token, nx=True, px=int(self.lock_timeout * 1000))
+        except RedisError:
+            return await loader()
+
+        if not locked:
+            # Another process is computing this value; wait for it briefly.
+            waited = 0.0
+            while waited < self.lock_timeout:
+                await asyncio.sleep(self.poll_interval)
+                waited += self.poll_interval
+                try:
+                    cached = await client.get(key)
+                except RedisError:
+                    break
+                if cached is not None:
+                    return json.loads(cached)
+            return await loader()
+
+        try:
+            value = await loader()
+            payload = json.dumps(jsonable_encoder(value))
+            try:
+                async with client.pipeline(transaction=False) as pipe:
+                    pipe.set(key, payload, ex=ttl)
+                    pipe.sadd(self._index_key(namespace), key)
+                    pipe.expire(self._index_key(namespace), max(ttl, settings.CACHE_TTL))
+                    await pipe.execute()
+            except RedisError as e:
+                logger.warning(f"Cache write failed for {key}: {e}")
+            return value
+        finally:
+            try:
+                if await client.get(lock_key) == token:
+                    await client.delete(lock_key)
+            except RedisError:
+                pass
+
+    def cached(
+        self,
+        namespace: str,
+        ttl: Optional[int] = None,
+        l1_ttl: Optional[float] = None,
+        shared: bool = True
+    ) -> Callable:
+        """
+        Cache an async endpoint or service method. The key is built from its
+        scalar arguments (sessions and other objects are ignored). l1_ttl
+        also keeps the value in this process; shared=False skips Redis, for
+        per-process values such as health checks.
+        """
+        def decorator(func: Callable[..., Awaitable[Any]]) -> Callable[..., Awaitable[Any]]:
+            if not inspect.iscoroutinefunction(func):
+                raise TypeError(f"@cached needs an async function, got {func.__qualname__}")
+            signature = inspect.signature(func)
+
+            @wraps(func)
+            async def wrapper(*args, **kwargs):
+                bound = signature.bind_partial(*args, **kwargs)
+                params = {
+                    name: value.value if isinstance(value, Enum) else value
+                    for name, value in bound.arguments.items()
+                    if isinstance(value, _KEY_TYPES)
+                }
+                key = self.build_key(namespace, func.__qualname__, params)
+                return await self.get_or_set(
+                    namespace, key, lambda: func(*args, **kwargs), ttl, l1_ttl, shared
+                )
+            return wrapper
+        return decorator
+
+    def _drop_local(self, namespaces) -> None:
+        for namespace in namespaces:
+            self.local.drop_prefix(f"{self.prefix}:{namespace}:")
+
+    async def invalidate_async(self, *namespaces: str) -> None:
+        self._drop_local(namespaces)
+        client = self.client
+        if client is None:
+            return
+        try:
+            for namespace in namespaces:
+                keys = await client.smembers(self._index_key(namespace))
+                await client.delete(self._index_key(namespace), *keys)
+                await client.publish(self.channel, namespace)
+        except RedisError as e:
+            logger.warning(f"Cache invalidation failed for {namespaces}: {e}")
+
+    def invalidate(self, *namespaces: str) -> None:
+        """
+        Drop cached entries of the namespaces, for sync write services. Inside
+        the event loop the Redis side is scheduled; elsewhere (Celery workers)
+        it runs on a synchronous connection.
+        """
+        if not settings.CACHE_ENABLED:
+            return
+        self._drop_local(namespaces)
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+
+        if loop is not None and self.client is not None:
+            task = loop.create_task(self.invalidate_async(*namespaces))
+            self._pending.add(task)
+            task.add_done_callback(self._pending.discard)
+            return
+
+        try:
+            if self._sync_client is None:
+                self._sync_client = SyncRedis.from_url(
+                    settings.REDIS_URL, decode_responses=True, socket_timeout=2
+                )
+            for namespace in namespaces:
+                keys = self._sync_client.smembers(self._index_key(namespace))
+                self._sync_client.delete(self._index_key(namespace), *keys)
+                self._sync_client.publish(self.channel, namespace)
+        except RedisError as e:
+            logger.warning(f"Cache invalidation failed for {namespaces}: {e}")
+
+    async def start(self) -> None:
+        """Subscribe to invalidations from other workers (call from the app lifespan)."""
+        if self.client is not None and self._listener is None:
+            self._listener = asyncio.create_task(self._listen())
+
+    async def stop(self) -> None:
+        if self._listener:
+            self._listener.cancel()
+            try:
+                await self._listener
+            except asyncio.CancelledError:
+                pass
+            self._listener = None
+
+    async def _listen(self) -> None:
+        backoff = 1.0
+        while True:
+            pubsub = self.client.pubsub()
+            try:
+                await pubsub.subscribe(self.channel)
+                # Anything published while we were disconnected is lost.
+                self.local.clear()
+                backoff = 1.0
+                logger.info("📡 Cache invalidation channel subscribed")
+                async for message in pubsub.listen():
+                    if message.get("type") == "message":
+                        self._drop_local([message["data"]])
+            except asyncio.CancelledError:
+                raise
+            except (RedisError, OSError) as e:
+                logger.warning(f"⚠️ Cache invalidation channel lost ({e}), retrying in {backoff:.0f}s")
+            finally:
+                try:
+                    await pubsub.aclose()
+                except Exception:
+                    pass
+            await asyncio.sleep(backoff)
+            backoff = min(backoff * 2, 60.0)
+
+    def stats(self) -> Dict[str, Any]:
+        total = self.hits + self.misses
+        return {
+            "enabled": settings.CACHE_ENABLED,
+            "l1": self.local.stats(),
+            "redis": {
+                "connected": self.client is not None,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": round(self.hits / total, 4) if total else None,
+            },
+            "invalidation_listener": self._listener is not None and not self._listener.done(),
+        }
+
+response_cache = ResponseCache()
+cached = response_cache.cached
@@ -82,13 +82,74 @@ class Settings(BaseSettings):
         description="Echo SQL queries to console (for debugging)"
     )
     
+    DATABASE_READONLY_URL: Optional[str] = Field(
+        default=None,
+        description="Read replica URL for the readonly pool (None = share the api pool)"
+    )
+    
+    DB_WORKER_POOL_SIZE: int = Field(
+        default=5,
+        ge=1,
+        le=100,
+        description="Connection pool size for Celery workers"
+    )
+    
+    DB_WORKER_MAX_OVERFLOW: int = Field(
+        default=5,
+        ge=0,
+        le=100,
+        description="Max overflow connections for Celery workers"
+    )
+    
+    DB_LISTENER_POOL_SIZE: int = Field(
+        default=2,
+        ge=1,
+        le=20,
+        description="Connection pool size for the blockchain event listener"
+    )
+    
+    DB_LISTENER_MAX_OVERFLOW: int = Field(
+        default=2,
+        ge=0,
+        le=20,
+        description="Max overflow connections for the blockchain event listener"
+    )
+    
+    DB_READONLY_POOL_SIZE: int = Field(
+        default=5,
+        ge=1,
+        le=100,
+        description="Connection pool size for the read replica"
+    )
+    
+    DB_READONLY_MAX_OVERFLOW: int = Field(
+        default=10,
+        ge=0,
+        le=100,
+        description="Max overflow connections for the read replica"
+    )
+
+    DB_ASYNC_POOL_SIZE: int = Field(
+        default=5,
+        ge=1,
+        le=50,
+        description="Part of DB_POOL_SIZE reserved for the api async engine"
+    )
+
+    DB_ASYNC_MAX_OVERFLOW: int = Field(
+        default=10,
+        ge=0,
+        le=50,
+        description="Part of DB_MAX_OVERFLOW reserved for the api async engine"
+    )
+    
     @property
     def database_url_sync(self) -> str:
         return self.DATABASE_URL.replace("postgresql://", "postgresql://")
     
     @property
     def database_url_async(self) -> str:
-        return self.DATABASE_URL.replace("postgresql://", "postgresql+asyncpg://")
+        return self.DATABASE_URL.replace("postgresql://", "postgresql+psycopg://", 1)
     
     @property
     def is_supabase(self) -> bool:
@@ -263,7 +324,28 @@ class Settings(BaseSettings):
     
     WEB3_PROVIDER_URL: Optional[str] = Field(
         default=None,
-        description="Custom Web3 RPC provider URL (overrides contracts.json RPC)"
+        description="Custom Web3 RPC URL, or comma-separated list (tried before contracts.json RPCs)"
+    )
+    
+    @property
+    def web3_provider_urls(self) -> List[str]:
+        if not self.WEB3_PROVIDER_URL:
+            return []
+        return [url.strip() for url in self.WEB3_PROVIDER_URL.split(",") if url.strip()]
+    
+    CONTRACT_ABI_DIR: Path = Field(
+        default=Path("abis"),
+        description="Contract ABI artifacts, as <dir>/<network>/<contract>.json with <dir>/common fallback"
+    )
+    
+    ABI_CACHE_DIR: Path = Field(
+        default=Path(".cache/abi"),
+        description="Disk cache for selectors and event decoders derived from ABI artifacts"
+    )
+    
+    BLOCKCHAIN_WS_URL: Optional[str] = Field(
+        default=None,
+        description="WebSocket RPC URL; enables eth_subscribe log streaming (falls back to contracts.json \"ws\")"
     )
     
     WEB3_PROVIDER_TIMEOUT: int = Field(
@@ -272,6 +354,34 @@ class Settings(BaseSettings):
         le=300,
         description="Web3 provider request timeout in seconds"
     )
+    
+    WEB3_HTTP_POOL_SIZE: int = Field(
+        default=20,
+        ge=1,
+        le=200,
+        description="Keep-alive HTTP connections per RPC endpoint (sync and async providers)"
+    )
+    
+    WEB3_CONNECTION_CHECK_INTERVAL: int = Field(
+        default=15,
+        ge=1,
+        le=600,
+        description="Seconds between background RPC connection checks"
+    )
+    
+    WEB3_RPC_COOLDOWN: int = Field(
+        default=30,
+        ge=1,
+        le=3600,
+        description="Base seconds a throttled or failing RPC endpoint is taken out of rotation"
+    )
+ 
+    WEB3_BLOCK_CACHE_SIZE: int = Field(
+        default=4096,
+        ge=16,
+        le=1_000_000,
+        description="Max block headers kept in the Web3Client LRU cache"
+    )
  
     TOKEN_ADDRESS: Optional[str] = Field(
         default=None,
@@ -331,6 +441,83 @@ class Settings(BaseSettings):
         le=10000,
         description="Batch size for blockchain event queries"
     )
+    
+    BLOCKCHAIN_BACKFILL_SHARD_SIZE: int = Field(
+        default=10000,
+        ge=100,
+        le=1_000_000,
+        description="Blocks per backfill shard (unit of parallelism and checkpointing)"
+    )
+    
+    BLOCKCHAIN_BACKFILL_CONCURRENCY: int = Field(
+        default=4,
+        ge=1,
+        le=32,
+        description="Backfill shards fetched in parallel"
+    )
+
+    BLOCKCHAIN_BACKFILL_SHARD_LEASE: int = Field(
+        default=600,
+        ge=30,
+        description="Seconds without a checkpoint before a running shard can be reclaimed"
+    )
+    
+    BLOCKCHAIN_PROCESS_BATCH_SIZE: int = Field(
+        default=500,
+        ge=1,
+        le=10000,
+        description="Events claimed per processing batch (FOR UPDATE SKIP LOCKED)"
+    )
+    
+    BLOCKCHAIN_EVENTS_PARTITION_BLOCKS: int = Field(
+        default=10_000_000,
+        ge=100_000,
+        description="Block range per blockchain_events partition (fixed once partitions exist)"
+    )
+    
+    BLOCKCHAIN_EVENTS_RETENTION_BLOCKS: Optional[int] = Field(
+        default=None,
+        ge=1_000_000,
+        description="Partitions older than this many blocks behind head are archived (None = keep all)"
+    )
+    
+    BLOCKCHAIN_ARCHIVE_TABLESPACE: Optional[str] = Field(
+        default=None,
+        description="Tablespace (e.g. on compressed storage) that archived partitions are moved to"
+    )
+    
+    BLOCKCHAIN_EVENT_MAX_ATTEMPTS: int = Field(
+        default=5,
+        ge=1,
+        le=100,
+        description="Handler attempts before an event is moved to the dead-letter table"
+    )
+    
+    BLOCKCHAIN_EVENT_RETRY_BASE_DELAY: int = Field(
+        default=60,
+        ge=1,
+        description="Seconds before the first retry of a failed event (doubles per attempt)"
+    )
+    
+    BLOCKCHAIN_EVENT_RETRY_MAX_DELAY: int = Field(
+        default=3600,
+        ge=1,
+        description="Upper bound for the retry backoff of a failed event (seconds)"
+    )
+    
+    BLOCKCHAIN_CONFIRMATIONS: int = Field(
+        default=20,
+        ge=0,
+        le=10000,
+        description="Blocks behind head the listener stays, so shallow reorgs never reach the DB"
+    )
+    
+    BLOCKCHAIN_REORG_MAX_DEPTH: int = Field(
+        default=5000,
+        ge=10,
+        le=1_000_000,
+        description="How far back block hashes are kept to find the fork point of a reorg"
+    )
  
     CELERY_BROKER_URL: str = Field(
         default="redis://localhost:6379/0",
@@ -363,6 +550,13 @@ class Settings(BaseSettings):
         ge=10,
         description="Celery task soft time limit in seconds"
     )
+
+    ADMIN_STATS_REFRESH_INTERVAL: int = Field(
+        default=300,
+        ge=30,
+        le=86400,
+        description="Seconds between refreshes of the admin stats materialized views"
+    )
  
     REDIS_URL: str = Field(
         default="redis://localhost:6379/0",
@@ -392,6 +586,20 @@ class Settings(BaseSettings):
         default=True,
         description="Enable Redis caching"
     )
+
+    CACHE_L1_MAX_ITEMS: int = Field(
+        default=1024,
+        ge=0,
+        le=100_000,
+        description="Max entries of the in-process (L1) cache per worker"
+    )
+
+    CACHE_L1_TTL: int = Field(
+        default=5,
+        ge=1,
+        le=300,
+        description="Default TTL in seconds of in-process (L1) cache entries"
+    )
  
     MAX_UPLOAD_SIZE: int = Field(
         default=10 * 1024 * 1024,                                # 10MB
@@ -594,6 +802,10 @@ class Settings(BaseSettings):
         logger.info(f"🐛 Debug Mode: {'✅ ON' if self.DEBUG else '❌ OFF'}")
         logger.info(f"💾 Database: {self.database_name} ({'Supabase' if self.is_supabase else 'PostgreSQL'})")
         logger.info(f"🔗 Database Pool: {self.DB_POOL_SIZE} + {self.DB_MAX_OVERFLOW} overflow")
+        logger.info(f"   Async Share: {self.DB_ASYNC_POOL_SIZE} + {self.DB_ASYNC_MAX_OVERFLOW} overflow")
+        logger.info(f"   Worker Pool: {self.DB_WORKER_POOL_SIZE} + {self.DB_WORKER_MAX_OVERFLOW} overflow")
+        logger.info(f"   Listener Pool: {self.DB_LISTENER_POOL_SIZE} + {self.DB_LISTENER_MAX_OVERFLOW} overflow")
+        logger.info(f"   Read Replica: {'✅ Configured' if self.DATABASE_READONLY_URL else '❌ Shares api pool'}")
         logger.info(f"📡 API Prefix: {self.API_V1_STR}")
         logger.info(f"📚 API Docs: {'✅ Enabled' if self.should_show_docs else '❌ Disabled'}")
         logger.info("-" * 80)
@@ -621,6 +833,7 @@ class Settings(BaseSettings):
         if self.BLOCKCHAIN_SYNC_ENABLED:
             logger.info(f"   Sync Interval: {self.BLOCKCHAIN_SYNC_INTERVAL}s")
             logger.info(f"   Batch Size: {self.BLOCKCHAIN_BATCH_SIZE} blocks")
+            logger.info(f"   Confirmations: {self.BLOCKCHAIN_CONFIRMATIONS} blocks")
         logger.info("-" * 80)
         logger.info("⚙️ CELERY CONFIGURATION")
         logger.info(f"   Broker: {self.CELERY_BROKER_URL}")
@@ -633,6 +846,7 @@ class Settings(BaseSettings):
         logger.info(f"   Cache: {'✅ Enabled' if self.CACHE_ENABLED else '❌ Disabled'}")
         if self.CACHE_ENABLED:
             logger.info(f"   Cache TTL: {self.CACHE_TTL}s ({self.CACHE_TTL // 60} minutes)")
+            logger.info(f"   L1 Cache: {self.CACHE_L1_MAX_ITEMS} items, {self.CACHE_L1_TTL}s")
         logger.info("-" * 80)
         logger.info("🎛️ FEATURE FLAGS")
         logger.info(f"   Governance: {'✅' if self.ENABLE_GOVERNANCE else '❌'}")
@@ -704,7 +918,7 @@ class Settings(BaseSettings):
     def to_dict(self) -> Dict[str, Any]:
         sensitive_fields = {
             "SECRET_KEY", "ADMIN_PASSWORD", "ADMIN_TOKEN",
-            "DATABASE_URL", "SENDGRID_API_KEY", "SMTP_PASSWORD",
+            "DATABASE_URL", "DATABASE_READONLY_URL", "SENDGRID_API_KEY", "SMTP_PASSWORD",
             "REDIS_PASSWORD", "SENTRY_DSN"
         }
         
@@ -1,7 +1,13 @@
 from sqlalchemy import create_engine, event, pool, text
 from sqlalchemy.orm import sessionmaker, Session
-from contextlib import contextmanager
-from typing import Generator
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+from contextlib import contextmanager, asynccontextmanager
+from typing import AsyncGenerator, Callable, Dict, Generator, Optional, Any
 import logging
 
 from app.core.config import Settings, settings
@@ -9,19 +15,50 @@ from app.core.config import Settings, settings
 logger = logging.getLogger(__name__)
 
 class DatabaseManager:
-    def __init__(self, settings: Settings):
+    def __init__(
+        self,
+        settings: Settings,
+        role: str = "api",
+        database_url: Optional[str] = None,
+        pool_size: Optional[int] = None,
+        max_overflow: Optional[int] = None,
+        read_only: bool = False,
+        async_pool_size: int = 0,
+        async_max_overflow: int = 0,
+    ):
         self.settings = settings
+        self.role = role
+        self.database_url = database_url or settings.DATABASE_URL
+        pool_size = pool_size if pool_size is not None else settings.DB_POOL_SIZE
+        max_overflow = max_overflow if max_overflow is not None else settings.DB_MAX_OVERFLOW
+        # The async engine's connections are carved out of the role's budget,
+        # so the sync and async pools together never exceed it.
+        self.async_pool_size = min(async_pool_size, pool_size - 1)
+        self.async_max_overflow = min(async_max_overflow, max_overflow)
+        self.pool_size = pool_size - self.async_pool_size
+        self.max_overflow = max_overflow - self.async_max_overflow
+        self.read_only = read_only
         self._engine = None
         self._session_factory = None
+        self._async_engine: Optional[AsyncEngine] = None
+        self._async_session_factory: Optional[async_sessionmaker[AsyncSession]] = None
         self._initialize()
     
+    def _connect_args(self) -> dict:
+        if "supabase" in self.database_url.lower():
+            return {"sslmode": "require"}
+        return {}
+    
+    def _execution_options(self) -> dict:
+        if self.read_only:
+            return {"postgresql_readonly": True}
+        return {}
+    
     def _initialize(self) -> None:
-        connect_args = {}
-
-        if self.settings.is_supabase:
-            connect_args = {"sslmode": "require"}
-            logger.info("🔒 SSL enabled for Supabase")
-        database_url = self.settings.database_url_sync
+        connect_args = self._connect_args()
+        if connect_args:
+            logger.info(f"🔒 SSL enabled for Supabase ({self.role})")
+        database_url = self.database_url
         if database_url.startswith("postgresql://"):
             database_url = database_url.replace("postgresql://", "postgresql+psycopg://", 1)
             logger.info("🔄 Using psycopg3 driver")
@@ -29,13 +66,14 @@ class DatabaseManager:
         self._engine = create_engine(
             database_url,  
             pool_pre_ping=self.settings.DB_POOL_PRE_PING,
-            pool_size=self.settings.DB_POOL_SIZE,
-            max_overflow=self.settings.DB_MAX_OVERFLOW,
+            pool_size=self.pool_size,
+            max_overflow=self.max_overflow,
             pool_recycle=self.settings.DB_POOL_RECYCLE,
             pool_timeout=30,
             echo=self.settings.DB_ECHO,
             future=True,
             connect_args=connect_args,
+            execution_options=self._execution_options(),
             poolclass=pool.QueuePool,
         )
 
@@ -46,12 +84,43 @@ class DatabaseManager:
             expire_on_commit=False,
         )
         self._add_event_listeners()
-        logger.info("✅ Database engine initialized")
+        logger.info(
+            f"✅ Database engine initialized for role '{self.role}' "
+            f"(pool {self.pool_size} + {self.max_overflow} overflow)"
+        )
+    
+    def _initialize_async(self) -> None:
+        if not self.async_pool_size:
+            raise RuntimeError(f"Database role '{self.role}' has no async connection budget")
+        # psycopg3 exposes its async driver under the same "postgresql+psycopg"
+        # dialect; create_async_engine picks the asyncio variant automatically.
+        self._async_engine = create_async_engine(
+            self.database_url.replace("postgresql://", "postgresql+psycopg://", 1),
+            pool_pre_ping=self.settings.DB_POOL_PRE_PING,
+            pool_size=self.async_pool_size,
+            max_overflow=self.async_max_overflow,
+            pool_recycle=self.settings.DB_POOL_RECYCLE,
+            pool_timeout=30,
+            echo=self.settings.DB_ECHO,
+            connect_args=self._connect_args(),
+            execution_options=self._execution_options(),
+        )
+
+        self._async_session_factory = async_sessionmaker(
+            bind=self._async_engine,
+            class_=AsyncSession,
+            autoflush=False,
+            expire_on_commit=False,
+        )
+        logger.info(
+            f"✅ Async database engine initialized for role '{self.role}' "
+            f"(pool {self.async_pool_size} + {self.async_max_overflow} overflow)"
+        )
     
     def _add_event_listeners(self) -> None:
         @event.listens_for(self._engine, "connect")
         def receive_connect(dbapi_conn, connection_record):
-            logger.debug("🔌 New database connection established")
+            logger.debug(f"🔌 New database connection established ({self.role})")
         
         @event.listens_for(self._engine, "checkout")
         def receive_checkout(dbapi_conn, connection_record, connection_proxy):
@@ -65,9 +134,20 @@ class DatabaseManager:
     def engine(self):
         return self._engine
     
+    @property
+    def async_engine(self) -> AsyncEngine:
+        if self._async_engine is None:
+            self._initialize_async()
+        return self._async_engine
+    
     def get_session(self) -> Session:
         return self._session_factory()
     
+    def get_async_session(self) -> AsyncSession:
+        if self._async_session_factory is None:
+            self._initialize_async()
+        return self._async_session_factory()
+    
     @contextmanager
     def session_scope(self) -> Generator[Session, None, None]:
         session = self.get_session()
@@ -80,6 +160,18 @@ class DatabaseManager:
         finally:
             session.close()
     
+    @asynccontextmanager
+    async def async_session_scope(self) -> AsyncGenerator[AsyncSession, None]:
+        session = self.get_async_session()
+        try:
+            yield session
+            await session.commit()
+        except Exception:
+            await session.rollback()
+            raise
+        finally:
+            await session.close()
+    
     def check_connection(self) -> bool:
         try:
             with self._engine.connect() as conn:
@@ -89,11 +181,127 @@ class DatabaseManager:
             logger.error(f"❌ Database connection failed: {e}")
             return False
     
+    async def check_connection_async(self) -> bool:
+        try:
+            async with self.async_engine.connect() as conn:
+                await conn.execute(text("SELECT 1"))
+            return True
+        except Exception as e:
+            logger.error(f"❌ Async database connection failed: {e}")
+            return False
+    
+    def pool_stats(self) -> Dict[str, Any]:
+        stats = {
+            "sync": _describe_pool(self._engine.pool),
+        }
+        if self._async_engine is not None:
+            stats["async"] = _describe_pool(self._async_engine.pool)
+        return stats
+    
     def close(self) -> None:
         if self._engine:
             self._engine.dispose()
-            logger.info("🔌 Database connections closed")
+            logger.info(f"🔌 Database connections closed ({self.role})")
+    
+    async def close_async(self) -> None:
+        if self._async_engine:
+            await self._async_engine.dispose()
+            logger.info(f"🔌 Async database connections closed ({self.role})")
+
+def _describe_pool(engine_pool) -> Dict[str, Any]:
+    return {
+        "size": engine_pool.size(),
+        "checked_in": engine_pool.checkedin(),
+        "checked_out": engine_pool.checkedout(),
+        "overflow": engine_pool.overflow(),
+    }
+
+class EngineRegistry:
+    """
+    Single owner of every SQLAlchemy engine in the process.
+
+    Each role gets its own pool sizing, and engines are only built the first
+    time a role is requested, so an API process never opens a worker pool and
+    a Celery worker never opens an API pool. The readonly role reuses the api
+    engine unless DATABASE_READONLY_URL points at a replica.
+    """
+
+    def __init__(self, settings: Settings):
+        self.settings = settings
+        self._managers: Dict[str, DatabaseManager] = {}
+    
+    def _build(self, role: str) -> DatabaseManager:
+        s = self.settings
+        if role == "api":
+            return DatabaseManager(
+                s,
+                role="api",
+                async_pool_size=s.DB_ASYNC_POOL_SIZE,
+                async_max_overflow=s.DB_ASYNC_MAX_OVERFLOW,
+            )
+        if role == "worker":
+            return DatabaseManager(
+                s,
+                role="worker",
+                pool_size=s.DB_WORKER_POOL_SIZE,
+                max_overflow=s.DB_WORKER_MAX_OVERFLOW,
+            )
+        if role == "listener":
+            return DatabaseManager(
+                s,
+                role="listener",
+                pool_size=s.DB_LISTENER_POOL_SIZE,
+                max_overflow=s.DB_LISTENER_MAX_OVERFLOW,
+            )
+        if role == "readonly":
+            if not s.DATABASE_READONLY_URL:
+                return self.get("api")
+            return DatabaseManager(
+                s,
+                role="readonly",
+                database_url=s.DATABASE_READONLY_URL,
+                pool_size=s.DB_READONLY_POOL_SIZE,
+                max_overflow=s.DB_READONLY_MAX_OVERFLOW,
+                read_only=True,
+            )
+        raise ValueError(f"Unknown database role: {role}")
+    
+    def get(self, role: str = "api") -> DatabaseManager:
+        if role not in self._managers:
+            self._managers[role] = self._build(role)
+        return self._managers[role]
+    
+    def session_factory(self, role: str) -> Callable[[], Session]:
+        def factory() -> Session:
+            return self.get(role).get_session()
+        return factory
+    
+    def _unique_managers(self) -> Dict[str, DatabaseManager]:
+        unique: Dict[str, DatabaseManager] = {}
+        for role, manager in self._managers.items():
+            if manager.role == role:
+                unique[role] = manager
+        return unique
+    
+    def pool_stats(self) -> Dict[str, Any]:
+        stats: Dict[str, Any] = {}
+        for role, manager in self._managers.items():
+            if manager.role != role:
+                stats[role] = {"shared_with": manager.role}
+            else:
+                stats[role] = manager.pool_stats()
+        return stats
+    
+    def close_all(self) -> None:
+        for manager in self._unique_managers().values():
+            manager.close()
+    
+    async def close_all_async(self) -> None:
+        for manager in self._unique_managers().values():
+            await manager.close_async()
 
-db_manager = DatabaseManager(settings)
+db_registry = EngineRegistry(settings)
+db_manager = db_registry.get("api")
 engine = db_manager.engine
-SessionLocal = db_manager.get_session
\ No newline at end of file
+SessionLocal = db_manager.get_session
+AsyncSessionLocal = db_manager.get_async_session
@@ -76,13 +76,13 @@ def get_proposal_status(
 def get_fund_status(
     retirement_started: bool,
     early_retirement_approved: bool,
-    timelock_end: datetime
+    timelock_end: Optional[datetime]
 ) -> str:
     if retirement_started:
         return FundStatus.RETIRED.value
     elif early_retirement_approved:
         return FundStatus.EARLY_APPROVED.value
-    elif datetime.utcnow() >= timelock_end:
+    elif timelock_end and datetime.utcnow() >= timelock_end:
         return FundStatus.READY_FOR_RETIREMENT.value
     else:
         return FundStatus.ACCUMULATING.value
@@ -0,0 +1,91 @@
+"""
+Keyset (cursor) pagination.
+
+Pages are read with a seek predicate on (sort_key, id) instead of OFFSET, so
+a deep page costs the same as the first one. The cursor is the (sort_key, id)
+of the last row of a page, base64-encoded; clients treat it as opaque and
+pass it back unchanged. Sort keys must be non-null columns.
+"""
+from pydantic import BaseModel
+from sqlalchemy import desc, literal, tuple_
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from datetime import datetime
+from decimal import Decimal
+from typing import Any, Generic, List, Optional, Sequence, Tuple, TypeVar
+import binascii
+import json
+
+from app.core.config import settings
+from app.core.exceptions import ValidationException
+
+T = TypeVar("T")
+
+class Page(BaseModel, Generic[T]):
+    items: List[T]
+    next_cursor: Optional[str] = None
+
+def clamp_limit(limit: Optional[int]) -> int:
+    return max(1, min(limit or settings.DEFAULT_PAGE_SIZE, settings.MAX_PAGE_SIZE))
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    payload = [
+        v.isoformat() if isinstance(v, datetime) else str(v) if isinstance(v, Decimal) else v
+        for v in values
+    ]
+    raw = json.dumps(payload, separators=(",", ":")).encode()
+    return urlsafe_b64encode(raw).decode().rstrip("=")
+
+def decode_cursor(cursor: str, columns: Sequence[Any]) -> List[Any]:
+    try:
+        raw = urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        values = json.loads(raw)
+        if not isinstance(values, list) or len(values) != len(columns) or None in values:
+            raise ValueError("cursor shape")
+        return [_coerce(column, value) for column, value in zip(columns, values)]
+    except (ValueError, TypeError, binascii.Error):
+        raise ValidationException("Invalid pagination cursor", {"cursor": cursor})
+
+def _coerce(column: Any, value: Any) -> Any:
+    python_type = column.type.python_type
+    if python_type is datetime:
+        return datetime.fromisoformat(value)
+    return python_type(value)
+
+def seek(
+    columns: Sequence[Any],
+    cursor: Optional[str],
+    descending: bool = True
+) -> Tuple[Optional[Any], List[Any]]:
+    """(WHERE clause or None, ORDER BY list) for the page after cursor."""
+    order = [desc(column) if descending else column for column in columns]
+    if not cursor:
+        return None, order
+    values = decode_cursor(cursor, columns)
+    key = tuple_(*columns)
+    bound = tuple_(*[literal(value, column.type) for column, value in zip(columns, values)])
+    return (key < bound if descending else key > bound), order
+
+def build_page(rows: List[Any], columns: Sequence[Any], limit: int) -> Page:
+    """Rows were fetched with limit + 1; the extra row only signals a next page."""
+    if len(rows) <= limit:
+        return Page(items=rows)
+    rows = rows[:limit]
+    return Page(
+        items=rows,
+        next_cursor=encode_cursor([getattr(rows[-1], column.key) for column in columns])
+    )
+
+def paginate(
+    query: Any,
+    columns: Sequence[Any],
+    cursor: Optional[str] = None,
+    limit: Optional[int] = None,
+    descending: bool = True
+) -> Page:
+    """Apply a keyset page to an ORM query (without ORDER BY of its own)."""
+    limit = clamp_limit(limit)
+    condition, order = seek(columns, cursor, descending)
+    if condition is not None:
+        query = query.filter(condition)
+    rows = query.order_by(*order).limit(limit + 1).all()
+    return build_page(rows, columns, limit)
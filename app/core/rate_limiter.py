@@ -15,7 +15,8 @@ class RedisRateLimiter:
         self.enabled = settings.RATE_LIMIT_ENABLED
     
     async def initialize(self):
-        if not self.enabled:
+        # The response cache (app.core.cache) shares this connection.
+        if not self.enabled and not settings.CACHE_ENABLED:
             logger.info("⚠️ Rate limiting disabled")
             return
         
@@ -26,16 +27,21 @@ class RedisRateLimiter:
                 encoding="utf-8",
                 decode_responses=True
             )
-            await FastAPILimiter.init(self.redis_client)
-            logger.info("✅ Redis rate limiter initialized")
+            if self.enabled:
+                await FastAPILimiter.init(self.redis_client)
+                logger.info("✅ Redis rate limiter initialized")
+            else:
+                logger.info("⚠️ Rate limiting disabled, Redis opened for caching only")
         
         except Exception as e:
             logger.error(f"❌ Failed to initialize Redis rate limiter: {e}")
             self.enabled = False
+            self.redis_client = None
     
     async def close(self):
         if self.redis_client:
-            await FastAPILimiter.close()
+            if self.enabled:
+                await FastAPILimiter.close()
             await self.redis_client.close()
             logger.info("🔌 Redis rate limiter closed")
     
@@ -13,8 +13,14 @@ from app.models.treasury import (
     TreasuryStats, FundFeeRecord, EarlyRetirementRequest, TreasuryWithdrawal
 )
 
-from app.models.blockchain import BlockchainEvent
+from app.models.blockchain import (
+    BlockchainEvent,
+    BackfillShard,
+    BlockchainSyncState,
+    BlockchainBlockHash,
+    BlockchainDeadLetter
+)
 from app.models.notification import Notification
-from app.models.analytics import DailySnapshot
+from app.models.analytics import DailySnapshot, StatCounter
 
 __all__ = ["Base"]
\ No newline at end of file
@@ -1,56 +1,18 @@
-from sqlalchemy import create_engine, event, text
-from sqlalchemy.orm import sessionmaker
-from app.core.config import settings
+from app.core.database import db_registry, db_manager
 import logging
 
 logger = logging.getLogger(__name__)
 
-database_url = settings.database_url_sync
-if database_url.startswith("postgresql://"):
-    database_url = database_url.replace("postgresql://", "postgresql+psycopg://", 1)
-
-connect_args = {}
-if settings.is_supabase:
-    connect_args = {"sslmode": "require"}
-    logger.info("🔒 SSL mode enabled for Supabase connection")
-
-logger.info(f"🔗 Connecting to database")
-
-engine = create_engine(
-    database_url,
-    pool_pre_ping=settings.DB_POOL_PRE_PING,
-    pool_size=settings.DB_POOL_SIZE,
-    max_overflow=settings.DB_MAX_OVERFLOW,
-    pool_timeout=30,
-    pool_recycle=settings.DB_POOL_RECYCLE,
-    echo=settings.DB_ECHO,
-    future=True,
-    connect_args=connect_args,
-)
-
-SessionLocal = sessionmaker(
-    autocommit=False,
-    autoflush=False,
-    bind=engine,
-    expire_on_commit=False,
-)
-
-@event.listens_for(engine, "connect")
-def receive_connect(dbapi_conn, connection_record):
-    logger.debug("🔌 New database connection established")
+# Every engine lives in the shared registry (app.core.database); this module
+# only exposes role-bound session factories so callers don't build pools.
+engine = db_manager.engine
+SessionLocal = db_manager.get_session
+WorkerSessionLocal = db_registry.session_factory("worker")
+ListenerSessionLocal = db_registry.session_factory("listener")
+ReadOnlySessionLocal = db_registry.session_factory("readonly")
 
 def check_connection() -> bool:
-    try:
-        with engine.connect() as conn:
-            conn.execute(text("SELECT 1"))
-        return True
-    except Exception as e:
-        logger.error(f"❌ Database connection failed: {e}")
-        return False
+    return db_manager.check_connection()
 
 def close_db():
-    if engine:
-        engine.dispose()
-        logger.info("🔌 Database connections closed")
-
-logger.info("✅ Database engine created successfully")
\ No newline at end of file
+    db_registry.close_all()
@@ -12,6 +12,7 @@ import logging
 from app.core.config import settings
 from app.core.logging import setup_logging
 from app.db.session import check_connection, close_db
+from app.core.database import db_registry, db_manager
 from app.core.middleware import (
     RequestLoggingMiddleware,
     SecurityHeadersMiddleware,
@@ -25,9 +26,11 @@ from app.core.exceptions import (
     generic_exception_handler,
 )
 from app.core.rate_limiter import rate_limiter  
+from app.core.cache import response_cache, cached
 from app.api.v1.api import api_router
 from app.blockchain.web3_client import web3_client
 from app.blockchain.event_listener import event_listener
+from app.blockchain.log_stream import log_stream
 
 setup_logging(settings)
 logger = logging.getLogger(__name__)
@@ -44,19 +47,20 @@ async def lifespan(app: FastAPI):
     else:
         logger.error("❌ Database connection failed")
 
-    if settings.RATE_LIMIT_ENABLED:
+    if settings.RATE_LIMIT_ENABLED or settings.CACHE_ENABLED:
         try:
             await rate_limiter.initialize()
-            logger.info("✅ Redis rate limiter initialized")
+            await response_cache.start()
         except Exception as e:
             logger.error(f"⚠️ Failed to initialize rate limiter: {e}")
             logger.warning("Continuing without rate limiting...")
     else:
         logger.info("ℹ️ Rate limiting disabled by configuration")
 
+    await web3_client.start_async()
     if web3_client.is_connected():
         logger.info(f"✅ Blockchain connected: {web3_client.network_config['name']}")
-        logger.info(f"📡 Latest block: {web3_client.get_latest_block()}")
+        logger.info(f"📡 Latest block: {await web3_client.get_latest_block_async()}")
         if settings.ENVIRONMENT != "testing":
             event_listener_task = asyncio.create_task(event_listener.start())
             logger.info("🎧 Blockchain event listener started")
@@ -84,14 +88,17 @@ async def lifespan(app: FastAPI):
         except asyncio.CancelledError:
             pass
         logger.info("🎧 Event listener stopped")
+    await web3_client.close_async()
 
-    if settings.RATE_LIMIT_ENABLED:
+    if settings.RATE_LIMIT_ENABLED or settings.CACHE_ENABLED:
         try:
+            await response_cache.stop()
             await rate_limiter.close()
             logger.info("🔌 Redis rate limiter closed")
         except Exception as e:
             logger.error(f"Error closing rate limiter: {e}")
     close_db()
+    await db_registry.close_all_async()
     logger.info("💾 Database connections closed")
     logger.info("👋 Shutdown complete")
 
@@ -128,6 +135,7 @@ app.add_exception_handler(SQLAlchemyError, database_exception_handler)
 app.add_exception_handler(Exception, generic_exception_handler)
 
 @app.get("/")
+@cached("root", l1_ttl=30, shared=False)
 async def root():
     return {
         "message": f"Welcome to {settings.PROJECT_NAME}",
@@ -138,8 +146,9 @@ async def root():
     }
 
 @app.get("/health")
+@cached("health", l1_ttl=2, shared=False)
 async def health_check():
-    db_healthy = check_connection()
+    db_healthy = await db_manager.check_connection_async()
     blockchain_connected = web3_client.is_connected()
     redis_healthy = False
     if settings.RATE_LIMIT_ENABLED and rate_limiter.redis_client:
@@ -157,7 +166,7 @@ async def health_check():
         "blockchain": {
             "connected": blockchain_connected,
             "network": web3_client.network_config["name"] if blockchain_connected else None,
-            "latest_block": web3_client.get_latest_block() if blockchain_connected else 0
+            "latest_block": await web3_client.get_latest_block_async() if blockchain_connected else 0
         },
         "email": "enabled" if settings.email_enabled else "disabled",
         "redis": "connected" if redis_healthy else "disconnected",  
@@ -170,14 +179,12 @@ app.include_router(
 )
 
 if settings.is_development:
-    from app.db.session import engine
-    
     @app.get("/debug/config")
     async def debug_config():
         return {
             "environment": settings.ENVIRONMENT,
             "debug": settings.DEBUG,
-            "database": "connected" if check_connection() else "disconnected",
+            "database": "connected" if await db_manager.check_connection_async() else "disconnected",
             "blockchain": web3_client.network_config if web3_client.is_connected() else None,
             "email_enabled": settings.email_enabled,
             "cors_origins": settings.BACKEND_CORS_ORIGINS,
@@ -188,13 +195,7 @@ if settings.is_development:
     
     @app.get("/debug/db-pool")
     async def debug_db_pool():
-        pool = engine.pool
-        return {
-            "size": pool.size(),
-            "checked_in": pool.checkedin(),
-            "checked_out": pool.checkedout(),
-            "overflow": pool.overflow(),
-        }
+        return db_registry.pool_stats()
     
     @app.get("/debug/blockchain")
     async def debug_blockchain():
@@ -205,13 +206,16 @@ if settings.is_development:
             "connected": True,
             "network": web3_client.network_config["name"],
             "chain_id": web3_client.network_config["chainId"],
-            "latest_block": web3_client.get_latest_block(),
-            "contracts": web3_client.network_config["contracts"]
+            "latest_block": await web3_client.get_latest_block_async(),
+            "contracts": web3_client.network_config["contracts"],
+            "rpc": web3_client.rpc_stats(),
+            "log_stream": log_stream.stats(),
+            "block_cache": web3_client.block_cache_stats(),
         }
     
     @app.get("/debug/redis")
     async def debug_redis():
-        if not settings.RATE_LIMIT_ENABLED:
+        if not settings.RATE_LIMIT_ENABLED and not settings.CACHE_ENABLED:
             return {"status": "disabled"}
         
         if not rate_limiter.redis_client:
@@ -227,6 +231,7 @@ if settings.is_development:
                 "uptime_seconds": info.get("uptime_in_seconds"),
                 "connected_clients": info.get("connected_clients"),
                 "used_memory_human": info.get("used_memory_human"),
+                "response_cache": response_cache.stats(),
             }
         except Exception as e:
             return {
@@ -37,13 +37,21 @@ from app.models.protocol import (
     ProtocolType
 )
 from app.models.notification import Notification
-from app.models.blockchain import BlockchainEvent
+from app.models.blockchain import (
+    BlockchainEvent,
+    BlockchainEventKey,
+    BackfillShard,
+    BlockchainSyncState,
+    BlockchainBlockHash,
+    BlockchainDeadLetter
+)
 from app.models.faucet_request import FaucetRequest
 from app.models.analytics import (
     DailySnapshot,
     WeeklyReport,
     MonthlyReport,
     SystemMetric,
+    StatCounter,
     UserActivityLog,
     SYSTEM_METRICS
 )
@@ -97,6 +105,11 @@ __all__ = [
     
     # Blockchain
     "BlockchainEvent",
+    "BlockchainEventKey",
+    "BackfillShard",
+    "BlockchainSyncState",
+    "BlockchainBlockHash",
+    "BlockchainDeadLetter",
     
     # Faucet
     "FaucetRequest",
@@ -106,6 +119,7 @@ __all__ = [
     "WeeklyReport",
     "MonthlyReport",
     "SystemMetric",
+    "StatCounter",
     "UserActivityLog",
     "SYSTEM_METRICS",
 ]
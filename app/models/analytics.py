@@ -182,6 +182,25 @@ class SystemMetric(Base):
             f"type={self.metric_type})>"
         )
 
+class StatCounter(Base):
+    """
+    Running total kept by the write paths (see CounterService), one row per
+    namespace ("users", "governance", ...) and counter name.
+    """
+    __tablename__ = "stat_counters"
+
+    namespace = Column(String(50), primary_key=True)
+    name = Column(String(100), primary_key=True)
+    value = Column(DECIMAL(38, 6), default=0, nullable=False)
+    updated_at = Column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        nullable=False
+    )
+
+    def __repr__(self):
+        return f"<StatCounter({self.namespace}.{self.name}={self.value})>"
+
 class UserActivityLog(Base):
     __tablename__ = "user_activity_logs"
     id = Column(Integer, primary_key=True, index=True)
@@ -1,21 +1,103 @@
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, Text, Index, UniqueConstraint
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, Text, Index, Sequence, UniqueConstraint
 from sqlalchemy.dialects.postgresql import JSONB
-from sqlalchemy.sql import func
+from sqlalchemy.sql import func, text
 from app.db.base_class import Base
 
 class BlockchainEvent(Base):
+    """
+    Range-partitioned by block_number (BLOCKCHAIN_EVENTS_PARTITION_BLOCKS per
+    partition), so the partition key is part of the primary key and uq_tx_log;
+    one row per (transaction_hash, log_index) is enforced by BlockchainEventKey.
+    Logs streamed from the head are stored unconfirmed and are not processed
+    until a confirmed window re-reads them (see EventIngestor.ingest).
+    Dead-lettered events stay as tombstones, so a re-scan of their block does
+    not store them again as fresh events.
+    """
     __tablename__ = "blockchain_events"
+    id = Column(Integer, Sequence("blockchain_events_id_seq"), primary_key=True)
+    event_type = Column(String(100), nullable=False)
+    contract_address = Column(String(42), nullable=False)
+    event_data = Column(JSONB, nullable=False)
+    transaction_hash = Column(String(66), nullable=False)
+    block_number = Column(Integer, primary_key=True, index=True)
+    block_timestamp = Column(DateTime(timezone=True), nullable=False)
+    log_index = Column(Integer, nullable=False)
+    processed = Column(Boolean, default=False)
+    confirmed = Column(Boolean, nullable=False, default=True, server_default=text("true"))
+    dead_lettered = Column(Boolean, nullable=False, default=False, server_default=text("false"))
+    processed_at = Column(DateTime(timezone=True))
+    attempts = Column(Integer, nullable=False, default=0, server_default="0")
+    next_attempt_at = Column(DateTime(timezone=True), nullable=True)
+    last_error = Column(Text, nullable=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    __table_args__ = (
+        UniqueConstraint('transaction_hash', 'log_index', 'block_number', name='uq_tx_log'),
+        Index('ix_blockchain_events_type_block', 'event_type', 'block_number'),
+        Index('ix_blockchain_events_contract_block', 'contract_address', 'block_number'),
+        Index(
+            'ix_blockchain_events_pending', 'block_number', 'log_index',
+            postgresql_where=text('processed = false AND confirmed AND NOT dead_lettered')
+        ),
+        {'postgresql_partition_by': 'RANGE (block_number)'},
+    )
+
+class BlockchainEventKey(Base):
+    """
+    Unpartitioned (transaction_hash, log_index) key of every stored event, so a
+    log re-included at another height after a reorg is not stored twice. Keys
+    are inserted with their event and deleted with it; archived events keep
+    theirs.
+    """
+    __tablename__ = "blockchain_event_keys"
+    transaction_hash = Column(String(66), primary_key=True)
+    log_index = Column(Integer, primary_key=True)
+    block_number = Column(Integer, nullable=False, index=True)
+
+class BlockchainDeadLetter(Base):
+    """Events that kept failing their handler, parked out of the processing queue."""
+    __tablename__ = "blockchain_dead_letters"
     id = Column(Integer, primary_key=True, index=True)
+    event_id = Column(Integer, nullable=False, unique=True)
     event_type = Column(String(100), nullable=False, index=True)
-    contract_address = Column(String(42), nullable=False, index=True)
+    contract_address = Column(String(42), nullable=False)
     event_data = Column(JSONB, nullable=False)
     transaction_hash = Column(String(66), nullable=False)
     block_number = Column(Integer, nullable=False, index=True)
     block_timestamp = Column(DateTime(timezone=True), nullable=False)
     log_index = Column(Integer, nullable=False)
-    processed = Column(Boolean, default=False, index=True)
-    processed_at = Column(DateTime(timezone=True))
+    attempts = Column(Integer, nullable=False)
+    last_error = Column(Text, nullable=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+class BackfillShard(Base):
+    __tablename__ = "backfill_shards"
+    id = Column(Integer, primary_key=True, index=True)
+    from_block = Column(Integer, nullable=False)
+    to_block = Column(Integer, nullable=False)
+    checkpoint_block = Column(Integer, nullable=True)
+    status = Column(String(20), nullable=False, default="pending", index=True)
+    events_inserted = Column(Integer, nullable=False, default=0)
+    attempts = Column(Integer, nullable=False, default=0)
+    last_error = Column(Text, nullable=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
     __table_args__ = (
-        UniqueConstraint('transaction_hash', 'log_index', name='uq_tx_log'),
-    )
\ No newline at end of file
+        UniqueConstraint('from_block', 'to_block', name='uq_backfill_shard_range'),
+    )
+
+class BlockchainSyncState(Base):
+    __tablename__ = "blockchain_sync_state"
+    id = Column(Integer, primary_key=True, index=True)
+    contract_address = Column(String(42), nullable=False, unique=True)
+    last_block = Column(Integer, nullable=False, default=0)
+    last_block_hash = Column(String(66), nullable=True)
+    events_ingested = Column(Integer, nullable=False, default=0)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+
+
+class BlockchainBlockHash(Base):
+    __tablename__ = "blockchain_block_hashes"
+    block_number = Column(Integer, primary_key=True)
+    block_hash = Column(String(66), nullable=False)
+    parent_hash = Column(String(66), nullable=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
@@ -194,6 +194,7 @@ class Vote(Base):
         Index('idx_vote_voter', 'voter_id'),
         Index('idx_vote_support', 'support'),
         Index('idx_vote_proposal_support', 'proposal_id', 'support'),
+        Index('idx_vote_block_time', 'block_timestamp'),
     )
     
     # -------------------------------------------------------------------------
@@ -171,6 +171,7 @@ class FundTransaction(Base):
     to_address = Column(String(42), nullable=True)
 
     transaction_hash = Column(String(66), nullable=False, index=True)
+    log_index = Column(Integer, nullable=True)  # set for rows projected from chain logs
     block_number = Column(Integer, nullable=False, index=True)
     block_timestamp = Column(DateTime(timezone=True), nullable=False)
     gas_used = Column(Integer, nullable=True)
@@ -185,6 +186,8 @@ class FundTransaction(Base):
         Index('idx_fund_transactions_type', 'transaction_type'),
         Index('idx_fund_transactions_date', 'timestamp'),
         Index('idx_fund_transactions_hash', 'transaction_hash'),
+        Index('idx_fund_transactions_block_time', 'block_timestamp', 'transaction_type'),
+        Index('uq_fund_transactions_log', 'transaction_hash', 'log_index', 'transaction_type', unique=True),
     )
 
     def __repr__(self):
@@ -171,7 +171,8 @@ class TokenActivity(Base):
     amount = Column(DECIMAL(78, 18), nullable=True)
     
     # Información blockchain
-    transaction_hash = Column(String(66), nullable=True, unique=True, index=True)
+    transaction_hash = Column(String(66), nullable=True, index=True)
+    log_index = Column(Integer, nullable=True)  # set for rows projected from chain logs
     block_number = Column(Integer, nullable=True, index=True)
     
     # Timestamp
@@ -207,6 +208,7 @@ class TokenActivity(Base):
         Index('idx_token_activity_type', 'activity_type'),
         Index('idx_token_activity_date', 'created_at'),
         Index('idx_token_activity_wallet', 'wallet_address'),
+        Index('uq_token_activities_log', 'transaction_hash', 'log_index', unique=True),
     )
     
     # -------------------------------------------------------------------------
@@ -2,7 +2,6 @@ from sqlalchemy import Column, Integer, String, Boolean, DateTime, Text
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.db.base_class import Base
-from datetime import datetime
 
 class User(Base):
     __tablename__ = "users"
@@ -103,7 +102,7 @@ class User(Base):
             return "RETIRED"
         elif fund.early_retirement_approved:
             return "EARLY_APPROVED"
-        elif datetime.utcnow() >= fund.timelock_end:
+        elif fund.is_ready_for_retirement:
             return "READY_FOR_RETIREMENT"
         else:
             return "ACCUMULATING"
\ No newline at end of file
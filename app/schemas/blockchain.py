@@ -21,11 +21,36 @@ class BlockchainEventResponse(BaseModel):
     block_timestamp: datetime
     processed: bool
     processed_at: Optional[datetime]
+    confirmed: bool = True
+    dead_lettered: bool = False
+    attempts: int = 0
+    next_attempt_at: Optional[datetime] = None
+    last_error: Optional[str] = None
     created_at: datetime
     
     class Config:
         from_attributes = True
 
+class DeadLetterResponse(BaseModel):
+    id: int
+    event_id: int
+    event_type: str
+    contract_address: str
+    event_data: Dict[str, Any]
+    transaction_hash: str
+    block_number: int
+    block_timestamp: datetime
+    log_index: int
+    attempts: int
+    last_error: Optional[str]
+    created_at: datetime
+    
+    class Config:
+        from_attributes = True
+
+class DeadLetterReplay(BaseModel):
+    ids: List[int] = Field(..., min_length=1, max_length=1000)
+
 class EventFilter(BaseModel):
     event_types: Optional[List[str]] = None
     contract_address: Optional[str] = None
@@ -32,7 +32,7 @@ class PersonalFundResponse(BaseModel):
     total_withdrawn: Decimal
     retirement_started: bool
     early_retirement_approved: bool
-    timelock_end: datetime
+    timelock_end: Optional[datetime] = None
     monthly_deposit_count: int
     withdrawal_count: int
     created_at: datetime
@@ -1,23 +1,39 @@
 from sqlalchemy.orm import Session
-from sqlalchemy import func, desc
-from datetime import datetime, date, timedelta
+from sqlalchemy import func, desc, select, true
+from sqlalchemy.exc import SQLAlchemyError
+from datetime import datetime, date, time, timedelta, timezone
 from typing import List, Optional, Dict, Any
 from decimal import Decimal
 import logging
 
-from app.models.personal_fund import PersonalFund
+from app.models.personal_fund import PersonalFund, FundTransaction
 from app.models.token import TokenHolder
 from app.models.governance import Proposal, Vote
 from app.models.analytics import DailySnapshot
+from app.models.blockchain import BlockchainEvent
 from app.models.user import User
 from app.schemas.analytics import (
     UserDashboard, FundPerformance, SystemHealthCheck
 )
 from app.services.base_service import BaseService
+from app.services.counter_service import counter_service
 from app.core.helpers import get_fund_status
+from app.core.enums import FundTransactionType
 
 logger = logging.getLogger(__name__)
 
+DEPOSIT_TYPES = [t.value for t in (
+    FundTransactionType.INITIAL_DEPOSIT,
+    FundTransactionType.MONTHLY_DEPOSIT,
+    FundTransactionType.EXTRA_DEPOSIT,
+)]
+WITHDRAWAL_TYPES = [t.value for t in (
+    FundTransactionType.WITHDRAWAL,
+    FundTransactionType.AUTO_WITHDRAWAL,
+    FundTransactionType.EMERGENCY_WITHDRAWAL,
+)]
+FEE_TYPES = [FundTransactionType.FEE_PAYMENT.value]
+
 class AnalyticsService(BaseService[DailySnapshot]):
     def __init__(self):
         super().__init__(DailySnapshot)
@@ -97,99 +113,154 @@ class AnalyticsService(BaseService[DailySnapshot]):
             desc(DailySnapshot.snapshot_date)
         ).limit(limit).all()
     
+    def get_system_totals(self, db: Session, now: Optional[datetime] = None) -> Dict[str, Any]:
+        """
+        Holder, fund, proposal and vote totals in one statement: one
+        FILTER-aggregate subquery per table, cross joined (each yields one row).
+        """
+        now = now or datetime.utcnow()
+        open_proposal = (Proposal.executed == False) & (Proposal.cancelled == False)
+        holders = select(
+            func.count().label("total_holders"),
+            func.count().filter(TokenHolder.is_active == True).label("active_holders"),
+        ).select_from(TokenHolder).subquery()
+        funds = select(
+            func.count().label("total_funds"),
+            func.count().filter(PersonalFund.is_active == True).label("active_funds"),
+            func.count().filter(PersonalFund.retirement_started == True).label("funds_in_retirement"),
+            func.coalesce(func.sum(PersonalFund.total_balance), 0).label("total_tvl"),
+        ).select_from(PersonalFund).subquery()
+        proposals = select(
+            func.count().label("total_proposals"),
+            func.count().filter(open_proposal).label("open_proposals"),
+            func.count().filter(
+                open_proposal, Proposal.start_time <= now, Proposal.end_time >= now
+            ).label("active_proposals"),
+        ).select_from(Proposal).subquery()
+        votes = select(func.count().label("total_votes")).select_from(Vote).subquery()
+
+        row = db.execute(
+            select(holders, funds, proposals, votes)
+            .select_from(holders)
+            .join(funds, true())
+            .join(proposals, true())
+            .join(votes, true())
+        ).one()
+        totals = dict(row._mapping)
+        totals["total_tvl"] = Decimal(totals["total_tvl"])
+        return totals
+
+    def get_daily_flows(self, db: Session, day: date) -> Dict[str, Any]:
+        """Deposits, withdrawals, fees and votes of one UTC day, as range scans on block time."""
+        start = datetime.combine(day, time.min, tzinfo=timezone.utc)
+        end = start + timedelta(days=1)
+        amount = FundTransaction.amount
+        kind = FundTransaction.transaction_type
+        votes_cast = select(func.count()).select_from(Vote).where(
+            Vote.block_timestamp >= start,
+            Vote.block_timestamp < end
+        ).scalar_subquery()
+        row = db.execute(
+            select(
+                func.coalesce(func.sum(amount).filter(kind.in_(DEPOSIT_TYPES)), 0).label("total_deposits_today"),
+                func.coalesce(func.sum(amount).filter(kind.in_(WITHDRAWAL_TYPES)), 0).label("total_withdrawals_today"),
+                func.coalesce(func.sum(amount).filter(kind.in_(FEE_TYPES)), 0).label("total_fees_today"),
+                votes_cast.label("votes_cast_today"),
+            ).where(
+                FundTransaction.block_timestamp >= start,
+                FundTransaction.block_timestamp < end
+            )
+        ).one()
+        return {
+            "total_deposits_today": Decimal(row.total_deposits_today),
+            "total_withdrawals_today": Decimal(row.total_withdrawals_today),
+            "total_fees_today": Decimal(row.total_fees_today),
+            "votes_cast_today": row.votes_cast_today,
+        }
+
     def create_snapshot(self, db: Session) -> DailySnapshot:
-        today = date.today()
+        """
+        Snapshot of the UTC day that just ended: the beat job runs right after
+        midnight, so the totals are that day's closing values and the flows
+        cover the whole day.
+        """
+        day = datetime.now(timezone.utc).date() - timedelta(days=1)
         existing = db.query(DailySnapshot).filter(
-            DailySnapshot.snapshot_date == today
+            DailySnapshot.snapshot_date == day
         ).first()
         if existing:
-            logger.warning(f"Snapshot already exists for {today}")
+            logger.warning(f"Snapshot already exists for {day}")
             return existing
 
-        total_holders = db.query(TokenHolder).count()
-        active_holders = db.query(TokenHolder).filter(
-            TokenHolder.is_active == True
-        ).count()
-        total_funds = db.query(PersonalFund).count()
-        active_funds = db.query(PersonalFund).filter(
-            PersonalFund.initialized == True
-        ).count()
-        funds_in_retirement = db.query(PersonalFund).filter(
-            PersonalFund.retirement_started == True
-        ).count()
-        
-        active_proposals = db.query(Proposal).filter(
-            Proposal.start_time <= datetime.utcnow(),
-            Proposal.end_time >= datetime.utcnow(),
-            Proposal.executed == False,
-            Proposal.cancelled == False
-        ).count()
-        total_tvl = db.query(func.sum(PersonalFund.total_balance)).scalar() or Decimal(0)
+        totals = self.get_system_totals(db)
         snapshot = DailySnapshot(
-            snapshot_date=today,
-            total_token_holders=total_holders,
-            active_token_holders=active_holders,
-            total_funds=total_funds,
-            active_funds=active_funds,
-            funds_in_retirement=funds_in_retirement,
-            total_deposits_today=Decimal(0), 
-            total_withdrawals_today=Decimal(0),
-            total_fees_today=Decimal(0),
-            total_tvl=total_tvl,
-            active_proposals=active_proposals,
-            votes_cast_today=0
+            snapshot_date=day,
+            total_token_holders=totals["total_holders"],
+            active_token_holders=totals["active_holders"],
+            total_funds=totals["total_funds"],
+            active_funds=totals["active_funds"],
+            funds_in_retirement=totals["funds_in_retirement"],
+            total_tvl=totals["total_tvl"],
+            active_proposals=totals["active_proposals"],
+            **self.get_daily_flows(db, day)
         )
         
         db.add(snapshot)
         db.commit()
         db.refresh(snapshot)
-        logger.info(f"📊 Daily snapshot created for {today}")
+        logger.info(f"📊 Daily snapshot created for {day}")
         return snapshot
     
     def health_check(self, db: Session) -> SystemHealthCheck:
         try:
-            db.execute("SELECT 1")
+            totals = self.get_system_totals(db)
+            # Separate scalar subqueries: the pending count uses the partial
+            # pending index and the max the block_number key, not a full scan.
+            events = db.execute(select(
+                select(func.count()).select_from(BlockchainEvent).where(
+                    BlockchainEvent.processed == False,
+                    BlockchainEvent.confirmed == True,
+                    BlockchainEvent.dead_lettered == False
+                ).scalar_subquery().label("pending"),
+                select(func.max(BlockchainEvent.block_number)).scalar_subquery().label("last_block"),
+            )).one()
             db_healthy = True
-        except:
+        except SQLAlchemyError as e:
+            db.rollback()
+            logger.error(f"Health check query failed: {e}")
+            totals = {"active_funds": 0, "total_tvl": Decimal(0)}
+            events = None
             db_healthy = False
-        last_event = db.query(BlockchainEvent).order_by(
-            desc(BlockchainEvent.block_number)
-        ).first()
-        unprocessed = db.query(BlockchainEvent).filter(
-            BlockchainEvent.processed == False
-        ).count()
-        active_funds = db.query(PersonalFund).filter(
-            PersonalFund.initialized == True
-        ).count()
-        total_tvl = db.query(func.sum(PersonalFund.total_balance)).scalar() or Decimal(0)
+
+        pending = events.pending if events else 0
         return SystemHealthCheck(
             database_healthy=db_healthy,
-            blockchain_synced=unprocessed < 100,
-            last_block_processed=last_event.block_number if last_event else 0,
-            pending_events=unprocessed,
-            active_funds=active_funds,
-            total_tvl=total_tvl,
+            blockchain_synced=db_healthy and pending < 100,
+            last_block_processed=(events.last_block or 0) if events else 0,
+            pending_events=pending,
+            active_funds=totals["active_funds"],
+            total_tvl=totals["total_tvl"],
             timestamp=datetime.utcnow()
         )
     
     def get_system_metrics(self, db: Session) -> Dict[str, Any]:
+        funds = counter_service.read(db, "funds")
+        tokens = counter_service.read(db, "tokens")
+        governance = counter_service.read(db, "governance")
         return {
             "funds": {
-                "total": db.query(PersonalFund).count(),
-                "active": db.query(PersonalFund).filter(PersonalFund.initialized == True).count(),
-                "in_retirement": db.query(PersonalFund).filter(PersonalFund.retirement_started == True).count()
+                "total": int(funds.get("total", 0)),
+                "active": int(funds.get("active", 0)),
+                "in_retirement": int(funds.get("in_retirement", 0))
             },
             "tokens": {
-                "total_holders": db.query(TokenHolder).count(),
-                "active_holders": db.query(TokenHolder).filter(TokenHolder.is_active == True).count()
+                "total_holders": int(tokens.get("holders", 0)),
+                "active_holders": int(tokens.get("active_holders", 0))
             },
             "governance": {
-                "total_proposals": db.query(Proposal).count(),
-                "active_proposals": db.query(Proposal).filter(
-                    Proposal.executed == False,
-                    Proposal.cancelled == False
-                ).count(),
-                "total_votes": db.query(Vote).count()
+                "total_proposals": int(governance.get("proposals", 0)),
+                "active_proposals": int(governance.get("open_proposals", 0)),
+                "total_votes": int(governance.get("votes", 0))
             }
         }
     
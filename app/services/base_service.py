@@ -1,6 +1,9 @@
+from sqlalchemy import select, func
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import TypeVar, Generic, Type, Optional, List, Dict, Any
 from app.db.base_class import Base
+from app.core.pagination import Page, clamp_limit, seek, build_page, paginate
 import logging
 
 logger = logging.getLogger(__name__)
@@ -14,19 +17,39 @@ class BaseService(Generic[ModelType]):
     def get(self, db: Session, id: int) -> Optional[ModelType]:
         return db.query(self.model).filter(self.model.id == id).first()
     
+    def _keyset(self, sort_column: Any = None) -> List[Any]:
+        """(sort_column, id) of the sort column's model; id alone by default."""
+        if sort_column is None:
+            return [self.model.id]
+        id_column = sort_column.class_.id
+        return [sort_column] if sort_column is id_column else [sort_column, id_column]
+    
+    def paginate(
+        self,
+        query,
+        cursor: Optional[str] = None,
+        limit: Optional[int] = None,
+        sort_column: Any = None,
+        descending: bool = True
+    ) -> Page:
+        return paginate(query, self._keyset(sort_column), cursor, limit, descending)
+    
     def get_multi(
         self,
         db: Session,
-        skip: int = 0,
-        limit: int = 100,
-        filters: Dict[str, Any] = None
-    ) -> List[ModelType]:
+        cursor: Optional[str] = None,
+        limit: Optional[int] = None,
+        filters: Dict[str, Any] = None,
+        sort_key: Optional[str] = None,
+        descending: bool = True
+    ) -> Page:
         query = db.query(self.model)
         if filters:
             for key, value in filters.items():
                 if hasattr(self.model, key):
                     query = query.filter(getattr(self.model, key) == value)
-        return query.offset(skip).limit(limit).all()
+        sort_column = getattr(self.model, sort_key) if sort_key else None
+        return self.paginate(query, cursor, limit, sort_column, descending)
     
     def create(self, db: Session, obj_in: Dict[str, Any]) -> ModelType:
         db_obj = self.model(**obj_in)
@@ -65,3 +88,66 @@ class BaseService(Generic[ModelType]):
                 if hasattr(self.model, key):
                     query = query.filter(getattr(self.model, key) == value)
         return query.count()
+    
+    def _apply_filters(self, stmt, filters: Optional[Dict[str, Any]]):
+        if filters:
+            for key, value in filters.items():
+                if hasattr(self.model, key):
+                    stmt = stmt.where(getattr(self.model, key) == value)
+        return stmt
+    
+    async def get_async(self, db: AsyncSession, id: int) -> Optional[ModelType]:
+        return await db.get(self.model, id)
+    
+    async def get_multi_async(
+        self,
+        db: AsyncSession,
+        cursor: Optional[str] = None,
+        limit: Optional[int] = None,
+        filters: Dict[str, Any] = None,
+        sort_key: Optional[str] = None,
+        descending: bool = True
+    ) -> Page:
+        columns = self._keyset(getattr(self.model, sort_key) if sort_key else None)
+        limit = clamp_limit(limit)
+        condition, order = seek(columns, cursor, descending)
+        stmt = self._apply_filters(select(self.model), filters)
+        if condition is not None:
+            stmt = stmt.where(condition)
+        result = await db.execute(stmt.order_by(*order).limit(limit + 1))
+        return build_page(list(result.scalars().all()), columns, limit)
+    
+    async def create_async(self, db: AsyncSession, obj_in: Dict[str, Any]) -> ModelType:
+        db_obj = self.model(**obj_in)
+        db.add(db_obj)
+        await db.commit()
+        await db.refresh(db_obj)
+        return db_obj
+    
+    async def update_async(
+        self,
+        db: AsyncSession,
+        db_obj: ModelType,
+        obj_in: Dict[str, Any]
+    ) -> ModelType:
+        for field, value in obj_in.items():
+            if hasattr(db_obj, field):
+                setattr(db_obj, field, value)
+        
+        db.add(db_obj)
+        await db.commit()
+        await db.refresh(db_obj)
+        return db_obj
+    
+    async def delete_async(self, db: AsyncSession, id: int) -> bool:
+        obj = await db.get(self.model, id)
+        if obj:
+            await db.delete(obj)
+            await db.commit()
+            return True
+        return False
+    
+    async def count_async(self, db: AsyncSession, filters: Dict[str, Any] = None) -> int:
+        stmt = self._apply_filters(select(func.count()).select_from(self.model), filters)
+        result = await db.execute(stmt)
+        return result.scalar_one()
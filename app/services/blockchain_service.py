@@ -1,19 +1,53 @@
 from sqlalchemy.orm import Session
-from sqlalchemy import desc
-from datetime import datetime
-from typing import List, Optional, Dict, Any
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import desc, func, case, tuple_, or_, select, text
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.exc import SQLAlchemyError
+from datetime import datetime, timedelta, timezone
+from typing import List, Optional, Dict, Any, Set, Tuple
 import logging
+import re
 
-from app.models.blockchain import BlockchainEvent
+from app.models.blockchain import (
+    BlockchainEvent,
+    BlockchainEventKey,
+    BackfillShard,
+    BlockchainSyncState,
+    BlockchainBlockHash,
+    BlockchainDeadLetter
+)
+from app.models.personal_fund import PersonalFund
 from app.schemas.blockchain import BlockchainEventCreate
 from app.services.base_service import BaseService
+from app.core.pagination import Page
 
 logger = logging.getLogger(__name__)
 
+ARCHIVE_SCHEMA = "blockchain_archive"
+_PARTITION_BOUND = re.compile(r"FROM \('?(\d+)'?\) TO \('?(\d+)'?\)")
+
+class ReorgConflictError(Exception):
+    """A reorg orphaned events that were already projected into domain tables."""
+
+    def __init__(self, fork_block: int, processed: int):
+        super().__init__(
+            f"Reorg at block {fork_block + 1} orphaned {processed} processed events"
+        )
+        self.fork_block = fork_block
+        self.processed = processed
+
+class ArchivedRangeError(Exception):
+    """Events below the oldest attached partition belong to an archived range."""
+
 class BlockchainService(BaseService[BlockchainEvent]):
     def __init__(self):
         super().__init__(BlockchainEvent)
     
+    async def get_async(self, db: AsyncSession, id: int) -> Optional[BlockchainEvent]:
+        # The primary key is (id, block_number) on the partitioned table.
+        result = await db.execute(select(BlockchainEvent).where(BlockchainEvent.id == id))
+        return result.scalars().first()
+    
     def record_event(self, db: Session, event: BlockchainEventCreate) -> BlockchainEvent:
         existing = db.query(BlockchainEvent).filter(
             BlockchainEvent.transaction_hash == event.transaction_hash,
@@ -33,21 +67,173 @@ class BlockchainService(BaseService[BlockchainEvent]):
             log_index=event.log_index
         )
         
+        db.add(BlockchainEventKey(
+            transaction_hash=event.transaction_hash,
+            log_index=event.log_index,
+            block_number=event.block_number
+        ))
         db.add(blockchain_event)
         db.commit()
         db.refresh(blockchain_event)
         logger.info(f"📝 Event recorded: {event.event_type} at block {event.block_number}")
         return blockchain_event
     
+    def record_events_bulk(
+        self,
+        db: Session,
+        events: List[BlockchainEventCreate],
+        chunk_size: int = 500,
+        commit: bool = True,
+        confirmed: bool = True
+    ) -> Dict[str, Any]:
+        """
+        Insert a batch of events with one multi-row INSERT per chunk.
+
+        Duplicates (same transaction_hash + log_index, at any block) are
+        skipped by claiming their blockchain_event_keys row first, instead of a
+        SELECT per event; uq_tx_log alone is per block. A confirmed batch
+        first replaces any unconfirmed (streamed) copy of its logs, whatever
+        block the copy was seen at. Commits once, unless the caller owns the
+        transaction (commit=False).
+        """
+        by_contract: Dict[str, int] = {}
+        for start in range(0, len(events), chunk_size):
+            chunk = events[start:start + chunk_size]
+            if confirmed:
+                self._delete_events(
+                    db,
+                    BlockchainEvent.confirmed == False,
+                    tuple_(BlockchainEvent.transaction_hash, BlockchainEvent.log_index).in_(
+                        [(event.transaction_hash, event.log_index) for event in chunk]
+                    )
+                )
+            new_keys = self._claim_keys(db, chunk)
+            rows = []
+            for event in chunk:
+                key = (event.transaction_hash, event.log_index)
+                if key in new_keys:
+                    # Once per key, even if the chunk repeats a log.
+                    new_keys.discard(key)
+                    rows.append({**event.model_dump(), "processed": False, "confirmed": confirmed})
+            if not rows:
+                continue
+            stmt = (
+                pg_insert(BlockchainEvent)
+                .values(rows)
+                .on_conflict_do_nothing(constraint="uq_tx_log")
+                .returning(BlockchainEvent.contract_address)
+            )
+            for (address,) in db.execute(stmt).fetchall():
+                by_contract[address] = by_contract.get(address, 0) + 1
+        if commit:
+            db.commit()
+        
+        inserted = sum(by_contract.values())
+        skipped = len(events) - inserted
+        logger.info(f"📝 Bulk recorded {inserted} events ({skipped} duplicates skipped)")
+        return {"inserted": inserted, "skipped": skipped, "by_contract": by_contract}
+    
+    def _claim_keys(self, db: Session, events: List[Any]) -> Set[Tuple[str, int]]:
+        """Insert the events' dedup keys (no commit); returns the keys that were new."""
+        claimed = db.execute(
+            pg_insert(BlockchainEventKey)
+            .values([
+                {
+                    "transaction_hash": event.transaction_hash,
+                    "log_index": event.log_index,
+                    "block_number": event.block_number,
+                }
+                for event in events
+            ])
+            .on_conflict_do_nothing()
+            .returning(BlockchainEventKey.transaction_hash, BlockchainEventKey.log_index)
+        ).fetchall()
+        return {(tx_hash, log_index) for tx_hash, log_index in claimed}
+    
+    def _delete_events(self, db: Session, *criteria: Any) -> List[Any]:
+        """Delete events and release their dedup keys (no commit); returns the deleted rows."""
+        deleted = db.execute(
+            BlockchainEvent.__table__.delete()
+            .where(*criteria)
+            .returning(
+                BlockchainEvent.transaction_hash,
+                BlockchainEvent.log_index,
+                BlockchainEvent.contract_address
+            )
+        ).fetchall()
+        keys = [(row.transaction_hash, row.log_index) for row in deleted]
+        for start in range(0, len(keys), 1000):
+            db.query(BlockchainEventKey).filter(
+                tuple_(BlockchainEventKey.transaction_hash, BlockchainEventKey.log_index).in_(
+                    keys[start:start + 1000]
+                )
+            ).delete(synchronize_session=False)
+        return deleted
+    
+    def advance_sync_state(
+        self,
+        db: Session,
+        contract_addresses: List[str],
+        block_number: int,
+        block_hash: Optional[str] = None,
+        inserted_by_contract: Optional[Dict[str, int]] = None
+    ) -> None:
+        """
+        Move the per-contract cursor to block_number without committing, so
+        it lands in the same transaction as the events of that window.
+        Cursors never move backwards here.
+        """
+        if not contract_addresses:
+            return
+        inserted_by_contract = inserted_by_contract or {}
+        rows = [
+            {
+                "contract_address": address,
+                "last_block": block_number,
+                "last_block_hash": block_hash,
+                "events_ingested": inserted_by_contract.get(address, 0),
+            }
+            for address in contract_addresses
+        ]
+        stmt = pg_insert(BlockchainSyncState).values(rows)
+        newer = stmt.excluded.last_block >= BlockchainSyncState.last_block
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[BlockchainSyncState.contract_address],
+            set_={
+                "last_block": func.greatest(BlockchainSyncState.last_block, stmt.excluded.last_block),
+                "last_block_hash": case(
+                    (newer, stmt.excluded.last_block_hash),
+                    else_=BlockchainSyncState.last_block_hash
+                ),
+                "events_ingested": BlockchainSyncState.events_ingested + stmt.excluded.events_ingested,
+                "updated_at": func.now(),
+            }
+        )
+        db.execute(stmt)
+    
+    def get_sync_state(self, db: Session) -> List[BlockchainSyncState]:
+        return db.query(BlockchainSyncState).order_by(BlockchainSyncState.contract_address).all()
+    
+    def get_fund_clone_addresses(self, db: Session) -> List[str]:
+        """
+        Every known personal fund clone: projected funds plus the fund address
+        of every stored FundCreated, which may not be projected yet.
+        """
+        created = select(BlockchainEvent.event_data["fundAddress"].astext).where(
+            BlockchainEvent.event_type == "FundCreated"
+        )
+        projected = select(PersonalFund.fund_address)
+        return [row[0] for row in db.execute(projected.union(created)) if row[0]]
+    
     def get_events(
         self,
         db: Session,
-        skip: int = 0,
-        limit: int = 100,
+        cursor: Optional[str] = None,
+        limit: Optional[int] = None,
         event_type: Optional[str] = None,
         contract_address: Optional[str] = None,
         processed: Optional[bool] = None
-    ) -> List[BlockchainEvent]:
+    ) -> Page:
         query = db.query(BlockchainEvent)
         if event_type:
             query = query.filter(BlockchainEvent.event_type == event_type)
@@ -56,9 +242,7 @@ class BlockchainService(BaseService[BlockchainEvent]):
         if processed is not None:
             query = query.filter(BlockchainEvent.processed == processed)
         
-        return query.order_by(
-            desc(BlockchainEvent.block_number)
-        ).offset(skip).limit(limit).all()
+        return self.paginate(query, cursor, limit, BlockchainEvent.block_number)
     
     def get_event(self, db: Session, event_id: int) -> Optional[BlockchainEvent]:
         return self.get(db, event_id)
@@ -81,30 +265,397 @@ class BlockchainService(BaseService[BlockchainEvent]):
     
     def get_unprocessed(self, db: Session, limit: int = 100) -> List[BlockchainEvent]:
         return db.query(BlockchainEvent).filter(
-            BlockchainEvent.processed == False
+            BlockchainEvent.processed == False,
+            BlockchainEvent.dead_lettered == False
         ).order_by(BlockchainEvent.block_number).limit(limit).all()
     
-    def sync_events(
+    def claim_unprocessed(self, db: Session, limit: int = 100) -> List[BlockchainEvent]:
+        """
+        Lock a batch of unprocessed events for this transaction. Rows already
+        claimed by another worker are skipped, not waited on; the locks are
+        released when the caller commits or rolls back. Events backing off
+        after a failure are left out until their next_attempt_at, and
+        unconfirmed (streamed) events until a confirmed window re-reads them.
+        Dead-lettered tombstones are never claimed.
+        """
+        return db.query(BlockchainEvent).filter(
+            BlockchainEvent.processed == False,
+            BlockchainEvent.confirmed == True,
+            BlockchainEvent.dead_lettered == False,
+            or_(
+                BlockchainEvent.next_attempt_at.is_(None),
+                BlockchainEvent.next_attempt_at <= func.now()
+            )
+        ).order_by(
+            BlockchainEvent.block_number,
+            BlockchainEvent.log_index
+        ).limit(limit).with_for_update(skip_locked=True).all()
+    
+    def mark_processed_bulk(self, db: Session, event_ids: List[int]) -> int:
+        """Flag many events processed with one UPDATE (no commit)."""
+        if not event_ids:
+            return 0
+        return db.query(BlockchainEvent).filter(
+            BlockchainEvent.id.in_(event_ids)
+        ).update(
+            {"processed": True, "processed_at": func.now()},
+            synchronize_session=False
+        )
+    
+    def record_failure(
         self,
         db: Session,
-        from_block: Optional[int] = None,
-        to_block: Optional[int] = None
-    ) -> Dict[str, Any]:
-        logger.info(f"🔄 Syncing events from block {from_block} to {to_block}")
-        return {"success": True, "message": "Sync initiated"}
+        event: BlockchainEvent,
+        error: str,
+        max_attempts: int,
+        base_delay: int,
+        max_delay: int
+    ) -> bool:
+        """
+        Count a failed attempt and schedule the next one with exponential
+        backoff; past max_attempts the event is copied to the dead-letter
+        table and kept as a tombstone, so re-scanning its block does not insert
+        it again. Returns True when dead-lettered. No commit.
+        """
+        event.attempts = (event.attempts or 0) + 1
+        event.last_error = error[:2000]
+        if event.attempts < max_attempts:
+            delay = min(base_delay * 2 ** (event.attempts - 1), max_delay)
+            event.next_attempt_at = datetime.now(timezone.utc) + timedelta(seconds=delay)
+            return False
+
+        db.add(BlockchainDeadLetter(
+            event_id=event.id,
+            event_type=event.event_type,
+            contract_address=event.contract_address,
+            event_data=event.event_data,
+            transaction_hash=event.transaction_hash,
+            block_number=event.block_number,
+            block_timestamp=event.block_timestamp,
+            log_index=event.log_index,
+            attempts=event.attempts,
+            last_error=event.last_error
+        ))
+        event.dead_lettered = True
+        logger.error(f"☠️ Event {event.id} ({event.event_type}) dead-lettered after {event.attempts} attempts")
+        return True
+    
+    def get_dead_letters(
+        self,
+        db: Session,
+        event_type: Optional[str] = None,
+        cursor: Optional[str] = None,
+        limit: Optional[int] = None
+    ) -> Page:
+        query = db.query(BlockchainDeadLetter)
+        if event_type:
+            query = query.filter(BlockchainDeadLetter.event_type == event_type)
+        return self.paginate(query, cursor, limit, BlockchainDeadLetter.block_number, descending=False)
+    
+    def replay_dead_letters(self, db: Session, dead_letter_ids: List[int]) -> int:
+        """
+        Put dead-lettered events back in the processing queue with a fresh
+        attempt counter: their tombstones are revived, and letters whose event
+        row and key are gone are inserted again. Letters whose event is only
+        in an archived partition are kept. Commits once.
+        """
+        letters = db.query(BlockchainDeadLetter).filter(
+            BlockchainDeadLetter.id.in_(dead_letter_ids)
+        ).all()
+        if not letters:
+            return 0
+        revived = {
+            event_id for (event_id,) in db.execute(
+                BlockchainEvent.__table__.update()
+                .where(
+                    tuple_(BlockchainEvent.id, BlockchainEvent.block_number).in_(
+                        [(letter.event_id, letter.block_number) for letter in letters]
+                    ),
+                    BlockchainEvent.dead_lettered == True
+                )
+                .values(dead_lettered=False, attempts=0, next_attempt_at=None, last_error=None)
+                .returning(BlockchainEvent.id)
+            )
+        }
+        missing = [letter for letter in letters if letter.event_id not in revived]
+        new_keys = self._claim_keys(db, missing) if missing else set()
+        missing = [
+            letter for letter in missing
+            if (letter.transaction_hash, letter.log_index) in new_keys
+        ]
+        if missing:
+            db.execute(pg_insert(BlockchainEvent).values([
+                {
+                    "event_type": letter.event_type,
+                    "contract_address": letter.contract_address,
+                    "event_data": letter.event_data,
+                    "transaction_hash": letter.transaction_hash,
+                    "block_number": letter.block_number,
+                    "block_timestamp": letter.block_timestamp,
+                    "log_index": letter.log_index,
+                    "processed": False,
+                    "attempts": 0,
+                }
+                for letter in missing
+            ]).on_conflict_do_nothing(constraint="uq_tx_log"))
+        replayed = revived | {letter.event_id for letter in missing}
+        for letter in letters:
+            if letter.event_id in replayed:
+                db.delete(letter)
+        db.commit()
+        if len(replayed) < len(letters):
+            logger.warning(f"⚠️ {len(letters) - len(replayed)} dead letters refer to archived events, kept")
+        logger.info(f"🔁 Replayed {len(replayed)} dead-lettered events")
+        return len(replayed)
+    
+    def get_backfill_shards(
+        self,
+        db: Session,
+        status: Optional[str] = None,
+        limit: int = 100
+    ) -> List[BackfillShard]:
+        query = db.query(BackfillShard)
+        if status:
+            query = query.filter(BackfillShard.status == status)
+        return query.order_by(BackfillShard.from_block).limit(limit).all()
+    
+    def record_block_hash(
+        self,
+        db: Session,
+        block_number: int,
+        block_hash: str,
+        parent_hash: Optional[str] = None,
+        keep_depth: Optional[int] = None
+    ) -> None:
+        """Add a synced window's last block to the hash chain (no commit)."""
+        stmt = pg_insert(BlockchainBlockHash).values(
+            block_number=block_number,
+            block_hash=block_hash,
+            parent_hash=parent_hash
+        )
+        db.execute(stmt.on_conflict_do_update(
+            index_elements=[BlockchainBlockHash.block_number],
+            set_={"block_hash": stmt.excluded.block_hash, "parent_hash": stmt.excluded.parent_hash}
+        ))
+        if keep_depth:
+            db.query(BlockchainBlockHash).filter(
+                BlockchainBlockHash.block_number < block_number - keep_depth
+            ).delete(synchronize_session=False)
+    
+    def get_block_hashes(self, db: Session, limit: int = 1000) -> List[BlockchainBlockHash]:
+        return db.query(BlockchainBlockHash).order_by(
+            desc(BlockchainBlockHash.block_number)
+        ).limit(limit).all()
+    
+    def rollback_to_block(self, db: Session, fork_block: int, force: bool = False) -> Dict[str, Any]:
+        """
+        Undo everything synced above fork_block: orphaned events, their hash
+        chain entries and the per-contract cursors. Commits once.
+
+        Orphaned events that were already projected into domain tables cannot
+        be undone here, so unless force is set the rollback is refused: only
+        the unprocessed orphans are dropped (so they are never projected), an
+        alert is logged and ReorgConflictError halts sync at the fork until an
+        operator has reconciled the projected rows and forces the rollback.
+        """
+        processed = db.query(func.count(BlockchainEvent.id)).filter(
+            BlockchainEvent.block_number > fork_block,
+            BlockchainEvent.processed == True
+        ).scalar()
+        if processed and not force:
+            dropped = len(self._delete_events(
+                db,
+                BlockchainEvent.block_number > fork_block,
+                BlockchainEvent.processed == False
+            ))
+            self._drop_dead_letters_above(db, fork_block)
+            db.commit()
+            logger.critical(
+                f"🚨 Reorg below block {fork_block + 1} orphaned {processed} events already "
+                f"projected into domain tables; sync halted until they are reconciled "
+                f"({dropped} unprocessed orphans dropped)"
+            )
+            raise ReorgConflictError(fork_block, processed)
+
+        deleted = self._delete_events(db, BlockchainEvent.block_number > fork_block)
+        self._drop_dead_letters_above(db, fork_block)
+        by_contract: Dict[str, int] = {}
+        for row in deleted:
+            by_contract[row.contract_address] = by_contract.get(row.contract_address, 0) + 1
+        
+        db.query(BlockchainBlockHash).filter(
+            BlockchainBlockHash.block_number > fork_block
+        ).delete(synchronize_session=False)
+        fork_hash = db.query(BlockchainBlockHash.block_hash).filter(
+            BlockchainBlockHash.block_number == fork_block
+        ).scalar()
+        for state in db.query(BlockchainSyncState).filter(
+            BlockchainSyncState.last_block > fork_block
+        ).all():
+            state.last_block = fork_block
+            state.last_block_hash = fork_hash
+            state.events_ingested = max(0, state.events_ingested - by_contract.get(state.contract_address, 0))
+        db.commit()
+        
+        if processed:
+            logger.warning(f"⚠️ Forced rollback removed {processed} events that were already processed")
+        logger.warning(f"↩️ Rolled back to block {fork_block}: {len(deleted)} orphaned events removed")
+        return {"fork_block": fork_block, "events_removed": len(deleted), "processed_removed": processed}
+    
+    def _drop_dead_letters_above(self, db: Session, fork_block: int) -> None:
+        # Their tombstones are orphaned too; a replay must not bring them back.
+        db.query(BlockchainDeadLetter).filter(
+            BlockchainDeadLetter.block_number > fork_block
+        ).delete(synchronize_session=False)
+    
+    def purge_unconfirmed(self, db: Session, up_to_block: int) -> int:
+        """
+        Drop unconfirmed events at or below up_to_block (no commit). Confirmed
+        windows up to there were already ingested, and they replace every
+        streamed log they still contain, so anything left was reorged out.
+        """
+        purged = len(self._delete_events(
+            db,
+            BlockchainEvent.confirmed == False,
+            BlockchainEvent.block_number <= up_to_block
+        ))
+        if purged:
+            logger.warning(f"↩️ Purged {purged} streamed events that never confirmed")
+        return purged
+    
+    def delete_events_by_keys(self, db: Session, keys: List[Tuple[str, int]]) -> int:
+        """Delete events by (transaction_hash, log_index). Commits once."""
+        deleted = len(self._delete_events(
+            db,
+            tuple_(BlockchainEvent.transaction_hash, BlockchainEvent.log_index).in_(keys)
+        ))
+        db.commit()
+        if deleted:
+            logger.warning(f"↩️ Removed {deleted} events reported as reorged out")
+        return deleted
+    
+    def get_event_partitions(self, db: Session) -> List[Dict[str, Any]]:
+        """Attached block-range partitions of blockchain_events, oldest first."""
+        rows = db.execute(text("""
+            SELECT c.relname, pg_get_expr(c.relpartbound, c.oid)
+            FROM pg_inherits i
+            JOIN pg_class c ON c.oid = i.inhrelid
+            WHERE i.inhparent = 'blockchain_events'::regclass
+        """)).fetchall()
+        partitions = []
+        for name, bound in rows:
+            match = _PARTITION_BOUND.search(bound or "")
+            if match:
+                partitions.append({
+                    "name": name,
+                    "from_block": int(match.group(1)),
+                    "to_block": int(match.group(2)),
+                })
+        return sorted(partitions, key=lambda p: p["from_block"])
+    
+    def ensure_event_partitions(
+        self,
+        db: Session,
+        up_to_block: int,
+        partition_blocks: int,
+        from_block: Optional[int] = None
+    ) -> int:
+        """
+        Create the missing partitions up to the one holding up_to_block.
+        Ranges below the oldest attached partition are archived and are not
+        recreated: a from_block down there raises ArchivedRangeError, since
+        its events could not be stored. Commits; returns how many partitions
+        were created.
+        """
+        partitions = self.get_event_partitions(db)
+        if partitions and from_block is not None and from_block < partitions[0]["from_block"]:
+            raise ArchivedRangeError(
+                f"Blocks below {partitions[0]['from_block']} are archived; reattach their "
+                f"partitions from {ARCHIVE_SCHEMA} before syncing block {from_block}"
+            )
+        existing = {p["from_block"] for p in partitions}
+        start = partitions[0]["from_block"] if partitions else 0
+        created = 0
+        while start <= up_to_block:
+            if start not in existing:
+                try:
+                    db.execute(text(
+                        f"CREATE TABLE IF NOT EXISTS blockchain_events_p{start} "
+                        f"PARTITION OF blockchain_events "
+                        f"FOR VALUES FROM ({start}) TO ({start + partition_blocks})"
+                    ))
+                    db.commit()
+                    created += 1
+                except SQLAlchemyError as e:
+                    # Another worker created it first.
+                    db.rollback()
+                    logger.debug(f"Partition at block {start} not created: {e}")
+            start += partition_blocks
+        if created:
+            logger.info(f"🧱 Created {created} blockchain_events partitions up to block {start}")
+        return created
+    
+    def archive_event_partitions(
+        self,
+        db: Session,
+        before_block: int,
+        tablespace: Optional[str] = None
+    ) -> List[str]:
+        """
+        Detach partitions that end at or below before_block and move them to
+        the archive schema (and tablespace, if given). Partitions that still
+        hold unprocessed events are kept; dead-lettered tombstones don't count.
+        Commits per partition.
+        """
+        archived = []
+        for partition in self.get_event_partitions(db):
+            if partition["to_block"] > before_block:
+                break
+            name = partition["name"]
+            pending = db.execute(text(
+                f"SELECT 1 FROM {name} WHERE processed = false AND NOT dead_lettered LIMIT 1"
+            )).first()
+            if pending:
+                logger.warning(f"Partition {name} still has unprocessed events, not archiving")
+                break
+            db.execute(text(f"ALTER TABLE blockchain_events DETACH PARTITION {name}"))
+            db.execute(text(f"ALTER TABLE {name} SET SCHEMA {ARCHIVE_SCHEMA}"))
+            if tablespace:
+                db.execute(text(f"ALTER TABLE {ARCHIVE_SCHEMA}.{name} SET TABLESPACE {tablespace}"))
+            db.commit()
+            archived.append(name)
+            logger.info(f"🗄️ Archived {name} (blocks {partition['from_block']}-{partition['to_block'] - 1})")
+        return archived
     
     def get_sync_status(self, db: Session) -> Dict[str, Any]:
-        last_event = db.query(BlockchainEvent).order_by(
-            desc(BlockchainEvent.block_number)
-        ).first()
-        unprocessed = db.query(BlockchainEvent).filter(
-            BlockchainEvent.processed == False
-        ).count()
+        """
+        Resume point from blockchain_sync_state: one row per watched contract,
+        so this is a constant-size lookup. The slowest contract wins, since the
+        listener scans every contract in the same window.
+        """
+        states = self.get_sync_state(db)
+        if not states:
+            return {
+                "last_synced_block": 0,
+                "last_synced_at": None,
+                "contracts": []
+            }
         
+        slowest = min(states, key=lambda s: s.last_block)
+        updated = [s.updated_at for s in states if s.updated_at]
         return {
-            "last_synced_block": last_event.block_number if last_event else 0,
-            "last_synced_at": last_event.created_at if last_event else None,
-            "unprocessed_events": unprocessed
+            "last_synced_block": slowest.last_block,
+            "last_synced_hash": slowest.last_block_hash,
+            "last_synced_at": max(updated) if updated else None,
+            "contracts": [
+                {
+                    "contract_address": s.contract_address,
+                    "last_block": s.last_block,
+                    "last_block_hash": s.last_block_hash,
+                    "events_ingested": s.events_ingested,
+                }
+                for s in states
+            ]
         }
 
 blockchain_service = BlockchainService()
\ No newline at end of file
@@ -1,16 +1,22 @@
 from sqlalchemy.orm import Session
 from sqlalchemy import desc
 from datetime import datetime, timedelta
-from typing import List, Optional
+from typing import Dict, List, Optional
 import logging
 
 from app.models.contact import Contact
 from app.schemas.contact import ContactCreate
 from app.services.base_service import BaseService
+from app.services.counter_service import counter_service
+from app.core.pagination import Page
 
 logger = logging.getLogger(__name__)
 
 
+def _contact_counters(contact: Contact) -> Dict[str, int]:
+    return {"total": 1, "unread": int(not contact.is_read)}
+
+
 class ContactService(BaseService[Contact]):
     def __init__(self):
         super().__init__(Contact)
@@ -26,6 +32,8 @@ class ContactService(BaseService[Contact]):
 
         contact = Contact(**contact_data)
         db.add(contact)
+        db.flush()
+        counter_service.add(db, "contacts", _contact_counters(contact))
         db.commit()
         db.refresh(contact)
 
@@ -46,14 +54,14 @@ class ContactService(BaseService[Contact]):
     def get_all(
         self,
         db: Session,
-        skip: int = 0,
-        limit: int = 100,
+        cursor: Optional[str] = None,
+        limit: Optional[int] = None,
         unread_only: bool = False
-    ) -> List[Contact]:
+    ) -> Page:
         query = db.query(Contact)
         if unread_only:
             query = query.filter(Contact.is_read.is_(False))
-        return query.order_by(desc(Contact.timestamp)).offset(skip).limit(limit).all()
+        return self.paginate(query, cursor, limit, Contact.timestamp)
 
     def get_by_id(self, db: Session, contact_id: int) -> Optional[Contact]:
         return db.query(Contact).filter(Contact.id == contact_id).first()
@@ -69,8 +77,10 @@ class ContactService(BaseService[Contact]):
         if not contact:
             return None
 
+        before = _contact_counters(contact)
         contact.is_read = is_read
         contact.read_at = datetime.utcnow() if is_read else None
+        counter_service.track(db, "contacts", before, _contact_counters(contact))
 
         db.commit()
         db.refresh(contact)
@@ -82,6 +92,7 @@ class ContactService(BaseService[Contact]):
         if not contact:
             return False
 
+        counter_service.subtract(db, "contacts", _contact_counters(contact))
         db.delete(contact)
         db.commit()
         return True
@@ -99,9 +110,13 @@ class ContactService(BaseService[Contact]):
         )
 
     def get_stats(self, db: Session) -> dict:
-        total = db.query(Contact).count()
-        unread = self.get_unread_count(db)
-        recent = len(self.get_recent(db, days=7))
+        counters = counter_service.read(db, "contacts")
+        total = int(counters.get("total", 0))
+        unread = int(counters.get("unread", 0))
+        # A sliding window is not a running total: count it over the timestamp index.
+        recent = db.query(Contact).filter(
+            Contact.timestamp >= datetime.utcnow() - timedelta(days=7)
+        ).count()
 
         return {
             "total_messages": total,
@@ -0,0 +1,159 @@
+"""
+Stat counters: running totals in stat_counters, changed by the write paths in
+the same transaction as the rows they count, so stats endpoints read a few
+primary-key rows instead of scanning tables.
+
+Each namespace has a source in counter_sources, the aggregate query that
+computes its true values. The first read of a namespace seeds it from the
+source, in its own session so the caller's transaction is never committed, and
+the reconcile_counters task rewrites counters that drifted (rows written
+outside the services, bulk updates). Writers hold a shared advisory lock on
+the namespace until they commit and reconciliation takes it exclusively, so a
+write is either already in the source's totals or applied after them, even for
+counters that do not exist yet.
+"""
+
+from sqlalchemy.orm import Session
+from sqlalchemy import select, func
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from decimal import Decimal
+from typing import Any, Dict, Iterable, Mapping, Optional
+import logging
+
+from app.models.analytics import StatCounter
+from app.services.base_service import BaseService
+from app.services.counter_sources import COUNTER_SOURCES, CounterSource
+
+logger = logging.getLogger(__name__)
+
+SEEDED = "_seeded"
+
+class CounterService(BaseService[StatCounter]):
+    def __init__(self, sources: Mapping[str, CounterSource]):
+        super().__init__(StatCounter)
+        self._sources = dict(sources)
+
+    def _source(self, namespace: str) -> CounterSource:
+        try:
+            return self._sources[namespace]
+        except KeyError:
+            raise ValueError(f"No counter source registered for namespace '{namespace}'") from None
+
+    def _lock(self, db: Session, namespace: str, shared: bool = False, wait: bool = True) -> bool:
+        """Take the namespace's advisory lock for the rest of the transaction."""
+        if db.get_bind().dialect.name != "postgresql":
+            return True
+        lock = getattr(func, "pg_{}advisory_xact_lock{}".format(
+            "" if wait else "try_", "_shared" if shared else ""
+        ))
+        # pg_advisory_xact_lock returns void; only the try_ variants return False.
+        acquired = db.execute(select(lock(func.hashtext(f"stat_counters:{namespace}")))).scalar()
+        return acquired is not False
+
+    def add(self, db: Session, namespace: str, deltas: Mapping[str, Any]) -> None:
+        """Increment counters inside the caller's transaction (no commit)."""
+        self._source(namespace)
+        rows = [
+            {"namespace": namespace, "name": name, "value": Decimal(delta)}
+            for name, delta in sorted(deltas.items())
+            if delta
+        ]
+        if not rows:
+            return
+        self._lock(db, namespace, shared=True)
+        # Sorted rows lock counters in the same order in every transaction.
+        stmt = pg_insert(StatCounter).values(rows)
+        db.execute(stmt.on_conflict_do_update(
+            index_elements=[StatCounter.namespace, StatCounter.name],
+            set_={
+                "value": StatCounter.value + stmt.excluded.value,
+                "updated_at": func.now(),
+            }
+        ))
+
+    def subtract(self, db: Session, namespace: str, deltas: Mapping[str, Any]) -> None:
+        self.add(db, namespace, {name: -Decimal(delta) for name, delta in deltas.items()})
+
+    def track(
+        self,
+        db: Session,
+        namespace: str,
+        before: Mapping[str, Any],
+        after: Mapping[str, Any]
+    ) -> None:
+        """Apply the change of one row's contribution (before/after an update)."""
+        self.add(db, namespace, {
+            name: Decimal(after.get(name) or 0) - Decimal(before.get(name) or 0)
+            for name in set(before) | set(after)
+        })
+
+    def read(self, db: Session, namespace: str) -> Dict[str, Decimal]:
+        self._source(namespace)
+        values = self._stored(db, namespace)
+        if SEEDED not in values:
+            with Session(bind=db.get_bind()) as seeding:
+                # Busy namespace (writers or a reconcile in flight): the next read seeds it.
+                if self._lock(seeding, namespace, wait=False):
+                    self._reconcile(seeding, namespace)
+            values = self._stored(db, namespace)
+        values.pop(SEEDED, None)
+        return values
+
+    def _stored(self, db: Session, namespace: str) -> Dict[str, Decimal]:
+        query = select(StatCounter.name, StatCounter.value).where(
+            StatCounter.namespace == namespace
+        ).order_by(StatCounter.name)
+        return {name: value for name, value in db.execute(query).all()}
+
+    def reconcile(
+        self,
+        db: Session,
+        namespaces: Optional[Iterable[str]] = None
+    ) -> Dict[str, Dict[str, Decimal]]:
+        """
+        Rewrite counters from their sources, committing each namespace; returns
+        the drift that was corrected. Runs in a session of its own.
+        """
+        drift = {}
+        for namespace in namespaces or sorted(self._sources):
+            self._lock(db, namespace)
+            corrected = self._reconcile(db, namespace)
+            if corrected:
+                drift[namespace] = corrected
+        return drift
+
+    def _reconcile(self, db: Session, namespace: str) -> Dict[str, Decimal]:
+        stored = self._stored(db, namespace)
+        actual = {
+            name: Decimal(value or 0)
+            for name, value in self._source(namespace)(db).items()
+        }
+        # Names the source no longer yields (an emptied bucket) go to zero.
+        for name in stored.keys() - actual.keys() - {SEEDED}:
+            actual[name] = Decimal(0)
+        actual[SEEDED] = Decimal(1)
+
+        changed = {name: value for name, value in actual.items() if stored.get(name) != value}
+        if changed:
+            stmt = pg_insert(StatCounter).values([
+                {"namespace": namespace, "name": name, "value": value}
+                for name, value in sorted(changed.items())
+            ])
+            db.execute(stmt.on_conflict_do_update(
+                index_elements=[StatCounter.namespace, StatCounter.name],
+                set_={"value": stmt.excluded.value, "updated_at": func.now()}
+            ))
+        db.commit()
+
+        if SEEDED not in stored:
+            logger.info(f"🔢 Counters seeded for {namespace}")
+            return {}
+        drift = {
+            name: value - stored.get(name, Decimal(0))
+            for name, value in changed.items()
+        }
+        if drift:
+            logger.warning(f"⚠️ Counter drift corrected in {namespace}: {drift}")
+        return drift
+
+counter_service = CounterService(COUNTER_SOURCES)
@@ -0,0 +1,112 @@
+"""
+Counter sources: for each stat_counters namespace, the aggregate query that
+computes its true values. CounterService seeds and reconciles from these, so
+every namespace is registered here, in one place, without importing the
+services that write the counters.
+"""
+
+from sqlalchemy.orm import Session
+from sqlalchemy import select, func
+from typing import Any, Callable, Dict, Mapping
+
+from app.models.user import User
+from app.models.personal_fund import PersonalFund
+from app.models.token import TokenHolder
+from app.models.governance import Proposal, Vote
+from app.models.protocol import DeFiProtocol
+from app.models.contact import Contact
+from app.models.survey import Survey
+
+CounterSource = Callable[[Session], Mapping[str, Any]]
+
+AVERAGED_FIELDS = (
+    "trust_traditional",
+    "blockchain_familiarity",
+    "retirement_concern",
+    "has_retirement_plan",
+    "values_in_retirement",
+    "interested_in_blockchain",
+)
+
+
+def _count_users(db: Session) -> Dict[str, Any]:
+    return db.execute(select(
+        func.count().label("total"),
+        func.count().filter(User.email.isnot(None)).label("with_email"),
+        func.count().filter(User.is_active == True).label("active"),
+        func.count().filter(User.accepts_marketing == True).label("marketing"),
+    ).select_from(User)).one()._asdict()
+
+
+def _count_funds(db: Session) -> Dict[str, Any]:
+    return db.execute(select(
+        func.count().label("total"),
+        func.count().filter(PersonalFund.is_active == True).label("active"),
+        func.count().filter(PersonalFund.retirement_started == True).label("in_retirement"),
+    ).select_from(PersonalFund)).one()._asdict()
+
+
+def _count_holders(db: Session) -> Dict[str, Any]:
+    return db.execute(select(
+        func.count().label("holders"),
+        func.count().filter(TokenHolder.is_active == True).label("active_holders"),
+    ).select_from(TokenHolder)).one()._asdict()
+
+
+def _count_governance(db: Session) -> Dict[str, Any]:
+    counters = db.execute(select(
+        func.count().label("proposals"),
+        func.count().filter(
+            Proposal.executed == False,
+            Proposal.cancelled == False
+        ).label("open_proposals"),
+        func.count().filter(Proposal.executed == True).label("executed_proposals"),
+    ).select_from(Proposal)).one()._asdict()
+    counters["votes"] = db.query(func.count(Vote.id)).scalar()
+    return counters
+
+
+def _count_protocols(db: Session) -> Dict[str, Any]:
+    return db.execute(select(
+        func.count().label("total"),
+        func.count().filter(DeFiProtocol.is_active == True).label("active"),
+        func.count().filter(DeFiProtocol.verified == True).label("verified"),
+        func.coalesce(
+            func.sum(DeFiProtocol.apy).filter(DeFiProtocol.is_active == True), 0
+        ).label("active_apy_sum"),
+        func.coalesce(func.sum(DeFiProtocol.total_deposited), 0).label("tvl"),
+    ).select_from(DeFiProtocol)).one()._asdict()
+
+
+def _count_contacts(db: Session) -> Dict[str, Any]:
+    return db.execute(select(
+        func.count().label("total"),
+        func.count().filter(Contact.is_read.is_(False)).label("unread"),
+    ).select_from(Contact)).one()._asdict()
+
+
+def _count_surveys(db: Session) -> Dict[str, Any]:
+    counters = db.execute(select(
+        func.count().label("total"),
+        func.count().filter(Survey.interested_in_blockchain >= 1).label("interest.high"),
+        func.count().filter(Survey.interested_in_blockchain == 0).label("interest.moderate"),
+        func.count().filter(Survey.interested_in_blockchain < 0).label("interest.low"),
+        *[
+            func.coalesce(func.sum(getattr(Survey, field)), 0).label(f"sum.{field}")
+            for field in AVERAGED_FIELDS
+        ],
+    ).select_from(Survey)).one()._asdict()
+    for age, count in db.query(Survey.age, func.count(Survey.id)).group_by(Survey.age):
+        counters[f"age.{age}"] = count
+    return counters
+
+
+COUNTER_SOURCES: Dict[str, CounterSource] = {
+    "users": _count_users,
+    "funds": _count_funds,
+    "tokens": _count_holders,
+    "governance": _count_governance,
+    "protocols": _count_protocols,
+    "contacts": _count_contacts,
+    "surveys": _count_surveys,
+}
@@ -1,5 +1,5 @@
 from sqlalchemy.orm import Session
-from sqlalchemy import desc, and_
+from sqlalchemy import and_
 from datetime import datetime
 from typing import List, Optional, Dict, Any
 from decimal import Decimal
@@ -12,11 +12,22 @@ from app.schemas.fund import (
     AutoWithdrawalConfig, AutoWithdrawalInfo
 )
 from app.services.base_service import BaseService
+from app.services.counter_service import counter_service
+from app.core.cache import response_cache
+from app.core.pagination import Page
 from app.core.enums import FundStatus, FundTransactionType
 from app.core.helpers import get_fund_status
 
 logger = logging.getLogger(__name__)
 
+def _fund_counters(fund: PersonalFund) -> Dict[str, int]:
+    return {
+        "total": 1,
+        "active": int(bool(fund.is_active)),
+        "in_retirement": int(bool(fund.retirement_started)),
+    }
+
+
 class FundService(BaseService[PersonalFund]):
     def __init__(self):
         super().__init__(PersonalFund)
@@ -63,7 +74,10 @@ class FundService(BaseService[PersonalFund]):
         )
         
         db.add(fund)
+        db.flush()
+        counter_service.add(db, "funds", _fund_counters(fund))
         db.commit()
+        response_cache.invalidate("analytics")
         db.refresh(fund)
         logger.info(f"✅ Fund created for {wallet_address} - ID: {fund.id}")
         return fund
@@ -103,6 +117,7 @@ class FundService(BaseService[PersonalFund]):
         fund.monthly_deposit_count = 1
         db.add(transaction)
         db.commit()
+        response_cache.invalidate("analytics")
         db.refresh(fund)
         logger.info(f"✅ Fund deployment completed - Address: {fund_address}")
         return fund
@@ -186,11 +201,14 @@ class FundService(BaseService[PersonalFund]):
             raise ValueError("Retirement already started")
         
         if not fund.early_retirement_approved:
-            if datetime.utcnow() < fund.timelock_end:
+            if not fund.is_ready_for_retirement:
                 raise ValueError("Timelock period not finished")
+        before = _fund_counters(fund)
         fund.retirement_started = True
         fund.retirement_start_time = datetime.utcnow()
+        counter_service.track(db, "funds", before, _fund_counters(fund))
         db.commit()
+        response_cache.invalidate("analytics")
         db.refresh(fund)
         logger.info(f"🎉 Retirement started for fund {fund_id}")
         return {"success": True, "fund_id": fund_id, "started_at": fund.retirement_start_time}
@@ -203,9 +221,9 @@ class FundService(BaseService[PersonalFund]):
             return {"can_retire": False, "reason": "Already retired"}
         if fund.early_retirement_approved:
             return {"can_retire": True, "reason": "Early retirement approved"}
-        if datetime.utcnow() >= fund.timelock_end:
+        if fund.is_ready_for_retirement:
             return {"can_retire": True, "reason": "Timelock period completed"}
-        days_remaining = (fund.timelock_end - datetime.utcnow()).days
+        days_remaining = fund.days_until_retirement
         return {
             "can_retire": False,
             "reason": f"Timelock period not finished",
@@ -254,10 +272,10 @@ class FundService(BaseService[PersonalFund]):
     def get_all_funds(
         self,
         db: Session,
-        skip: int = 0,
-        limit: int = 100,
+        cursor: Optional[str] = None,
+        limit: Optional[int] = None,
         retirement_status: Optional[str] = None
-    ) -> List[PersonalFund]:
+    ) -> Page:
         query = db.query(PersonalFund)
         
         if retirement_status:
@@ -273,7 +291,7 @@ class FundService(BaseService[PersonalFund]):
                     PersonalFund.retirement_started == False,
                     PersonalFund.timelock_end > datetime.utcnow()
                 )
-        return query.order_by(desc(PersonalFund.created_at)).offset(skip).limit(limit).all()
+        return self.paginate(query, cursor, limit, PersonalFund.created_at)
     
     def get_funds_ready_for_retirement(self, db: Session) -> List[PersonalFund]:
         return db.query(PersonalFund).filter(
@@ -10,11 +10,22 @@ from app.models.token import TokenHolder
 from app.models.user import User
 from app.schemas.governance import ProposalCreate, ProposalStats, VoterStatsResponse
 from app.services.base_service import BaseService
+from app.services.counter_service import counter_service
+from app.core.cache import response_cache
+from app.core.pagination import Page
 from app.core.enums import ProposalType, ProposalStatus
 from app.core.helpers import get_proposal_status
 
 logger = logging.getLogger(__name__)
 
+def _proposal_counters(proposal: Proposal) -> Dict[str, int]:
+    return {
+        "proposals": 1,
+        "open_proposals": int(not proposal.executed and not proposal.cancelled),
+        "executed_proposals": int(bool(proposal.executed)),
+    }
+
+
 class GovernanceService(BaseService[Proposal]):
     def __init__(self):
         super().__init__(Proposal)
@@ -59,6 +70,8 @@ class GovernanceService(BaseService[Proposal]):
         )
         
         db.add(proposal)
+        db.flush()
+        counter_service.add(db, "governance", _proposal_counters(proposal))
         stats = db.query(VoterStats).filter(
             VoterStats.user_id == user.id
         ).first() if user else None
@@ -69,6 +82,7 @@ class GovernanceService(BaseService[Proposal]):
             stats = VoterStats(user_id=user.id, proposals_created=1)
             db.add(stats)
         db.commit()
+        response_cache.invalidate("governance", "analytics")
         db.refresh(proposal)
         logger.info(f"📜 Proposal created: #{proposal.proposal_id} by {wallet_address}")
         return proposal
@@ -184,6 +198,7 @@ class GovernanceService(BaseService[Proposal]):
                 proposal.quorum_reached = True
         
         db.add(vote)
+        counter_service.add(db, "governance", {"votes": 1})
         if user:
             stats = db.query(VoterStats).filter(
                 VoterStats.user_id == user.id
@@ -199,6 +214,7 @@ class GovernanceService(BaseService[Proposal]):
                 )
                 db.add(stats)
         db.commit()
+        response_cache.invalidate("governance", "analytics")
         db.refresh(vote)
         logger.info(f"🗳️ Vote cast on proposal #{proposal_id}: {'FOR' if support else 'AGAINST'}")
         return vote
@@ -242,12 +258,11 @@ class GovernanceService(BaseService[Proposal]):
         self,
         db: Session,
         proposal_id: int,
-        skip: int = 0,
-        limit: int = 100
-    ) -> List[Vote]:
-        return db.query(Vote).filter(
-            Vote.proposal_id == proposal_id
-        ).order_by(desc(Vote.created_at)).offset(skip).limit(limit).all()
+        cursor: Optional[str] = None,
+        limit: Optional[int] = None
+    ) -> Page:
+        query = db.query(Vote).filter(Vote.proposal_id == proposal_id)
+        return self.paginate(query, cursor, limit, Vote.created_at)
     
     def execute_proposal(
         self,
@@ -272,9 +287,12 @@ class GovernanceService(BaseService[Proposal]):
         if not proposal.quorum_reached:
             raise ValueError("Quorum not reached")
         
+        before = _proposal_counters(proposal)
         proposal.executed = True
         proposal.executed_at = datetime.utcnow()
+        counter_service.track(db, "governance", before, _proposal_counters(proposal))
         db.commit()
+        response_cache.invalidate("governance", "analytics")
         logger.info(f"✅ Proposal #{proposal_id} executed")
         return {"success": True, "proposal_id": proposal_id}
     
@@ -298,25 +316,32 @@ class GovernanceService(BaseService[Proposal]):
         else:
             pass
         
+        before = _proposal_counters(proposal)
         proposal.cancelled = True
         proposal.cancelled_at = datetime.utcnow()
+        counter_service.track(db, "governance", before, _proposal_counters(proposal))
         db.commit()
+        response_cache.invalidate("governance", "analytics")
         logger.info(f"❌ Proposal #{proposal_id} cancelled: {reason}")
         return {"success": True, "proposal_id": proposal_id}
     
     def get_stats(self, db: Session) -> ProposalStats:
-        total_proposals = db.query(Proposal).count()
-        active_proposals = len(self.get_active_proposals(db))
-        executed_proposals = db.query(Proposal).filter(
-            Proposal.executed == True
+        counters = counter_service.read(db, "governance")
+        # Being inside the voting window depends on the clock, not on writes,
+        # so it stays a query; end_time >= now only reaches unfinished proposals.
+        now = datetime.utcnow()
+        active_proposals = db.query(Proposal).filter(
+            Proposal.end_time >= now,
+            Proposal.start_time <= now,
+            Proposal.executed == False,
+            Proposal.cancelled == False
         ).count()
-        total_votes = db.query(Vote).count()
         
         return ProposalStats(
-            total_proposals=total_proposals,
+            total_proposals=int(counters.get("proposals", 0)),
             active_proposals=active_proposals,
-            executed_proposals=executed_proposals,
-            total_votes=total_votes
+            executed_proposals=int(counters.get("executed_proposals", 0)),
+            total_votes=int(counters.get("votes", 0))
         )
     
     def get_voter_stats(
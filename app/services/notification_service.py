@@ -1,13 +1,13 @@
 from sqlalchemy.orm import Session
-from sqlalchemy import desc
 from datetime import datetime
-from typing import List, Optional, Dict, Any
+from typing import Optional, Dict, Any
 import logging
 
 from app.models.notification import Notification
 from app.models.user import User
 from app.schemas.notification import NotificationCreate
 from app.services.base_service import BaseService
+from app.core.pagination import Page
 
 logger = logging.getLogger(__name__)
 
@@ -31,20 +31,18 @@ class NotificationService(BaseService[Notification]):
         self,
         db: Session,
         wallet_address: str,
-        skip: int = 0,
-        limit: int = 50,
+        cursor: Optional[str] = None,
+        limit: Optional[int] = None,
         unread_only: bool = False
-    ) -> List[Notification]:
+    ) -> Page:
         user = db.query(User).filter(User.wallet_address == wallet_address).first()
         if not user:
-            return []
+            return Page(items=[])
         
         query = db.query(Notification).filter(Notification.user_id == user.id)
         if unread_only:
             query = query.filter(Notification.read == False)
-        return query.order_by(
-            desc(Notification.created_at)
-        ).offset(skip).limit(limit).all()
+        return self.paginate(query, cursor, limit, Notification.created_at)
     
     def get_unread_count(self, db: Session, wallet_address: str) -> int:
         user = db.query(User).filter(User.wallet_address == wallet_address).first()
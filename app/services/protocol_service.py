@@ -11,10 +11,23 @@ from app.schemas.protocol import (
     ProtocolWithAPY, ProtocolStats
 )
 from app.services.base_service import BaseService
+from app.services.counter_service import counter_service
+from app.core.cache import response_cache
 from app.core.helpers import basis_points_to_percentage
 
 logger = logging.getLogger(__name__)
 
+def _protocol_counters(protocol: DeFiProtocol) -> Dict[str, Any]:
+    active = bool(protocol.is_active)
+    return {
+        "total": 1,
+        "active": int(active),
+        "verified": int(bool(protocol.verified)),
+        "active_apy_sum": protocol.apy if active else 0,
+        "tvl": protocol.total_deposited or 0,
+    }
+
+
 class ProtocolService(BaseService[DeFiProtocol]):
     def __init__(self):
         super().__init__(DeFiProtocol)
@@ -44,7 +57,10 @@ class ProtocolService(BaseService[DeFiProtocol]):
         )
         
         db.add(protocol)
+        db.flush()
+        counter_service.add(db, "protocols", _protocol_counters(protocol))
         db.commit()
+        response_cache.invalidate("protocols")
         db.refresh(protocol)
         logger.info(f"➕ Protocol added: {protocol.name}")
         return protocol
@@ -59,12 +75,15 @@ class ProtocolService(BaseService[DeFiProtocol]):
         if not protocol:
             return None
         
+        before = _protocol_counters(protocol)
         update_dict = update_data.model_dump(exclude_unset=True)
         for field, value in update_dict.items():
             setattr(protocol, field, value)
         
         protocol.last_updated = datetime.utcnow()
+        counter_service.track(db, "protocols", before, _protocol_counters(protocol))
         db.commit()
+        response_cache.invalidate("protocols")
         db.refresh(protocol)
         logger.info(f"✏️ Protocol updated: {protocol.name}")
         return protocol
@@ -74,10 +93,13 @@ class ProtocolService(BaseService[DeFiProtocol]):
         if not protocol:
             return None
         
+        before = _protocol_counters(protocol)
         protocol.verified = True
         protocol.verified_at = datetime.utcnow()
         protocol.last_updated = datetime.utcnow()
+        counter_service.track(db, "protocols", before, _protocol_counters(protocol))
         db.commit()
+        response_cache.invalidate("protocols")
         db.refresh(protocol)
         logger.info(f"✅ Protocol verified: {protocol.name}")
         return protocol
@@ -87,9 +109,12 @@ class ProtocolService(BaseService[DeFiProtocol]):
         if not protocol:
             return None
         
+        before = _protocol_counters(protocol)
         protocol.is_active = not protocol.is_active
         protocol.last_updated = datetime.utcnow()
+        counter_service.track(db, "protocols", before, _protocol_counters(protocol))
         db.commit()
+        response_cache.invalidate("protocols")
         db.refresh(protocol)
         logger.info(f"🔄 Protocol {'activated' if protocol.is_active else 'deactivated'}: {protocol.name}")
         return protocol
@@ -152,9 +177,11 @@ class ProtocolService(BaseService[DeFiProtocol]):
         protocol = self.get(db, protocol_id)
         if not protocol:
             raise ValueError("Protocol not found")
+        before = _protocol_counters(protocol)
         old_apy = protocol.apy
         protocol.apy = new_apy
         protocol.last_updated = datetime.utcnow()
+        counter_service.track(db, "protocols", before, _protocol_counters(protocol))
         history = ProtocolAPYHistory(
             protocol_id=protocol_id,
             old_apy=old_apy,
@@ -163,6 +190,7 @@ class ProtocolService(BaseService[DeFiProtocol]):
         
         db.add(history)
         db.commit()
+        response_cache.invalidate("protocols")
         logger.info(f"📈 APY updated for {protocol.name}: {old_apy} -> {new_apy}")
         return {"success": True, "old_apy": old_apy, "new_apy": new_apy}
     
@@ -177,24 +205,16 @@ class ProtocolService(BaseService[DeFiProtocol]):
         ).order_by(desc(ProtocolAPYHistory.created_at)).limit(limit).all()
     
     def get_stats(self, db: Session) -> ProtocolStats:
-        total_protocols = db.query(DeFiProtocol).count()
-        active_protocols = db.query(DeFiProtocol).filter(
-            DeFiProtocol.is_active == True
-        ).count()
-        verified_protocols = db.query(DeFiProtocol).filter(
-            DeFiProtocol.verified == True
-        ).count()
-        avg_apy = db.query(func.avg(DeFiProtocol.apy)).filter(
-            DeFiProtocol.is_active == True
-        ).scalar() or 0
-        total_tvl = db.query(func.sum(DeFiProtocol.total_deposited)).scalar() or Decimal(0)
+        counters = counter_service.read(db, "protocols")
+        active_protocols = int(counters.get("active", 0))
+        avg_apy = counters.get("active_apy_sum", 0) / active_protocols if active_protocols else 0
         
         return ProtocolStats(
-            total_protocols=total_protocols,
+            total_protocols=int(counters.get("total", 0)),
             active_protocols=active_protocols,
-            verified_protocols=verified_protocols,
+            verified_protocols=int(counters.get("verified", 0)),
             average_apy=int(avg_apy),
-            total_tvl=total_tvl
+            total_tvl=counters.get("tvl", Decimal(0))
         )
 
 protocol_service = ProtocolService()
\ No newline at end of file
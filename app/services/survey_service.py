@@ -1,14 +1,28 @@
 from sqlalchemy.orm import Session
-from sqlalchemy import func, desc
-from typing import List, Any, Dict, Optional
+from sqlalchemy import desc
+from typing import List, Dict, Optional
 import logging
 
 from app.models.survey import Survey, SurveyFollowUp
 from app.schemas.survey import SurveyCreate, FollowUpCreate
 from app.services.base_service import BaseService
+from app.services.counter_service import counter_service
+from app.services.counter_sources import AVERAGED_FIELDS
 
 logger = logging.getLogger(__name__)
 
+def _survey_counters(survey: Survey) -> Dict[str, int]:
+    interest = survey.interested_in_blockchain
+    counters = {
+        "total": 1,
+        f"age.{survey.age}": 1,
+        "interest.high": int(interest >= 1),
+        "interest.moderate": int(interest == 0),
+        "interest.low": int(interest < 0),
+    }
+    counters.update({f"sum.{field}": getattr(survey, field) for field in AVERAGED_FIELDS})
+    return counters
+
 
 class SurveyService(BaseService[Survey]):
     def __init__(self):
@@ -24,6 +38,7 @@ class SurveyService(BaseService[Survey]):
 
         survey = Survey(**survey_data)
         db.add(survey)
+        counter_service.add(db, "surveys", _survey_counters(survey))
         db.commit()
         db.refresh(survey)
 
@@ -54,7 +69,8 @@ class SurveyService(BaseService[Survey]):
         )
 
     def get_stats(self, db: Session) -> dict:
-        total = db.query(Survey).count()
+        counters = counter_service.read(db, "surveys")
+        total = int(counters.get("total", 0))
 
         if total == 0:
             return {
@@ -69,36 +85,24 @@ class SurveyService(BaseService[Survey]):
             }
 
         averages = {
-            "trust_traditional": db.query(func.avg(Survey.trust_traditional)).scalar() or 0,
-            "blockchain_familiarity": db.query(func.avg(Survey.blockchain_familiarity)).scalar() or 0,
-            "retirement_concern": db.query(func.avg(Survey.retirement_concern)).scalar() or 0,
-            "has_retirement_plan": db.query(func.avg(Survey.has_retirement_plan)).scalar() or 0,
-            "values_in_retirement": db.query(func.avg(Survey.values_in_retirement)).scalar() or 0,
-            "interested_in_blockchain": db.query(func.avg(Survey.interested_in_blockchain)).scalar() or 0,
+            field: round(float(counters.get(f"sum.{field}", 0)) / total, 2)
+            for field in AVERAGED_FIELDS
         }
 
-        averages = {k: round(float(v), 2) for k, v in averages.items()}
-
-        age_dist = (
-            db.query(Survey.age, func.count(Survey.id))
-            .group_by(Survey.age)
-            .all()
-        )
-
-        age_distribution = {age: count for age, count in age_dist}
-
-        high = db.query(Survey).filter(Survey.interested_in_blockchain >= 1).count()
-        moderate = db.query(Survey).filter(Survey.interested_in_blockchain == 0).count()
-        low = db.query(Survey).filter(Survey.interested_in_blockchain < 0).count()
+        age_distribution = {
+            name[len("age."):]: int(count)
+            for name, count in counters.items()
+            if name.startswith("age.") and count
+        }
 
         return {
             "total_responses": total,
             "averages": averages,
             "age_distribution": age_distribution,
             "interest_level": {
-                "high_interest": high,
-                "moderate_interest": moderate,
-                "low_interest": low
+                "high_interest": int(counters.get("interest.high", 0)),
+                "moderate_interest": int(counters.get("interest.moderate", 0)),
+                "low_interest": int(counters.get("interest.low", 0))
             }
         }
 
@@ -1,5 +1,5 @@
 from sqlalchemy.orm import Session
-from sqlalchemy import desc, and_, or_
+from sqlalchemy import and_, or_
 from datetime import datetime, timedelta
 from typing import List, Optional, Dict, Any
 from decimal import Decimal
@@ -9,11 +9,18 @@ from app.models.token import TokenHolder, TokenActivity, TokenMonthlyStats
 from app.models.user import User
 from app.schemas.token import TokenActivityCreate, TokenStats
 from app.services.base_service import BaseService
+from app.services.counter_service import counter_service
+from app.core.cache import response_cache
+from app.core.pagination import Page
 from app.core.enums import TokenActivityType
 from app.core.helpers import days_until_burn, days_until_renew
 
 logger = logging.getLogger(__name__)
 
+def _holder_counters(holder: TokenHolder) -> Dict[str, int]:
+    return {"holders": 1, "active_holders": int(bool(holder.is_active))}
+
+
 class TokenService(BaseService[TokenHolder]):
     def __init__(self):
         super().__init__(TokenHolder)
@@ -43,7 +50,9 @@ class TokenService(BaseService[TokenHolder]):
         )
         
         db.add(holder)
+        counter_service.add(db, "tokens", _holder_counters(holder))
         db.commit()
+        response_cache.invalidate("tokens", "analytics")
         db.refresh(holder)
         self.record_activity(
             db=db,
@@ -78,6 +87,7 @@ class TokenService(BaseService[TokenHolder]):
         )
         db.add(activity_record)
         db.commit()
+        response_cache.invalidate("tokens", "analytics")
         db.refresh(activity_record)
         logger.info(f"📝 Activity recorded: {activity.activity_type} for {wallet_address}")
         return activity_record
@@ -86,12 +96,13 @@ class TokenService(BaseService[TokenHolder]):
         self,
         db: Session,
         wallet_address: str,
-        skip: int = 0,
-        limit: int = 50
-    ) -> List[TokenActivity]:
-        return db.query(TokenActivity).filter(
+        cursor: Optional[str] = None,
+        limit: Optional[int] = None
+    ) -> Page:
+        query = db.query(TokenActivity).filter(
             TokenActivity.wallet_address == wallet_address
-        ).order_by(desc(TokenActivity.created_at)).offset(skip).limit(limit).all()
+        )
+        return self.paginate(query, cursor, limit, TokenActivity.created_at)
     
     def get_all_holders(
         self,
@@ -112,14 +123,11 @@ class TokenService(BaseService[TokenHolder]):
         ).all()
     
     def get_stats(self, db: Session) -> TokenStats:
-        total_holders = db.query(TokenHolder).count()
-        active_holders = db.query(TokenHolder).filter(
-            TokenHolder.is_active == True
-        ).count()
-        
-        total_supply = db.query(TokenHolder).filter(
-            TokenHolder.is_active == True
-        ).count() 
+        counters = counter_service.read(db, "tokens")
+        total_holders = int(counters.get("holders", 0))
+        active_holders = int(counters.get("active_holders", 0))
+        # One GERAS per active holder.
+        total_supply = active_holders
 
         now = datetime.utcnow()
         current_stats = db.query(TokenMonthlyStats).filter(
@@ -168,6 +176,7 @@ class TokenService(BaseService[TokenHolder]):
             "renewed_this_month": False
         })
         db.commit()
+        response_cache.invalidate("tokens", "analytics")
         logger.info("🔄 Monthly activity flags reset")
     
     def sync_from_blockchain(self, db: Session) -> Dict[str, Any]:
@@ -1,5 +1,5 @@
 from sqlalchemy.orm import Session
-from sqlalchemy import or_, desc
+from sqlalchemy import or_
 from datetime import datetime
 from typing import List, Optional, Dict, Any
 import logging
@@ -7,9 +7,20 @@ import logging
 from app.models.user import User
 from app.schemas.user import UserCreate, UserUpdate
 from app.services.base_service import BaseService
+from app.services.counter_service import counter_service
+from app.core.pagination import Page
 
 logger = logging.getLogger(__name__)
 
+def _user_counters(user: User) -> Dict[str, int]:
+    return {
+        "total": 1,
+        "with_email": int(user.email is not None),
+        "active": int(bool(user.is_active)),
+        "marketing": int(bool(user.accepts_marketing)),
+    }
+
+
 class UserService(BaseService[User]):
     def __init__(self):
         super().__init__(User)
@@ -40,6 +51,8 @@ class UserService(BaseService[User]):
             user_data.update(client_info)
         user = User(**user_data)
         db.add(user)
+        db.flush()
+        counter_service.add(db, "users", _user_counters(user))
         db.commit()
         db.refresh(user)
         
@@ -57,10 +70,12 @@ class UserService(BaseService[User]):
         if not user:
             return None
         
+        before = _user_counters(user)
         update_data = user_update.model_dump(exclude_unset=True)
         for field, value in update_data.items():
             setattr(user, field, value)
         user.updated_at = datetime.utcnow()
+        counter_service.track(db, "users", before, _user_counters(user))
         db.commit()
         db.refresh(user)
         
@@ -88,10 +103,14 @@ class UserService(BaseService[User]):
                 accepts_notifications=accepts_notifications
             )
             db.add(user)
+            db.flush()
+            counter_service.add(db, "users", _user_counters(user))
         else:
+            before = _user_counters(user)
             user.email = email
             user.accepts_marketing = accepts_marketing
             user.accepts_notifications = accepts_notifications
+            counter_service.track(db, "users", before, _user_counters(user))
         
         db.commit()
         db.refresh(user)
@@ -117,14 +136,10 @@ class UserService(BaseService[User]):
     def get_all_users(
         self,
         db: Session,
-        skip: int = 0,
-        limit: int = 100
-    ) -> List[User]:
-        return db.query(User)\
-            .order_by(desc(User.created_at))\
-            .offset(skip)\
-            .limit(limit)\
-            .all()
+        cursor: Optional[str] = None,
+        limit: Optional[int] = None
+    ) -> Page:
+        return self.paginate(db.query(User), cursor, limit, User.created_at)
     
     def get_users_for_mailing(
         self,
@@ -148,31 +163,27 @@ class UserService(BaseService[User]):
         self,
         db: Session,
         query: str,
-        skip: int = 0,
-        limit: int = 50
-    ) -> List[User]:
+        cursor: Optional[str] = None,
+        limit: Optional[int] = None
+    ) -> Page:
         search = f"%{query}%"
         
-        return db.query(User).filter(
+        return self.paginate(db.query(User).filter(
             or_(
                 User.wallet_address.ilike(search),
                 User.email.ilike(search),
                 User.username.ilike(search),
                 User.full_name.ilike(search)
             )
-        ).offset(skip).limit(limit).all()
+        ), cursor, limit)
     
     def get_stats(self, db: Session) -> dict:
-        total = db.query(User).count()
-        with_email = db.query(User).filter(User.email.isnot(None)).count()
-        active = db.query(User).filter(User.is_active == True).count()
-        marketing = db.query(User).filter(User.accepts_marketing == True).count()
-        
+        counters = counter_service.read(db, "users")
         return {
-            "total_users": total,
-            "users_with_email": with_email,
-            "active_users": active,
-            "marketing_subscribers": marketing,
+            "total_users": int(counters.get("total", 0)),
+            "users_with_email": int(counters.get("with_email", 0)),
+            "active_users": int(counters.get("active", 0)),
+            "marketing_subscribers": int(counters.get("marketing", 0)),
         }
 
 user_service = UserService()
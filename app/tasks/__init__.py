@@ -1,9 +1,16 @@
 from .celery_app import celery_app
 from .blockchain_tasks import (
     sync_blockchain_events,
+    backfill_blocks,
     process_pending_events,
+    maintain_event_partitions,
     monitor_fund_creation
 )
+from .analytics_tasks import (
+    create_daily_snapshot,
+    reconcile_counters,
+    refresh_admin_stats
+)
 from .notification_tasks import (
     send_token_burn_warnings,
     send_proposal_notifications,
@@ -13,9 +20,14 @@ from .notification_tasks import (
 __all__ = [
     "celery_app",
     "sync_blockchain_events",
+    "backfill_blocks",
     "process_pending_events",
+    "maintain_event_partitions",
     "monitor_fund_creation",
     "send_token_burn_warnings",
     "send_proposal_notifications",
     "send_retirement_ready_notifications",
+    "create_daily_snapshot",
+    "reconcile_counters",
+    "refresh_admin_stats",
 ]
\ No newline at end of file
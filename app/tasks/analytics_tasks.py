@@ -1,13 +1,15 @@
 import logging
 from .celery_app import celery_app
-from app.db.session import SessionLocal
+from app.db.session import WorkerSessionLocal
 from app.services.analytics_service import analytics_service
+from app.services.counter_service import counter_service
+from app.services.admin_stats_service import admin_stats_service
 
 logger = logging.getLogger(__name__)
 
 @celery_app.task
 def create_daily_snapshot():
-    db = SessionLocal()
+    db = WorkerSessionLocal()
     try:
         snapshot = analytics_service.create_snapshot(db)
         logger.info(f"📊 Daily snapshot created for {snapshot.snapshot_date}")
@@ -18,3 +20,37 @@ def create_daily_snapshot():
         raise
     finally:
         db.close()
+
+@celery_app.task
+def reconcile_counters():
+    db = WorkerSessionLocal()
+    try:
+        drift = counter_service.reconcile(db)
+        return {
+            "status": "success",
+            "drift": {
+                namespace: {name: str(delta) for name, delta in deltas.items()}
+                for namespace, deltas in drift.items()
+            }
+        }
+        
+    except Exception as e:
+        db.rollback()
+        logger.error(f"Error reconciling counters: {e}", exc_info=True)
+        raise
+    finally:
+        db.close()
+
+@celery_app.task
+def refresh_admin_stats():
+    db = WorkerSessionLocal()
+    try:
+        admin_stats_service.refresh(db)
+        return {"status": "success"}
+        
+    except Exception as e:
+        db.rollback()
+        logger.error(f"Error refreshing admin stats: {e}", exc_info=True)
+        raise
+    finally:
+        db.close()
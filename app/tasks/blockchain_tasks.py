@@ -1,22 +1,29 @@
 from celery import Task
 from typing import Optional, Dict, Any
+import asyncio
 import logging
 
 from .celery_app import celery_app
-from app.db.session import SessionLocal
+from app.core.config import settings
+from app.db.session import WorkerSessionLocal
 from app.services.blockchain_service import blockchain_service
 from app.blockchain.web3_client import web3_client
 from app.blockchain.event_listener import event_listener
+from app.blockchain.backfill import backfill_engine
+from app.blockchain.reorg import ReorgDetector
+from app.blockchain.projections import event_processor
 
 logger = logging.getLogger(__name__)
 
+worker_reorg_detector = ReorgDetector(session_factory=WorkerSessionLocal)
+
 class DatabaseTask(Task):
     _db = None
     
     @property
     def db(self):
         if self._db is None:
-            self._db = SessionLocal()
+            self._db = WorkerSessionLocal()
         return self._db
     
     def after_return(self, *args, **kwargs):
@@ -31,16 +38,15 @@ def sync_blockchain_events(self):
             logger.warning("Web3 not connected, skipping sync")
             return {"status": "skipped", "reason": "not_connected"}
         
-        latest_block = web3_client.get_latest_block()
+        worker_reorg_detector.check()
+        latest_block = web3_client.get_latest_block() - settings.BLOCKCHAIN_CONFIRMATIONS
         status = blockchain_service.get_sync_status(self.db)
         last_synced = status.get("last_synced_block", 0)
         if latest_block <= last_synced:
             return {"status": "up_to_date", "block": latest_block}
-        result = blockchain_service.sync_events(
-            db=self.db,
-            from_block=last_synced + 1,
-            to_block=latest_block
-        )
+        result = asyncio.run(backfill_engine.run(last_synced + 1, latest_block))
+        if result["status"] == "completed":
+            backfill_engine.ingestor.ingest([], synced_to=latest_block)
         logger.info(f"📦 Synced blocks {last_synced + 1} to {latest_block}")
         return result
         
@@ -48,37 +54,65 @@ def sync_blockchain_events(self):
         logger.error(f"Error syncing blockchain: {e}", exc_info=True)
         raise
 
-@celery_app.task(base=DatabaseTask, bind=True)
-def process_pending_events(self):
+@celery_app.task
+def backfill_blocks(from_block: int, to_block: int):
     try:
-        unprocessed = blockchain_service.get_unprocessed(self.db, limit=50)
-        if not unprocessed:
-            return {"status": "no_events", "processed": 0}
+        result = asyncio.run(backfill_engine.run(from_block, to_block))
+        logger.info(f"📦 Backfill {from_block}-{to_block}: {result['status']}")
+        return result
         
-        processed_count = 0
-        for event in unprocessed:
-            try:
-                if event.event_type == "FundCreated":
-                    _process_fund_created(self.db, event)
-                elif event.event_type == "Transfer":
-                    _process_token_transfer(self.db, event)
-                elif event.event_type == "ProposalCreated":
-                    _process_proposal_created(self.db, event)
-                elif event.event_type == "VoteCast":
-                    _process_vote_cast(self.db, event)
-                blockchain_service.mark_processed(self.db, event.id)
-                processed_count += 1
-            except Exception as e:
-                logger.error(f"Error processing event {event.id}: {e}")
-                continue
+    except Exception as e:
+        logger.error(f"Error backfilling blocks: {e}", exc_info=True)
+        raise
+
+@celery_app.task(base=DatabaseTask, bind=True)
+def process_pending_events(self, max_batches: int = 20):
+    try:
+        totals = {"claimed": 0, "processed": 0, "failed": 0, "deferred": 0, "dead_lettered": 0}
+        for _ in range(max_batches):
+            result = event_processor.process_batch(
+                self.db, settings.BLOCKCHAIN_PROCESS_BATCH_SIZE
+            )
+            for key in totals:
+                totals[key] += result[key]
+            if result["claimed"] < settings.BLOCKCHAIN_PROCESS_BATCH_SIZE or not result["processed"]:
+                break
         
-        logger.info(f"✅ Processed {processed_count} events")
-        return {"status": "success", "processed": processed_count}
+        if not totals["claimed"]:
+            return {"status": "no_events", "processed": 0}
+        logger.info(
+            f"✅ Processed {totals['processed']} events "
+            f"({totals['failed']} failed, {totals['deferred']} deferred, "
+            f"{totals['dead_lettered']} dead-lettered)"
+        )
+        return {"status": "success", **totals}
         
     except Exception as e:
+        self.db.rollback()
         logger.error(f"Error processing events: {e}", exc_info=True)
         raise
 
+@celery_app.task(base=DatabaseTask, bind=True)
+def maintain_event_partitions(self):
+    try:
+        size = settings.BLOCKCHAIN_EVENTS_PARTITION_BLOCKS
+        head = web3_client.get_latest_block()
+        created = blockchain_service.ensure_event_partitions(self.db, head + size, size)
+
+        archived = []
+        if settings.BLOCKCHAIN_EVENTS_RETENTION_BLOCKS:
+            # Never archive inside the reorg window, whatever the retention.
+            keep = max(settings.BLOCKCHAIN_EVENTS_RETENTION_BLOCKS, settings.BLOCKCHAIN_REORG_MAX_DEPTH)
+            archived = blockchain_service.archive_event_partitions(
+                self.db, head - keep, settings.BLOCKCHAIN_ARCHIVE_TABLESPACE
+            )
+        return {"status": "success", "created": created, "archived": archived}
+        
+    except Exception as e:
+        self.db.rollback()
+        logger.error(f"Error maintaining event partitions: {e}", exc_info=True)
+        raise
+
 @celery_app.task(base=DatabaseTask, bind=True)
 def monitor_fund_creation(self, fund_id: int, wallet_address: str):
     try:
@@ -88,20 +122,3 @@ def monitor_fund_creation(self, fund_id: int, wallet_address: str):
     except Exception as e:
         logger.error(f"Error monitoring fund creation: {e}", exc_info=True)
         raise
-
-def _process_fund_created(db, event):
-    from app.services.fund_service import fund_service
-    data = event.event_data
-    logger.info(f"💼 Fund created: {data.get('fundAddress')}")
-
-def _process_token_transfer(db, event):
-    from app.services.token_service import token_service
-    data = event.event_data
-    if data.get('sender') == '0x0000000000000000000000000000000000000000':
-        logger.info(f"🪙 Token minted to {data.get('receiver')}")
-
-def _process_proposal_created(db, event):
-    logger.info(f"📜 Proposal created: #{event.event_data.get('proposalId')}")
-
-def _process_vote_cast(db, event):
-    logger.info(f"🗳️ Vote cast on proposal #{event.event_data.get('proposalId')}")
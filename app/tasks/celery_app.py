@@ -36,6 +36,11 @@ celery_app.conf.beat_schedule = {
         'schedule': 60.0,
     },
 
+    'maintain-event-partitions': {
+        'task': 'app.tasks.blockchain_tasks.maintain_event_partitions',
+        'schedule': crontab(hour=3, minute=30),  # Daily at 03:30
+    },
+
     'send-burn-warnings': {
         'task': 'app.tasks.notification_tasks.send_token_burn_warnings',
         'schedule': crontab(hour=9, minute=0),  # Daily at 9 AM
@@ -48,7 +53,17 @@ celery_app.conf.beat_schedule = {
 
     'create-daily-snapshot': {
         'task': 'app.tasks.analytics_tasks.create_daily_snapshot',
-        'schedule': crontab(hour=0, minute=5),  # Daily at 00:05
+        'schedule': crontab(hour=0, minute=5),  # Daily at 00:05 UTC, for the day that ended
+    },
+
+    'reconcile-counters': {
+        'task': 'app.tasks.analytics_tasks.reconcile_counters',
+        'schedule': crontab(minute=15),  # Hourly at :15
+    },
+
+    'refresh-admin-stats': {
+        'task': 'app.tasks.analytics_tasks.refresh_admin_stats',
+        'schedule': float(settings.ADMIN_STATS_REFRESH_INTERVAL),
     },
 }
 
@@ -2,7 +2,7 @@ from datetime import datetime, timedelta
 import logging
 
 from .celery_app import celery_app
-from app.db.session import SessionLocal
+from app.db.session import WorkerSessionLocal
 from app.services.token_service import token_service
 from app.services.fund_service import fund_service
 from app.services.notification_service import notification_service
@@ -14,7 +14,7 @@ logger = logging.getLogger(__name__)
 
 @celery_app.task
 def send_token_burn_warnings():
-    db = SessionLocal()
+    db = WorkerSessionLocal()
     try:
         days_left = days_until_burn()
         if days_left != 7:
@@ -46,7 +46,7 @@ def send_token_burn_warnings():
 
 @celery_app.task
 def send_proposal_notifications(proposal_id: int):
-    db = SessionLocal()
+    db = WorkerSessionLocal()
     try:
         holders = token_service.get_all_holders(db, active_only=True)
         for holder in holders:
@@ -70,7 +70,7 @@ def send_proposal_notifications(proposal_id: int):
 
 @celery_app.task
 def send_retirement_ready_notifications():
-    db = SessionLocal()
+    db = WorkerSessionLocal()
     try:
         ready_funds = fund_service.get_funds_ready_for_retirement(db)
         for fund in ready_funds:
@@ -0,0 +1,52 @@
+import json
+
+import pytest
+
+from app.blockchain.abi_store import ABIStore
+
+TRANSFER = {
+    "anonymous": False,
+    "inputs": [
+        {"indexed": True, "name": "from", "type": "address"},
+        {"indexed": True, "name": "to", "type": "address"},
+        {"indexed": False, "name": "value", "type": "uint256"},
+    ],
+    "name": "Transfer",
+    "type": "event",
+}
+BALANCE_OF = {
+    "inputs": [{"name": "account", "type": "address"}],
+    "name": "balanceOf",
+    "outputs": [{"name": "", "type": "uint256"}],
+    "stateMutability": "view",
+    "type": "function",
+}
+
+
+@pytest.fixture
+def store(tmp_path):
+    (tmp_path / "abis" / "common").mkdir(parents=True)
+    (tmp_path / "abis" / "testnet").mkdir()
+    (tmp_path / "abis" / "common" / "token.json").write_text(json.dumps({"abi": [TRANSFER]}))
+    (tmp_path / "abis" / "testnet" / "token.json").write_text(json.dumps([TRANSFER, BALANCE_OF]))
+    (tmp_path / "abis" / "common" / "broken.json").write_text(json.dumps([{"type": "event"}]))
+    return ABIStore("testnet", tmp_path / "abis", tmp_path / "cache")
+
+
+def test_network_artifact_overrides_common_and_invalid_ones_are_skipped(store):
+    abis, digests = store.load()
+    assert set(abis) == {"token"}
+    assert len(abis["token"]) == 2
+    assert set(digests) == {"token"}
+
+
+def test_compiled_structures_come_from_disk_cache(store, monkeypatch):
+    abis, digests = store.load()
+    first = store.compiled(digests, abis)
+    assert first["token"]["functions"] == {"0x70a08231": "balanceOf"}
+    assert first["token"]["events"][0]["topic"] == (
+        "0xddf252ad1be2c89b69c2b068fc378daa952ba7f163c4a11628f55a4df523b3ef"
+    )
+
+    monkeypatch.setattr(ABIStore, "compile", staticmethod(lambda abi: pytest.fail("recompiled")))
+    assert store.compiled(digests, abis) == first
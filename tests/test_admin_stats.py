@@ -0,0 +1,30 @@
+from app.services.admin_stats_service import admin_stats_service
+
+USERS = {"id": 1, "total_users": 10, "users_with_email": 4, "active_users": 9,
+         "marketing_subscribers": 2, "refreshed_at": "2026-10-17T10:05:00+00:00"}
+CONTACTS = {"id": 1, "total_messages": 8, "unread_messages": 2, "messages_last_7_days": 3,
+            "refreshed_at": "2026-10-17T10:05:00+00:00"}
+EMPTY_SURVEYS = {"id": 1, "total_responses": 0, "trust_traditional": None,
+                 "blockchain_familiarity": None, "retirement_concern": None,
+                 "has_retirement_plan": None, "values_in_retirement": None,
+                 "interested_in_blockchain": None, "high_interest": 0, "moderate_interest": 0,
+                 "low_interest": 0, "age_distribution": {},
+                 "refreshed_at": "2026-10-17T10:00:00+00:00"}
+
+
+def test_format_matches_previous_shape():
+    stats = admin_stats_service.format_stats(USERS, CONTACTS, EMPTY_SURVEYS)
+    assert stats["users"]["total_users"] == 10 and "id" not in stats["users"]
+    assert stats["contacts"]["read_percentage"] == 75.0
+    assert stats["surveys"]["averages"] == {}
+    assert stats["refreshed_at"] == "2026-10-17T10:00:00+00:00"
+
+
+def test_format_survey_averages():
+    surveys = dict(EMPTY_SURVEYS, total_responses=2, trust_traditional=1.5,
+                   blockchain_familiarity=0, retirement_concern=-1, has_retirement_plan=0.5,
+                   values_in_retirement=2, interested_in_blockchain=1,
+                   age_distribution={"25-34": 2})
+    stats = admin_stats_service.format_stats(USERS, CONTACTS, surveys)
+    assert stats["surveys"]["averages"]["trust_traditional"] == 1.5
+    assert stats["surveys"]["age_distribution"] == {"25-34": 2}
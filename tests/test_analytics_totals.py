@@ -0,0 +1,124 @@
+from datetime import date, datetime, timedelta, timezone
+from decimal import Decimal
+
+import pytest
+
+from app.models.analytics import DailySnapshot, StatCounter
+from app.models.governance import Proposal, Vote
+from app.models.personal_fund import FundTransaction, PersonalFund
+from app.models.token import TokenHolder
+from app.models.user import User
+from app.services import analytics_service as analytics_module
+from app.services.analytics_service import analytics_service
+
+TABLES = [TokenHolder, PersonalFund, FundTransaction, Proposal, Vote, StatCounter, DailySnapshot]
+DAY = date(2026, 3, 10)
+NOON = datetime(2026, 3, 10, 12)
+
+
+def _proposal(id, start, end, **kwargs):
+    return Proposal(
+        id=id, proposal_id=id, proposer_address="0x1", title="p", description="p",
+        proposal_type=0, start_time=start, end_time=end, execution_time=end,
+        transaction_hash=f"0xp{id}", block_number=id, **kwargs
+    )
+
+
+@pytest.fixture
+def db(make_db):
+    session = make_db(*TABLES)
+    session.add_all([
+        TokenHolder(id=1, user_id=1, wallet_address="0x1", is_active=True, holder_since=NOON),
+        TokenHolder(id=2, user_id=2, wallet_address="0x2", is_active=False, holder_since=NOON),
+        PersonalFund(id=1, user_id=1, fund_address="0xf1", owner_address="0x1", name="a",
+                     total_balance=Decimal("100"), is_active=True, retirement_started=True),
+        PersonalFund(id=2, user_id=2, fund_address="0xf2", owner_address="0x2", name="b",
+                     total_balance=Decimal("50"), is_active=False),
+        _proposal(1, NOON - timedelta(days=1), NOON + timedelta(days=1)),
+        _proposal(2, NOON - timedelta(days=9), NOON - timedelta(days=2), executed=True),
+        Vote(id=1, proposal_id=1, voter_id=1, voter_address="0x1", support=True, voting_power=1,
+             transaction_hash="0xv1", block_number=1, block_timestamp=NOON),
+        Vote(id=2, proposal_id=1, voter_id=2, voter_address="0x2", support=False, voting_power=1,
+             transaction_hash="0xv2", block_number=1, block_timestamp=NOON - timedelta(days=1)),
+    ])
+    for i, (kind, amount, at) in enumerate([
+        ("monthly_deposit", "10", NOON),
+        ("extra_deposit", "5", NOON + timedelta(hours=11)),
+        ("withdrawal", "3", NOON),
+        ("fee_payment", "0.5", NOON),
+        ("monthly_deposit", "99", NOON + timedelta(days=1)),
+    ], start=1):
+        session.add(FundTransaction(
+            id=i, fund_id=1, fund_address="0xf1", transaction_type=kind, amount=Decimal(amount),
+            balance_after=0, transaction_hash=f"0x{i}", block_number=i, block_timestamp=at,
+        ))
+    session.commit()
+    return session
+
+
+def test_system_totals_in_one_statement(db):
+    totals = analytics_service.get_system_totals(db, now=NOON)
+    assert totals["total_holders"] == 2 and totals["active_holders"] == 1
+    assert totals["total_funds"] == 2 and totals["active_funds"] == 1
+    assert totals["funds_in_retirement"] == 1
+    assert totals["total_tvl"] == Decimal("150")
+    assert totals["total_proposals"] == 2
+    assert totals["open_proposals"] == 1 and totals["active_proposals"] == 1
+    assert totals["total_votes"] == 2
+
+
+def test_daily_flows_only_count_that_day(db):
+    flows = analytics_service.get_daily_flows(db, DAY)
+    assert flows["total_deposits_today"] == Decimal("15")
+    assert flows["total_withdrawals_today"] == Decimal("3")
+    assert flows["total_fees_today"] == Decimal("0.5")
+    assert flows["votes_cast_today"] == 1
+
+
+def test_system_metrics_shape(db):
+    metrics = analytics_service.get_system_metrics(db)
+    assert metrics["funds"] == {"total": 2, "active": 1, "in_retirement": 1}
+    assert metrics["governance"]["total_votes"] == 2
+
+
+def test_snapshot_after_midnight_covers_the_day_that_ended(db, monkeypatch):
+    class AfterMidnight(datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return datetime(2026, 3, 11, 0, 5, tzinfo=timezone.utc)
+
+    monkeypatch.setattr(analytics_module, "datetime", AfterMidnight)
+    snapshot = analytics_service.create_snapshot(db)
+    assert snapshot.snapshot_date == DAY
+    assert snapshot.total_deposits_today == Decimal("15")
+    assert snapshot.votes_cast_today == 1
+
+
+def test_daily_flows_on_postgres(pg_db):
+    user = User(wallet_address="0x" + "1" * 40)
+    pg_db.add(user)
+    pg_db.flush()
+    fund = PersonalFund(user_id=user.id, fund_address="0x" + "f" * 40,
+                        owner_address=user.wallet_address, name="f",
+                        timelock_end=NOON.replace(tzinfo=timezone.utc) + timedelta(days=365),
+                        creation_tx_hash="0xc", creation_block_number=1)
+    pg_db.add(fund)
+    pg_db.flush()
+    noon = NOON.replace(tzinfo=timezone.utc)
+    for i, (kind, amount, at) in enumerate([
+        ("monthly_deposit", "10", noon),
+        ("withdrawal", "3", noon),
+        ("fee_payment", "0.5", noon),
+        ("monthly_deposit", "99", noon + timedelta(days=1)),
+    ], start=1):
+        pg_db.add(FundTransaction(
+            fund_id=fund.id, fund_address=fund.fund_address, transaction_type=kind,
+            amount=Decimal(amount), balance_after=0, transaction_hash=f"0x{i}",
+            block_number=i, block_timestamp=at,
+        ))
+    pg_db.flush()
+
+    flows = analytics_service.get_daily_flows(pg_db, DAY)
+    assert flows["total_deposits_today"] == Decimal("10")
+    assert flows["total_withdrawals_today"] == Decimal("3")
+    assert flows["total_fees_today"] == Decimal("0.5")
@@ -0,0 +1,8 @@
+from app.blockchain.backfill import BackfillEngine
+
+
+def test_shards_align_to_fixed_multiples():
+    engine = BackfillEngine(shard_size=100, concurrency=1)
+    assert engine.plan_shards(150, 420) == [(100, 199), (200, 299), (300, 399), (400, 499)]
+    # A later run with a moving head maps onto the same rows.
+    assert engine.plan_shards(430, 460) == [(400, 499)]
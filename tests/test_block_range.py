@@ -0,0 +1,39 @@
+from app.blockchain.block_range import AdaptiveBlockRange
+
+
+def test_window_grows_when_responses_are_small_and_fast():
+    block_range = AdaptiveBlockRange(initial_size=100, max_size=1000)
+    block_range.record_success(log_count=10, elapsed=0.1)
+    assert block_range.size == 200
+
+
+def test_window_never_exceeds_ceiling():
+    block_range = AdaptiveBlockRange(initial_size=800, max_size=1000)
+    block_range.record_success(log_count=0, elapsed=0.1)
+    block_range.record_success(log_count=0, elapsed=0.1)
+    assert block_range.size == 1000
+
+
+def test_window_halves_on_too_many_results():
+    block_range = AdaptiveBlockRange(initial_size=400, max_size=1000)
+    error = ValueError("query returned more than 10000 results")
+    assert block_range.record_failure(error) is True
+    assert block_range.size == 200
+
+
+def test_unrelated_errors_do_not_shrink_window():
+    block_range = AdaptiveBlockRange(initial_size=400, max_size=1000)
+    assert block_range.record_failure(ValueError("execution reverted")) is False
+    assert block_range.size == 400
+
+
+def test_next_window_is_clamped_to_head():
+    block_range = AdaptiveBlockRange(initial_size=100, max_size=1000)
+    assert block_range.next_window(1, 1000) == 100
+    assert block_range.next_window(950, 1000) == 1000
+
+
+def test_tight_polling_while_far_behind_head():
+    block_range = AdaptiveBlockRange(initial_size=100, max_size=1000)
+    assert block_range.poll_delay(5000, 12) == block_range.catch_up_interval
+    assert block_range.poll_delay(10, 12) == 12
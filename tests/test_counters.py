@@ -0,0 +1,118 @@
+import threading
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import Column, Integer, String, delete, func, select
+from sqlalchemy.orm import Session, declarative_base
+
+from app.models.analytics import StatCounter
+from app.models.user import User
+from app.services.counter_service import CounterService, counter_service
+
+
+WidgetBase = declarative_base()
+
+
+class Widget(WidgetBase):
+    __tablename__ = "counter_test_widgets"
+    id = Column(Integer, primary_key=True)
+    color = Column(String(10), nullable=False)
+
+
+@pytest.fixture
+def db(make_db):
+    session = make_db(StatCounter, Widget)
+    session.add_all([Widget(color="red"), Widget(color="red"), Widget(color="blue")])
+    session.commit()
+    return session
+
+
+def count_widgets(db):
+    values = {"total": db.execute(select(func.count()).select_from(Widget)).scalar()}
+    for color, count in db.execute(select(Widget.color, func.count()).group_by(Widget.color)):
+        values[f"color.{color}"] = count
+    return values
+
+
+@pytest.fixture
+def counters():
+    return CounterService({"widgets": count_widgets})
+
+
+def test_first_read_seeds_from_source(db, counters):
+    assert counters.read(db, "widgets") == {
+        "total": Decimal(3), "color.blue": Decimal(1), "color.red": Decimal(2)
+    }
+
+
+def test_writes_apply_deltas(db, counters):
+    counters.read(db, "widgets")
+    db.add(Widget(color="green"))
+    counters.add(db, "widgets", {"total": 1, "color.green": 1})
+    counters.track(db, "widgets", {"color.red": 1}, {"color.blue": 1})
+    db.commit()
+    values = counters.read(db, "widgets")
+    assert values["total"] == 4 and values["color.green"] == 1
+    assert values["color.red"] == 1 and values["color.blue"] == 2
+
+
+def test_reconcile_corrects_drift(db, counters):
+    counters.read(db, "widgets")
+    db.query(Widget).filter(Widget.color == "blue").delete()
+    counters.add(db, "widgets", {"total": 5})
+    db.commit()
+
+    drift = counters.reconcile(db)
+    assert drift == {"widgets": {"total": Decimal(-6), "color.blue": Decimal(-1)}}
+    assert counters.read(db, "widgets") == {
+        "total": Decimal(2), "color.blue": Decimal(0), "color.red": Decimal(2)
+    }
+    assert counters.reconcile(db) == {}
+
+
+def test_unregistered_namespace_fails_clearly(db, counters):
+    with pytest.raises(ValueError, match="gadgets"):
+        counters.read(db, "gadgets")
+    with pytest.raises(ValueError, match="gadgets"):
+        counters.add(db, "gadgets", {"total": 1})
+
+
+@pytest.fixture
+def pg_users(pg_engine):
+    """Real sessions on the migrated schema; users and counters are wiped after."""
+    yield pg_engine
+    with Session(pg_engine) as db:
+        db.execute(delete(StatCounter))
+        db.execute(delete(User))
+        db.commit()
+
+
+def test_seeding_does_not_commit_the_callers_transaction(pg_users):
+    with Session(pg_users) as db:
+        db.add(User(wallet_address="0x1"))
+        db.flush()
+        assert counter_service.read(db, "users")["total"] == 0
+        db.rollback()
+        assert db.query(User).count() == 0
+
+
+def test_reconcile_waits_for_in_flight_writers(pg_users):
+    writer = Session(pg_users)
+    writer.add(User(wallet_address="0x1"))
+    writer.flush()
+    counter_service.add(writer, "users", {"total": 1})
+
+    def reconcile():
+        with Session(pg_users) as db:
+            counter_service.reconcile(db, ["users"])
+
+    thread = threading.Thread(target=reconcile)
+    thread.start()
+    thread.join(0.5)
+    assert thread.is_alive()
+    writer.commit()
+    writer.close()
+    thread.join(10)
+
+    with Session(pg_users) as db:
+        assert counter_service.read(db, "users")["total"] == 1
@@ -0,0 +1,58 @@
+from eth_abi import encode
+from hexbytes import HexBytes
+from web3 import Web3
+
+from app.blockchain.contract_manager import contract_manager
+from app.blockchain.event_decoder import EventDecoder
+
+TOKEN = "0xA2741AacdBb3135C7cCc492F1F8b3ddE00998af5"
+SENDER = "0x1111111111111111111111111111111111111111"
+RECEIVER = "0x2222222222222222222222222222222222222222"
+
+
+def _transfer_abi():
+    return next(item for item in contract_manager.abis["token"] if item["name"] == "Transfer")
+
+
+def _transfer_log(decoder):
+    return {
+        "address": TOKEN,
+        "topics": [
+            HexBytes(decoder.topic),
+            HexBytes(encode(["address"], [SENDER])),
+            HexBytes(encode(["address"], [RECEIVER])),
+        ],
+        "data": HexBytes(encode(["uint256"], [10 ** 18])),
+        "logIndex": 3,
+        "transactionIndex": 1,
+        "transactionHash": HexBytes("0x" + "ab" * 32),
+        "blockHash": HexBytes("0x" + "cd" * 32),
+        "blockNumber": 123,
+    }
+
+
+def test_decoder_matches_web3_process_log():
+    decoder = EventDecoder(_transfer_abi())
+    log = _transfer_log(decoder)
+    contract = Web3().eth.contract(address=TOKEN, abi=[_transfer_abi()])
+
+    expected = contract.events.Transfer().process_log(log)
+    decoded = decoder.decode(log)
+
+    assert decoded["event"] == expected["event"]
+    assert dict(decoded["args"]) == dict(expected["args"])
+    assert decoded["transactionHash"] == expected["transactionHash"]
+    assert decoded["address"] == Web3.to_checksum_address(TOKEN)
+
+
+def test_topic_index_is_built_at_abi_load():
+    decoder = EventDecoder(_transfer_abi())
+    assert contract_manager.decoders["token"][decoder.topic].name == "Transfer"
+
+
+def test_parse_event_log_uses_index():
+    decoder = EventDecoder(_transfer_abi())
+    parsed = contract_manager.parse_event_log("token", _transfer_log(decoder))
+    assert parsed["event_name"] == "Transfer"
+    assert parsed["args"]["value"] == 10 ** 18
+    assert parsed["transaction_hash"] == "0x" + "ab" * 32
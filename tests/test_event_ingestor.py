@@ -0,0 +1,103 @@
+from unittest.mock import MagicMock
+
+import pytest
+from eth_abi import encode
+from hexbytes import HexBytes
+from web3 import Web3
+
+from app.blockchain.contract_manager import contract_manager, FUND_CLONE_ABI
+from app.blockchain.event_ingestor import EventBuildError, EventIngestor
+from app.blockchain.web3_client import web3_client
+from app.services.blockchain_service import blockchain_service
+
+CLONE = Web3.to_checksum_address("0x" + "c" * 40)
+OWNER = Web3.to_checksum_address("0x" + "1" * 40)
+
+
+def make_log(block_number, log_index=0):
+    return {
+        "event": "Transfer",
+        "address": "0x" + "1" * 40,
+        "args": {"value": 1},
+        "transactionHash": HexBytes("0x" + "a" * 64),
+        "blockNumber": block_number,
+        "logIndex": log_index,
+    }
+
+
+def test_unbuildable_log_fails_the_whole_window(monkeypatch):
+    sessions = []
+    ingestor = EventIngestor(session_factory=lambda: sessions.append(1))
+    monkeypatch.setattr(web3_client, "prefetch_blocks", lambda numbers: list(numbers))
+    monkeypatch.setattr(
+        web3_client, "get_block",
+        lambda number, use_cache=True: {"timestamp": 0} if number == 1 else None
+    )
+
+    with pytest.raises(EventBuildError, match="1 of 2 logs"):
+        ingestor.ingest([make_log(1), make_log(2)], synced_to=2)
+    # Nothing was written and the cursor was not moved.
+    assert sessions == []
+
+
+def test_disconnected_client_does_not_return_an_empty_window(monkeypatch):
+    monkeypatch.setattr(web3_client, "is_connected", lambda: False)
+    with pytest.raises(ConnectionError):
+        web3_client.get_logs(1, 10, ["0x" + "1" * 40], [])
+
+
+def _topic(contract_name, event_name):
+    return next(
+        topic for topic, decoder in contract_manager.decoders[contract_name].items()
+        if decoder.name == event_name
+    )
+
+
+def _raw_log(address, topics, data, block_number):
+    return {
+        "address": address,
+        "topics": [HexBytes(t) for t in topics],
+        "data": HexBytes(data),
+        "logIndex": 0,
+        "transactionIndex": 0,
+        "transactionHash": HexBytes("0x" + "%064x" % block_number),
+        "blockHash": HexBytes("0x" + "cd" * 32),
+        "blockNumber": block_number,
+    }
+
+
+def test_new_fund_clone_is_watched_and_caught_up(monkeypatch):
+    monkeypatch.setattr(contract_manager, "_clones", {})
+    monkeypatch.setattr(contract_manager, "_log_routes", None)
+    monkeypatch.setattr(blockchain_service, "get_fund_clone_addresses", lambda db: [])
+    factory = web3_client.get_contract_address("factory")
+    fund_created = _raw_log(
+        factory,
+        [_topic("factory", "FundCreated"), encode(["address"], [CLONE]), encode(["address"], [OWNER])],
+        encode(["uint256", "uint256"], [100, 0]),
+        5,
+    )
+    deposited = _raw_log(
+        CLONE,
+        [_topic(FUND_CLONE_ABI, "Deposited"), encode(["address"], [OWNER])],
+        encode(["uint256", "uint256", "uint256"], [100, 3, 97]),
+        40,
+    )
+    calls = []
+
+    def get_logs(from_block, to_block, address, topics):
+        calls.append((from_block, to_block, address))
+        return [deposited] if CLONE in address else [fund_created]
+
+    monkeypatch.setattr(web3_client, "get_logs", get_logs)
+    ingestor = EventIngestor(session_factory=MagicMock)
+
+    decoded = ingestor.fetch_window(1, 10, clones_until=50)
+
+    assert [e["event"] for e in decoded] == ["FundCreated", "Deposited"]
+    assert decoded[1]["args"]["grossAmount"] == 100
+    # The window filter did not know the clone; the catch-up starts at its creation.
+    assert CLONE not in calls[0][2]
+    assert calls[1][:2] == (5, 50)
+    assert CLONE in contract_manager.get_log_filter_params()["address"]
+    assert CLONE not in contract_manager.get_log_filter_params(include_clones=False)["address"]
@@ -0,0 +1,53 @@
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+import pytest
+
+from app.core.config import settings
+from app.models.blockchain import BlockchainEvent, BlockchainEventKey
+from app.schemas.blockchain import BlockchainEventCreate
+from app.services.blockchain_service import ArchivedRangeError, blockchain_service
+
+TX = "0x" + "a" * 64
+
+
+@pytest.fixture
+def db(make_db):
+    return make_db(BlockchainEventKey)
+
+
+def log(block_number, log_index=0):
+    return SimpleNamespace(transaction_hash=TX, log_index=log_index, block_number=block_number)
+
+
+def test_log_reincluded_at_another_height_is_not_new(db):
+    assert blockchain_service._claim_keys(db, [log(100), log(100, 1)]) == {(TX, 0), (TX, 1)}
+    # Same tx and log index after a reorg moved it to block 101.
+    assert blockchain_service._claim_keys(db, [log(101)]) == set()
+    assert db.query(BlockchainEventKey).filter_by(log_index=0).one().block_number == 100
+
+
+def test_sync_below_oldest_partition_is_rejected(monkeypatch):
+    monkeypatch.setattr(
+        blockchain_service, "get_event_partitions",
+        lambda db: [{"name": "blockchain_events_p1000", "from_block": 1000, "to_block": 2000}]
+    )
+    with pytest.raises(ArchivedRangeError, match="below 1000"):
+        blockchain_service.ensure_event_partitions(None, 1500, 1000, from_block=900)
+
+
+def test_reincluded_log_is_stored_once_across_partitions(pg_db):
+    size = settings.BLOCKCHAIN_EVENTS_PARTITION_BLOCKS
+    blockchain_service.ensure_event_partitions(pg_db, 2 * size, size)
+
+    def event(block_number):
+        return BlockchainEventCreate(
+            event_type="Transfer", contract_address="0x" + "1" * 40, event_data={"value": 1},
+            transaction_hash=TX, block_number=block_number,
+            block_timestamp=datetime(2026, 1, 1, tzinfo=timezone.utc), log_index=0,
+        )
+
+    assert blockchain_service.record_events_bulk(pg_db, [event(100)])["inserted"] == 1
+    # Re-included one partition higher: uq_tx_log alone would accept it.
+    assert blockchain_service.record_events_bulk(pg_db, [event(size + 100)])["skipped"] == 1
+    assert pg_db.query(BlockchainEvent).filter_by(transaction_hash=TX).count() == 1
@@ -0,0 +1,45 @@
+from app.blockchain.event_processor import EventProcessor
+from app.models.blockchain import BlockchainEvent
+from app.services.blockchain_service import blockchain_service
+
+
+class FakeSavepoint:
+    def commit(self):
+        pass
+
+    def rollback(self):
+        pass
+
+
+class FakeSession:
+    def begin_nested(self):
+        return FakeSavepoint()
+
+    def commit(self):
+        pass
+
+
+def make_event(id, event_type="VoteCast"):
+    return BlockchainEvent(id=id, event_type=event_type, event_data={}, block_number=id, log_index=0)
+
+
+def test_deferred_events_back_off_instead_of_being_processed(monkeypatch):
+    events = [make_event(1), make_event(2), make_event(3, "Unhandled")]
+    failures, processed = [], []
+    monkeypatch.setattr(blockchain_service, "claim_unprocessed", lambda db, limit: events)
+    monkeypatch.setattr(
+        blockchain_service, "record_failure",
+        lambda db, event, error, *args: failures.append((event.id, error)) or False
+    )
+    monkeypatch.setattr(blockchain_service, "mark_processed_bulk", lambda db, ids: processed.extend(ids))
+
+    processor = EventProcessor()
+
+    @processor.register("VoteCast")
+    def handler(db, batch):
+        return [(event, "proposal not projected yet") for event in batch if event.id == 2]
+
+    result = processor.process_batch(FakeSession())
+    assert processed == [1, 3]
+    assert failures == [(2, "proposal not projected yet")]
+    assert result["deferred"] == 1 and result["processed"] == 2
@@ -0,0 +1,59 @@
+from datetime import datetime, timedelta, timezone
+
+from app.models.blockchain import BlockchainEvent, BlockchainDeadLetter
+from app.services.blockchain_service import blockchain_service
+
+
+class FakeSession:
+    def __init__(self):
+        self.added = []
+        self.deleted = []
+
+    def add(self, obj):
+        self.added.append(obj)
+
+    def delete(self, obj):
+        self.deleted.append(obj)
+
+
+def make_event(attempts=0):
+    return BlockchainEvent(
+        id=7,
+        event_type="Transfer",
+        contract_address="0x" + "1" * 40,
+        event_data={},
+        transaction_hash="0x" + "a" * 64,
+        block_number=100,
+        block_timestamp=datetime(2026, 1, 1),
+        log_index=0,
+        attempts=attempts,
+    )
+
+
+def test_failed_event_backs_off_exponentially():
+    db = FakeSession()
+    event = make_event(attempts=2)
+    before = datetime.now(timezone.utc)
+    assert blockchain_service.record_failure(db, event, "boom", 5, 60, 3600) is False
+    assert event.attempts == 3
+    assert event.last_error == "boom"
+    assert event.next_attempt_at - before >= timedelta(seconds=240)
+    assert not db.added and not db.deleted
+
+
+def test_backoff_is_capped():
+    event = make_event(attempts=8)
+    before = datetime.now(timezone.utc)
+    blockchain_service.record_failure(FakeSession(), event, "boom", 100, 60, 600)
+    assert event.next_attempt_at - before <= timedelta(seconds=601)
+
+
+def test_event_is_dead_lettered_after_max_attempts():
+    db = FakeSession()
+    event = make_event(attempts=4)
+    assert blockchain_service.record_failure(db, event, "boom", 5, 60, 3600) is True
+    # Kept as a tombstone, so a re-scan of its block does not insert it again.
+    assert db.deleted == [] and event.dead_lettered is True
+    (letter,) = db.added
+    assert isinstance(letter, BlockchainDeadLetter)
+    assert letter.event_id == 7 and letter.attempts == 5
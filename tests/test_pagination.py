@@ -0,0 +1,78 @@
+from datetime import datetime, timedelta
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from pydantic import BaseModel
+from sqlalchemy import Column, DateTime, Integer
+from sqlalchemy.orm import declarative_base
+
+from app.core.exceptions import ValidationException
+from app.core.pagination import Page, decode_cursor, encode_cursor, paginate
+
+Base = declarative_base()
+
+
+class Row(Base):
+    __tablename__ = "pagination_rows"
+    id = Column(Integer, primary_key=True)
+    created_at = Column(DateTime, nullable=False)
+
+
+class RowResponse(BaseModel):
+    id: int
+    created_at: datetime
+
+    class Config:
+        from_attributes = True
+
+
+@pytest.fixture
+def db(make_db):
+    session = make_db(Row)
+    start = datetime(2026, 1, 1)
+    # Pairs of rows share a timestamp, so the id tiebreak matters.
+    session.add_all(Row(id=i, created_at=start + timedelta(minutes=i // 2)) for i in range(1, 12))
+    session.commit()
+    return session
+
+
+def test_cursor_round_trip():
+    cursor = encode_cursor([datetime(2026, 1, 1, 12), 42])
+    assert decode_cursor(cursor, [Row.created_at, Row.id]) == [datetime(2026, 1, 1, 12), 42]
+
+
+def test_invalid_cursor_is_rejected():
+    with pytest.raises(ValidationException):
+        decode_cursor("not-a-cursor", [Row.created_at, Row.id])
+
+
+def test_pages_cover_every_row_once(db):
+    columns = [Row.created_at, Row.id]
+    seen, cursor = [], None
+    while True:
+        page = paginate(db.query(Row), columns, cursor, limit=4)
+        seen.extend(row.id for row in page.items)
+        cursor = page.next_cursor
+        if not cursor:
+            break
+    assert seen == list(range(11, 0, -1))
+
+
+def test_limit_is_capped_at_max_page_size(db, monkeypatch):
+    from app.core.config import settings
+    monkeypatch.setattr(settings, "MAX_PAGE_SIZE", 3)
+    page = paginate(db.query(Row), [Row.id], limit=1000)
+    assert len(page.items) == 3 and page.next_cursor
+
+
+def test_page_serializes_orm_items(db):
+    app = FastAPI()
+
+    @app.get("/rows", response_model=Page[RowResponse])
+    def rows():
+        return paginate(db.query(Row), [Row.id], limit=2)
+
+    body = TestClient(app).get("/rows").json()
+    assert [item["id"] for item in body["items"]] == [11, 10]
+    assert body["next_cursor"]
@@ -0,0 +1,122 @@
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+
+import pytest
+
+from app.blockchain.projections import (
+    project_deposited, project_fund_created, project_token_transfer, project_tokens_burned,
+)
+from app.models.blockchain import BlockchainEvent
+from app.models.personal_fund import FundTransaction, PersonalFund
+from app.models.token import TokenActivity, TokenHolder
+from app.models.user import User
+
+FUND = "0x" + "f" * 40
+BLOCK_TIME = datetime(2026, 3, 10, 12)
+
+
+@pytest.fixture
+def db(make_db):
+    session = make_db(PersonalFund, FundTransaction)
+    session.add(PersonalFund(id=1, user_id=1, fund_address=FUND, owner_address="0x1", name="a",
+                             total_balance=Decimal("100"), available_balance=Decimal("100"),
+                             total_deposited=Decimal("100"), total_fees_paid=0))
+    session.commit()
+    return session
+
+
+def deposited(contract_address=FUND, log_index=0):
+    return BlockchainEvent(
+        id=log_index + 1, event_type="Deposited", contract_address=contract_address,
+        event_data={"owner": "0x1", "grossAmount": 50_000_000, "feeAmount": 1_000_000,
+                    "netToFund": 49_000_000},
+        transaction_hash="0x" + "d" * 64, block_number=10, block_timestamp=BLOCK_TIME,
+        log_index=log_index,
+    )
+
+
+def test_deposit_replay_is_counted_once(db):
+    assert project_deposited(db, [deposited()]) == []
+    assert project_deposited(db, [deposited()]) == []
+    db.commit()
+
+    fund = db.query(PersonalFund).one()
+    assert fund.total_deposited == Decimal("150")
+    assert fund.total_fees_paid == Decimal("1")
+    assert fund.total_balance == Decimal("149")
+    kinds = sorted(t.transaction_type for t in db.query(FundTransaction))
+    assert kinds == ["fee_payment", "monthly_deposit"]
+
+
+def test_deposit_on_unknown_fund_is_deferred(db):
+    event = deposited(contract_address="0x" + "e" * 40)
+    assert [e for e, _ in project_deposited(db, [event])] == [event]
+
+
+def test_deposit_rows_fit_the_migrated_constraints(pg_db):
+    # Both rows of a Deposited share (tx hash, fund address).
+    user = User(wallet_address="0x1")
+    pg_db.add(user)
+    pg_db.flush()
+    pg_db.add(PersonalFund(user_id=user.id, fund_address=FUND, owner_address="0x1", name="a",
+                           timelock_end=BLOCK_TIME.replace(tzinfo=timezone.utc) + timedelta(days=365),
+                           creation_tx_hash="0xc", creation_block_number=1))
+    pg_db.flush()
+    event = deposited()
+    event.block_timestamp = BLOCK_TIME.replace(tzinfo=timezone.utc)
+
+    assert project_deposited(pg_db, [event]) == []
+    assert project_deposited(pg_db, [event]) == []
+    pg_db.flush()
+
+    fund = pg_db.query(PersonalFund).one()
+    pg_db.refresh(fund)
+    assert fund.total_deposited == Decimal("50")
+    assert fund.total_fees_paid == Decimal("1")
+    assert pg_db.query(FundTransaction).count() == 2
+
+
+def test_token_activities_are_keyed_by_log(pg_db):
+    user = User(wallet_address="0x1")
+    pg_db.add(user)
+    pg_db.flush()
+    tx, at = "0x" + "b" * 64, BLOCK_TIME.replace(tzinfo=timezone.utc)
+    pg_db.add(TokenHolder(user_id=user.id, wallet_address="0x1", holder_since=at))
+    pg_db.flush()
+    transfer = BlockchainEvent(
+        event_type="Transfer", contract_address="0x2", transaction_hash=tx, log_index=0,
+        event_data={"sender": "0x3", "receiver": "0x1", "value": 10 ** 18},
+        block_number=10, block_timestamp=at,
+    )
+    burn = BlockchainEvent(
+        event_type="TokensBurned", contract_address="0x2", transaction_hash=tx, log_index=1,
+        event_data={"account": "0x1", "amount": 10 ** 18, "totalBurns": 1},
+        block_number=10, block_timestamp=at,
+    )
+
+    for _ in range(2):
+        project_token_transfer(pg_db, [transfer])
+        project_tokens_burned(pg_db, [burn])
+    pg_db.flush()
+
+    kinds = sorted(a.activity_type for a in pg_db.query(TokenActivity))
+    assert kinds == ["burn", "transfer"]
+
+
+def test_fund_created_projects_without_a_timelock(pg_db):
+    # FundCreated carries no timelock; the fund learns it later.
+    user = User(wallet_address="0x1")
+    pg_db.add(user)
+    pg_db.flush()
+    event = BlockchainEvent(
+        event_type="FundCreated", contract_address="0x2", transaction_hash="0x" + "c" * 64,
+        log_index=0, event_data={"owner": "0x1", "fundAddress": FUND, "initialDeposit": 0},
+        block_number=10, block_timestamp=BLOCK_TIME.replace(tzinfo=timezone.utc),
+    )
+
+    assert project_fund_created(pg_db, [event]) == []
+    pg_db.flush()
+
+    fund = pg_db.query(PersonalFund).one()
+    assert fund.timelock_end is None
+    assert fund.creation_block_number == 10
@@ -0,0 +1,170 @@
+import asyncio
+
+import pytest
+
+from app.core.cache import LocalCache, ResponseCache
+from app.core.config import settings
+from app.core.rate_limiter import rate_limiter
+
+
+class FakePipeline:
+    def __init__(self, redis):
+        self.redis = redis
+        self.ops = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: self.ops.append((name, args, kwargs))
+
+    async def execute(self):
+        for name, args, kwargs in self.ops:
+            await getattr(self.redis, name)(*args, **kwargs)
+
+
+class FakeRedis:
+    """The handful of redis.asyncio commands ResponseCache uses."""
+
+    def __init__(self):
+        self.data = {}
+        self.reads = 0
+        self.published = []
+
+    async def get(self, key):
+        self.reads += 1
+        return self.data.get(key)
+
+    async def set(self, key, value, nx=False, ex=None, px=None):
+        if nx and key in self.data:
+            return None
+        self.data[key] = value
+        return True
+
+    async def sadd(self, key, *members):
+        self.data.setdefault(key, set()).update(members)
+
+    async def expire(self, key, seconds):
+        return True
+
+    async def smembers(self, key):
+        return set(self.data.get(key, set()))
+
+    async def delete(self, *keys):
+        for key in keys:
+            self.data.pop(key, None)
+
+    async def publish(self, channel, message):
+        self.published.append((channel, message))
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+
+@pytest.fixture
+def cache(monkeypatch):
+    monkeypatch.setattr(settings, "CACHE_ENABLED", True)
+    monkeypatch.setattr(rate_limiter, "redis_client", FakeRedis())
+    return ResponseCache()
+
+
+def test_concurrent_misses_compute_once(cache):
+    calls = []
+
+    @cache.cached("tokens", ttl=60)
+    async def stats(limit: int = 10):
+        calls.append(limit)
+        await asyncio.sleep(0.01)
+        return {"limit": limit}
+
+    async def run():
+        return await asyncio.gather(*(stats(limit=5) for _ in range(5)))
+
+    assert asyncio.run(run()) == [{"limit": 5}] * 5
+    assert calls == [5]
+    assert asyncio.run(stats(limit=5)) == {"limit": 5}
+    assert calls == [5] and cache.hits == 1
+
+
+def test_invalidate_drops_namespace(cache):
+    calls = []
+
+    @cache.cached("governance")
+    async def stats():
+        calls.append(1)
+        return {"n": len(calls)}
+
+    async def run():
+        first = await stats()
+        await cache.invalidate_async("governance")
+        return first, await stats()
+
+    assert asyncio.run(run()) == ({"n": 1}, {"n": 2})
+
+
+def test_disabled_cache_calls_through(cache, monkeypatch):
+    monkeypatch.setattr(settings, "CACHE_ENABLED", False)
+    calls = []
+
+    @cache.cached("tokens")
+    async def stats():
+        calls.append(1)
+        return {}
+
+    asyncio.run(stats())
+    asyncio.run(stats())
+    assert len(calls) == 2
+
+
+def test_l1_hit_skips_redis(cache):
+    calls = []
+
+    @cache.cached("tokens", ttl=60, l1_ttl=30)
+    async def burn_info():
+        calls.append(1)
+        return {"days": 3}
+
+    async def run():
+        await burn_info()
+        reads = cache.client.reads
+        assert await burn_info() == {"days": 3}
+        return reads
+
+    reads = asyncio.run(run())
+    assert calls == [1]
+    assert cache.client.reads == reads
+    assert cache.local.hits == 1
+
+
+def test_invalidation_clears_l1_and_broadcasts(cache):
+    calls = []
+
+    @cache.cached("tokens", l1_ttl=30)
+    async def burn_info():
+        calls.append(1)
+        return {"n": len(calls)}
+
+    async def run():
+        await burn_info()
+        await cache.invalidate_async("tokens")
+        return await burn_info()
+
+    assert asyncio.run(run()) == {"n": 2}
+    assert cache.client.published == [(cache.channel, "tokens")]
+
+
+def test_local_cache_expires_and_evicts():
+    local = LocalCache(max_items=2)
+    local.set("a", 1, ttl=60)
+    local.set("b", 2, ttl=-1)
+    assert local.stats()["size"] == 2
+    local.get("b")
+    assert local.misses == 1 and local.stats()["size"] == 1
+    local.set("c", 3, ttl=60)
+    local.set("d", 4, ttl=60)
+    assert local.stats()["size"] == 2
+    assert local.get("d") == 4 and local.get("c") == 3
+    assert local.hits == 2
@@ -0,0 +1,46 @@
+import pytest
+import requests
+
+from app.blockchain.rpc_pool import RPCPool
+
+
+def test_throttled_endpoint_fails_over_and_cools_down():
+    pool = RPCPool(["http://primary.test", "http://fallback.test"])
+    primary, fallback = pool.endpoints
+
+    def call(w3):
+        if w3 is primary.w3:
+            raise ValueError("429 Too Many Requests")
+        return "ok"
+
+    assert pool.call(call) == "ok"
+    assert not primary.available
+    assert pool.primary() is fallback
+
+
+def test_request_errors_are_not_failed_over():
+    pool = RPCPool(["http://primary.test", "http://fallback.test"])
+    seen = []
+
+    def call(w3):
+        seen.append(w3)
+        raise ValueError("query returned more than 10000 results")
+
+    with pytest.raises(ValueError):
+        pool.call(call)
+    assert len(seen) == 1
+    assert pool.endpoints[0].failures == 0
+
+
+def test_slow_or_failing_endpoint_ranks_lower():
+    pool = RPCPool(["http://primary.test", "http://fallback.test"])
+    primary, fallback = pool.endpoints
+
+    def call(w3):
+        if w3 is primary.w3:
+            raise requests.ConnectionError("connection refused")
+        return "ok"
+
+    pool.call(call)
+    assert primary.available
+    assert pool.primary() is fallback
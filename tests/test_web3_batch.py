@@ -0,0 +1,59 @@
+import time
+
+import pytest
+
+from app.blockchain.rpc_pool import RPCPool
+from app.blockchain.web3_client import web3_client, RPCItemError
+
+
+class FakeBatchProvider:
+    def __init__(self, responses):
+        self.responses = responses
+        self.calls = []
+
+    def make_batch_request(self, calls):
+        self.calls.append(list(calls))
+        return [self.responses[params[0]] for _, params in calls]
+
+
+@pytest.fixture
+def batch_client(monkeypatch):
+    def install(responses):
+        provider = FakeBatchProvider(responses)
+        pool = RPCPool(["http://rpc.test"])
+        monkeypatch.setattr(pool.endpoints[0].w3, "provider", provider)
+        monkeypatch.setattr(web3_client, "rpc_pool", pool)
+        monkeypatch.setattr(web3_client, "_connected", True)
+        monkeypatch.setattr(web3_client, "_connection_checked_at", time.monotonic())
+        return provider
+    return install
+
+
+def test_batch_keeps_order_and_reports_per_item_errors(batch_client):
+    provider = batch_client({
+        "0xa": {"jsonrpc": "2.0", "id": 0, "result": {"hash": "0x" + "11" * 32, "blockNumber": "0x10"}},
+        "0xb": {"jsonrpc": "2.0", "id": 1, "result": None},
+        "0xc": {"jsonrpc": "2.0", "id": 2, "error": {"code": -32000, "message": "boom"}},
+    })
+
+    results = web3_client.batch_request(
+        [("eth_getTransactionByHash", [h]) for h in ("0xa", "0xb", "0xc")]
+    )
+
+    assert len(provider.calls) == 1
+    assert results[0]["blockNumber"] == 16
+    assert isinstance(results[1], RPCItemError) and results[1].message == "not found"
+    assert isinstance(results[2], RPCItemError) and results[2].code == -32000
+
+
+def test_batch_splits_into_chunks(batch_client):
+    provider = batch_client({
+        hex(n): {"jsonrpc": "2.0", "id": n, "result": {"number": hex(n)}} for n in range(5)
+    })
+
+    results = web3_client.batch_request(
+        [("eth_getBlockByNumber", [hex(n), False]) for n in range(5)], chunk_size=2
+    )
+
+    assert [len(chunk) for chunk in provider.calls] == [2, 2, 1]
+    assert [r["number"] for r in results] == list(range(5))